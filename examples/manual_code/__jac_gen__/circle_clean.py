@@ -0,0 +1,63 @@
+"""
+This module demonstrates a simple circle class and a function to calculate
+the area of a circle in all of Jac's glory.
+"""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+import abc as _jac_abc
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    from circle_clean_impl import *
+else:
+    _jac_inc_circle_clean_impl, = __jac_import__(target='circle_clean_impl', base_path=__file__, lng='jac', absorb=True, mdl_alias=None, items={})
+    for i in _jac_inc_circle_clean_impl.__all__ if '__all__' in _jac_inc_circle_clean_impl.__dict__ else _jac_inc_circle_clean_impl.__dict__:
+        if not i.startswith('_'):
+            exec(f"{i}=_jac_inc_circle_clean_impl.__dict__['{i}']")
+
+class ShapeType(__jac_Enum__):
+    CIRCLE = 'Circle'
+    UNKNOWN = 'Unknown'
+
+@_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_clean_impl.jac')
+def calculate_area(radius: float) -> float:
+    return math.pi * radius * radius
+
+@_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_clean_impl.jac')
+def main_run() -> None:
+    print(f'Area of a circle with radius {RAD} using function: {calculate_area(RAD)}')
+    print(f'Area of a {c.shape_type.value} with radius {RAD} using class: {c.area()}')
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Shape(_Jac.Obj, _jac_abc.ABC):
+    """Base class for a shape."""
+    shape_type: ShapeType
+
+    @_jac_abc.abstractmethod
+    def area(self) -> float:
+        pass
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Circle(Shape, _Jac.Obj):
+    """Circle class inherits from Shape."""
+    radius: float
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_clean_impl.jac')
+    def __init__(self, radius: float) -> None:
+        self.radius = radius
+        super().__init__(ShapeType.CIRCLE)
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_clean_impl.jac')
+    @_jac_typ.override
+    def area(self) -> float:
+        return math.pi * self.radius * self.radius
+RAD = 5
+c = Circle(radius=RAD)
+if __name__ == '__main__':
+    'Here we run the main program.'
+    main_run()
\ No newline at end of file
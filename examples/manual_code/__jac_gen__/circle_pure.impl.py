@@ -0,0 +1,2 @@
+"""Enum for shape types"""
+from __future__ import annotations
\ No newline at end of file
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+import abc as _jac_abc
+from dataclasses import dataclass as __jac_dataclass__
+expected_area = 78.53981633974483
+
+@_Jac.create_test
+@_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_pure.test.jac')
+def test_a1(_jac_check) -> None:
+    _jac_check.assertAlmostEqual(calculate_area(RAD), expected_area)
+
+@_Jac.create_test
+@_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_pure.test.jac')
+def test_a2(_jac_check) -> None:
+    c = Circle(RAD)
+    _jac_check.assertAlmostEqual(c.area(), expected_area)
+
+@_Jac.create_test
+@_Jac.impl_patch_filename(file_loc='/root/package/examples/manual_code/circle_pure.test.jac')
+def test_a3(_jac_check) -> None:
+    c = Circle(RAD)
+    _jac_check.assertEqual(c.shape_type, ShapeType.CIRCLE)
\ No newline at end of file
@@ -0,0 +1,34 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    import random
+else:
+    random, = __jac_import__(target='random', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class TestObj(_Jac.Obj):
+    x: int = _Jac.has_instance_default(gen_func=lambda: random.randint(0, 15))
+    y: int = _Jac.has_instance_default(gen_func=lambda: random.randint(0, 15))
+    z: int = _Jac.has_instance_default(gen_func=lambda: random.randint(0, 15))
+random.seed(42)
+apple = []
+i = 0
+while i < 10:
+    apple.append(TestObj())
+    i += 1
+print((lambda x: [i for i in x if i.y <= 7])(apple))
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyObj(_Jac.Obj):
+    apple: int = _Jac.has_instance_default(gen_func=lambda: 0)
+    banana: int = _Jac.has_instance_default(gen_func=lambda: 0)
+x = MyObj()
+y = MyObj()
+mvar = _Jac.assign_compr([x, y], (('apple', 'banana'), (5, 7)))
+print(mvar)
\ No newline at end of file
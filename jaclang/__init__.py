@@ -1,5 +1,11 @@
 """The Jac Programming Language."""
 
+import os
+import sys
+
+# vendored packages, added here as the runtime does not import jaclang.vendor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "vendor"))
+
 from jaclang.plugin.default import (  # noqa: E402
     JacBuiltin,
     JacCmdDefaults,
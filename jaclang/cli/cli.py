@@ -9,22 +9,18 @@ import shutil
 import types
 from typing import Optional
 
-import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
 from jaclang.cli.cmdreg import CommandShell, cmd_registry
-from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.bundle import JacBundle
+from jaclang.compiler.cache import compile_cache
 from jaclang.compiler.constant import Constants
-from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
-from jaclang.compiler.passes.main.schedules import py_code_gen_typed
-from jaclang.compiler.passes.tool.schedules import format_pass
 from jaclang.plugin.builtin import dotgen
 from jaclang.plugin.feature import JacCmd as Cmd
 from jaclang.plugin.feature import JacFeature as Jac
-from jaclang.runtimelib.constructs import WalkerArchitype
+from jaclang.runtimelib.constructs import NodeAnchor, WalkerArchitype
 from jaclang.runtimelib.context import ExecutionContext
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.utils.helpers import debugger as db
-from jaclang.utils.lang_tools import AstTool
 
 
 Cmd.create_cmd()
@@ -33,6 +29,8 @@ Cmd.create_cmd()
 @cmd_registry.register
 def format(path: str, outfile: str = "", debug: bool = False) -> None:
     """Run the specified .jac file or format all .jac files in a given directory."""
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.tool.schedules import format_pass
 
     def format_file(filename: str) -> None:
         code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
@@ -83,7 +81,7 @@ def run(
 
     base, mod = os.path.split(filename)
     base = base if base else "./"
-    mod = mod[:-4]
+    mod = os.path.splitext(mod)[0]
 
     jctx = ExecutionContext.create(session=session)
 
@@ -105,10 +103,18 @@ def run(
                 cachable=cache,
                 override_name="__main__" if main else None,
             )
+    elif filename.endswith(".jacb"):
+        JacMachine(base).attach_program(JacProgram.from_bundle(filename))
+        jac_import(
+            target=mod,
+            base_path=base,
+            cachable=cache,
+            override_name="__main__" if main else None,
+        )
     else:
         jctx.close()
         JacMachine.detach()
-        raise ValueError("Not a valid file!\nOnly supports `.jac` and `.jir`")
+        raise ValueError("Not a valid file!\nOnly supports `.jac`, `.jir` and `.jacb`")
 
     jctx.close()
     JacMachine.detach()
@@ -130,7 +136,7 @@ def get_object(
 
     base, mod = os.path.split(filename)
     base = base if base else "./"
-    mod = mod[:-4]
+    mod = os.path.splitext(mod)[0]
 
     jctx = ExecutionContext.create(session=session)
 
@@ -152,15 +158,27 @@ def get_object(
                 cachable=cache,
                 override_name="__main__" if main else None,
             )
+    elif filename.endswith(".jacb"):
+        JacMachine(base).attach_program(JacProgram.from_bundle(filename))
+        jac_import(
+            target=mod,
+            base_path=base,
+            cachable=cache,
+            override_name="__main__" if main else None,
+        )
     else:
         jctx.close()
         JacMachine.detach()
-        raise ValueError("Not a valid file!\nOnly supports `.jac` and `.jir`")
+        raise ValueError("Not a valid file!\nOnly supports `.jac`, `.jir` and `.jacb`")
 
     data = {}
     obj = Jac.get_object(id)
     if obj:
         data = obj.__jac__.__getstate__()
+        data.pop("hash", None)
+        if isinstance(obj.__jac__, NodeAnchor):
+            # node records only count their edges, which are stored in pages
+            data["edges"] = [edge.make_stub() for edge in obj.__jac__.edges]
     else:
         print(f"Object with id {id} not found.")
 
@@ -170,13 +188,24 @@ def get_object(
 
 
 @cmd_registry.register
-def build(filename: str) -> None:
-    """Build the specified .jac file."""
+def build(filename: str, bundle: bool = False) -> None:
+    """Build the specified .jac file.
+
+    :param filename: The path to the .jac file.
+    :param bundle: Write a .jacb bytecode bundle instead of a .jir file.
+    """
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+
     if filename.endswith(".jac"):
         out = jac_file_to_pass(file_path=filename, schedule=py_code_gen_typed)
         errs = len(out.errors_had)
         warnings = len(out.warnings_had)
         print(f"Errors: {errs}, Warnings: {warnings}")
+        if bundle and isinstance(out.ir, ast.Module):
+            JacBundle.write(out.ir, filename[:-4] + ".jacb")
+            return
         for i in out.ir.flatten():
             i.gen.clean()
         with open(filename[:-4] + ".jir", "wb") as f:
@@ -191,6 +220,9 @@ def check(filename: str, print_errs: bool = True) -> None:
 
     :param filename: The path to the .jac file.
     """
+    from jaclang.compiler.compile import jac_file_to_pass
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+
     if filename.endswith(".jac"):
         out = jac_file_to_pass(
             file_path=filename,
@@ -232,7 +264,7 @@ def enter(
     :param filename: The path to the .jac file.
     :param entrypoint: The name of the entrypoint function.
     :param args: Arguments to pass to the entrypoint function.
-    :param session: shelve.Shelf file path.
+    :param session: shelve.Shelf file path or sqlite:// database path.
     :param root: root executor.
     :param node: starting node.
     """
@@ -247,7 +279,7 @@ def enter(
 
     base, mod = os.path.split(filename)
     base = base if base else "./"
-    mod = mod[:-4]
+    mod = os.path.splitext(mod)[0]
 
     jctx = ExecutionContext.create(session=session, root=root)
 
@@ -269,10 +301,18 @@ def enter(
                 cachable=cache,
                 override_name="__main__" if main else None,
             )
+    elif filename.endswith(".jacb"):
+        JacMachine(base).attach_program(JacProgram.from_bundle(filename))
+        ret_module = jac_import(
+            target=mod,
+            base_path=base,
+            cachable=cache,
+            override_name="__main__" if main else None,
+        )
     else:
         jctx.close()
         JacMachine.detach()
-        raise ValueError("Not a valid file!\nOnly supports `.jac` and `.jir`")
+        raise ValueError("Not a valid file!\nOnly supports `.jac`, `.jir` and `.jacb`")
 
     if ret_module:
         (loaded_mod,) = ret_module
@@ -334,6 +374,8 @@ def tool(tool: str, args: Optional[list] = None) -> None:
     :param tool: The name of the AST tool to run.
     :param args: Optional arguments for the AST tool.
     """
+    from jaclang.utils.lang_tools import AstTool
+
     if hasattr(AstTool, tool):
         try:
             if args and len(args):
@@ -351,21 +393,30 @@ def tool(tool: str, args: Optional[list] = None) -> None:
 def clean() -> None:
     """Remove the __jac_gen__ , __pycache__ folders.
 
-    from the current directory recursively.
+    from the current directory recursively, and the compile cache entries of the
+    Jac modules in it.
     """
     current_dir = os.getcwd()
-    for root, dirs, _files in os.walk(current_dir, topdown=True):
+    removed = 0
+    for root, dirs, files in os.walk(current_dir, topdown=True):
         for folder_name in dirs[:]:
             if folder_name in [Constants.JAC_GEN_DIR, Constants.JAC_MYPY_CACHE]:
                 folder_to_remove = os.path.join(root, folder_name)
                 shutil.rmtree(folder_to_remove)
+                dirs.remove(folder_name)
                 print(f"Removed folder: {folder_to_remove}")
+        for file_name in files:
+            if file_name.endswith(".jac"):
+                removed += compile_cache.remove(os.path.join(root, file_name))
+    print(f"Removed {removed} compile cache entries from {compile_cache.cache_dir}")
     print("Done cleaning.")
 
 
 @cmd_registry.register
 def debug(filename: str, main: bool = True, cache: bool = False) -> None:
     """Debug the specified .jac file using pdb."""
+    from jaclang.compiler.compile import jac_file_to_pass
+
     base, mod = os.path.split(filename)
     base = base if base else "./"
     mod = mod[:-4]
@@ -466,6 +517,9 @@ def py2jac(filename: str) -> None:
 
     :param filename: The path to the .py file.
     """
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
+
     if filename.endswith(".py"):
         with open(filename, "r") as f:
             code = PyastBuildPass(
@@ -482,6 +536,8 @@ def jac2py(filename: str) -> None:
 
     :param filename: The path to the .jac file.
     """
+    from jaclang.compiler.compile import jac_file_to_pass
+
     if filename.endswith(".jac"):
         with open(filename, "r"):
             code = jac_file_to_pass(file_path=filename).ir.gen.py
@@ -1,17 +1,27 @@
-"""Jac compiler tools."""
+"""Jac compiler tools.
+
+The generated parser is loaded when jac_lark or TOKEN_MAP is first used, so the
+runtime can import modules of this package without it.
+"""
 
-import contextlib
 import logging
 import os
 import shutil
 import sys
+from types import ModuleType
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jaclang.compiler.generated import jac_parser as jac_lark
 
-from jaclang.utils.helpers import auto_generate_refs
-from jaclang.vendor.lark.tools import standalone
+    TOKEN_MAP: dict[str, str]
 
 
 def generate_static_parser(force: bool = False) -> None:
     """Generate static parser."""
+    from jaclang.utils.helpers import auto_generate_refs
+    from jaclang.vendor.lark.tools import standalone
+
     cur_dir = os.path.dirname(__file__)
     if force or not os.path.exists(os.path.join(cur_dir, "generated", "jac_parser.py")):
         if os.path.exists(os.path.join(cur_dir, "generated")):
@@ -35,43 +45,53 @@ def generate_static_parser(force: bool = False) -> None:
             logging.error(f"Error generating reference files: {e}")
 
 
-try:
-    from jaclang.compiler.generated import jac_parser as jac_lark
-except ModuleNotFoundError:
-    generate_static_parser(force=True)
-    from jaclang.compiler.generated import jac_parser as jac_lark
+def load_parser() -> tuple[ModuleType, dict[str, str]]:
+    """Load the generated parser and the map of its tokens."""
+    try:
+        from jaclang.compiler.generated import jac_parser as jac_lark
+    except ModuleNotFoundError:
+        generate_static_parser(force=True)
+        from jaclang.compiler.generated import jac_parser as jac_lark
+
+    jac_lark.logger.setLevel(logging.DEBUG)
 
-jac_lark.logger.setLevel(logging.DEBUG)
-contextlib.suppress(ModuleNotFoundError)
-
-TOKEN_MAP = {
-    x.name: x.pattern.value
-    for x in jac_lark.Lark_StandAlone().parser.lexer_conf.terminals
-}
-
-# fmt: off
-TOKEN_MAP.update(
-    {
-        "CARROW_L": "<++", "CARROW_R": "++>", "GLOBAL_OP": ":global:",
-        "NONLOCAL_OP": ":nonlocal:", "WALKER_OP": ":walker:", "NODE_OP": ":node:",
-        "EDGE_OP": ":edge:", "CLASS_OP": ":class:", "OBJECT_OP": ":obj:",
-        "TYPE_OP": "`", "ABILITY_OP": ":can:", "ELVIS_OP": "?:", "NULL_OK": "?",
-        "KW_OR": "|", "ARROW_BI": "<-->", "ARROW_L": "<--",
-        "ARROW_R": "-->", "ARROW_L_P1": "<-:", "ARROW_R_P2": ":->",
-        "ARROW_L_P2": ":-", "ARROW_R_P1": "-:", "CARROW_BI": "<++>",
-        "CARROW_L": "<++", "CARROW_R": "++>", "CARROW_L_P1": "<+:",
-        "CARROW_R_P2": ":+>", "CARROW_L_P2": ":+", "CARROW_R_P1": "+:",
-        "PIPE_FWD": "|>", "PIPE_BKWD": "<|", "A_PIPE_FWD": ":>",
-        "A_PIPE_BKWD": "<:", "DOT_FWD": ".>", "STAR_POW": "**",
-        "STAR_MUL": "*", "FLOOR_DIV": "//", "DIV": "/",
-        "PYNLINE": "::py::", "ADD_EQ": "+=", "SUB_EQ": "-=",
-        "STAR_POW_EQ": "**=", "MUL_EQ": "*=", "FLOOR_DIV_EQ": "//=",
-        "DIV_EQ": "/=", "MOD_EQ": "%=", "BW_AND_EQ": "&=",
-        "BW_OR_EQ": "|=", "BW_XOR_EQ": "^=", "BW_NOT_EQ": "~=",
-        "LSHIFT_EQ": "<<=", "RSHIFT_EQ": ">>=", "ELLIPSIS": "...",
+    token_map = {
+        x.name: x.pattern.value
+        for x in jac_lark.Lark_StandAlone().parser.lexer_conf.terminals
     }
-)
-# fmt: on
+
+    # fmt: off
+    token_map.update(
+        {
+            "CARROW_L": "<++", "CARROW_R": "++>", "GLOBAL_OP": ":global:",
+            "NONLOCAL_OP": ":nonlocal:", "WALKER_OP": ":walker:", "NODE_OP": ":node:",
+            "EDGE_OP": ":edge:", "CLASS_OP": ":class:", "OBJECT_OP": ":obj:",
+            "TYPE_OP": "`", "ABILITY_OP": ":can:", "ELVIS_OP": "?:", "NULL_OK": "?",
+            "KW_OR": "|", "ARROW_BI": "<-->", "ARROW_L": "<--",
+            "ARROW_R": "-->", "ARROW_L_P1": "<-:", "ARROW_R_P2": ":->",
+            "ARROW_L_P2": ":-", "ARROW_R_P1": "-:", "CARROW_BI": "<++>",
+            "CARROW_L": "<++", "CARROW_R": "++>", "CARROW_L_P1": "<+:",
+            "CARROW_R_P2": ":+>", "CARROW_L_P2": ":+", "CARROW_R_P1": "+:",
+            "PIPE_FWD": "|>", "PIPE_BKWD": "<|", "A_PIPE_FWD": ":>",
+            "A_PIPE_BKWD": "<:", "DOT_FWD": ".>", "STAR_POW": "**",
+            "STAR_MUL": "*", "FLOOR_DIV": "//", "DIV": "/",
+            "PYNLINE": "::py::", "ADD_EQ": "+=", "SUB_EQ": "-=",
+            "STAR_POW_EQ": "**=", "MUL_EQ": "*=", "FLOOR_DIV_EQ": "//=",
+            "DIV_EQ": "/=", "MOD_EQ": "%=", "BW_AND_EQ": "&=",
+            "BW_OR_EQ": "|=", "BW_XOR_EQ": "^=", "BW_NOT_EQ": "~=",
+            "LSHIFT_EQ": "<<=", "RSHIFT_EQ": ">>=", "ELLIPSIS": "...",
+        }
+    )
+    # fmt: on
+    return jac_lark, token_map
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Load the parser on first use."""
+    if name in ("jac_lark", "TOKEN_MAP"):
+        globals()["jac_lark"], globals()["TOKEN_MAP"] = load_parser()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["jac_lark", "TOKEN_MAP"]
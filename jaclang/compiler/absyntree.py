@@ -33,6 +33,7 @@ from jaclang.compiler.semtable import SemRegistry
 from jaclang.utils.treeprinter import dotgen_ast_tree, print_ast_tree
 
 if TYPE_CHECKING:
+    from jaclang.compiler.passes.main.sub_node_tab_pass import SubNodeIndex
     from jaclang.compiler.symtable import Symbol, SymbolTable
 
 
@@ -44,7 +45,7 @@ class AstNode:
         self.parent: Optional[AstNode] = None
         self.kid: list[AstNode] = [x.set_parent(self) for x in kid]
         self._sym_tab: Optional[SymbolTable] = None
-        self._sub_node_tab: dict[type, list[AstNode]] = {}
+        self._sub_node_span: Optional[tuple[SubNodeIndex, int, int]] = None
         self._in_mod_nodes: list[AstNode] = []
         self.gen: CodeGenTarget = CodeGenTarget()
         self.meta: dict[str, str] = {}
@@ -71,6 +72,8 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
         """Add kid left."""
+        if self._sub_node_span:
+            self._sub_node_span[0].graft(self, nodes, 0)
         self.kid = [*nodes, *self.kid]
         if pos_update:
             for i in nodes:
@@ -82,6 +85,8 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
         """Add kid right."""
+        if self._sub_node_span:
+            self._sub_node_span[0].graft(self, nodes, len(self.kid))
         self.kid = [*self.kid, *nodes]
         if pos_update:
             for i in nodes:
@@ -93,6 +98,8 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos: int, pos_update: bool = True
     ) -> AstNode:
         """Insert kids at position."""
+        if self._sub_node_span:
+            self._sub_node_span[0].graft(self, nodes, pos)
         self.kid = [*self.kid[:pos], *nodes, *self.kid[pos:]]
         if pos_update:
             for i in nodes:
@@ -0,0 +1,102 @@
+"""Bytecode bundles for deploying whole Jac programs.
+
+A bundle holds the marshaled bytecode of every Jac module of a program and
+their semantic registries, so it can be run without compiling the sources or
+unpickling the AST like a .jir file needs. The file starts with a magic number
+and the size of a JSON index, followed by the index and the data. The index
+maps the path of each module relative to the bundle to the offset and size of
+its code and registry in the data. Bundles are memory mapped when loaded and
+only the code of the modules that get imported is read.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import pickle
+from importlib.util import MAGIC_NUMBER
+from typing import Iterator, Mapping, TYPE_CHECKING
+
+from jaclang.compiler.cache import CompileCache
+
+if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+
+
+BUNDLE_MAGIC = b"JACB"
+
+
+class BundleSection(Mapping[str, bytes]):
+    """Data of one kind in a bundle, keyed by absolute module path."""
+
+    def __init__(
+        self,
+        data: mmap.mmap,
+        start: int,
+        base_dir: str,
+        index: dict[str, list[int]],
+    ) -> None:
+        """Initialize bundle section."""
+        self.data = data
+        self.index = {
+            os.path.normpath(os.path.join(base_dir, path)): (start + offset, size)
+            for path, (offset, size) in index.items()
+        }
+
+    def __getitem__(self, file_path: str) -> bytes:
+        """Get the data of a module."""
+        offset, size = self.index[os.path.abspath(file_path)]
+        return self.data[offset : offset + size]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over module paths."""
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        """Get number of modules."""
+        return len(self.index)
+
+
+class JacBundle:
+    """Memory mapped bytecode bundle."""
+
+    def __init__(self, file_path: str) -> None:
+        """Load bundle index."""
+        with open(file_path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:4] != BUNDLE_MAGIC:
+            raise ValueError(f"{file_path} is not a Jac bundle")
+        size = int.from_bytes(self.data[4:8], "little")
+        index = json.loads(self.data[8 : 8 + size])
+        if index["python"] != MAGIC_NUMBER.hex():
+            raise ValueError(f"{file_path} was built for another Python version")
+        base_dir = os.path.dirname(os.path.abspath(file_path))
+        self.code = BundleSection(self.data, 8 + size, base_dir, index["code"])
+        self.registries = BundleSection(
+            self.data, 8 + size, base_dir, index["registries"]
+        )
+
+    @staticmethod
+    def write(node: ast.Module, file_path: str) -> None:
+        """Write bytecode and registries of a compiled program to a bundle."""
+        base_dir = os.path.dirname(os.path.abspath(file_path))
+        index: dict = {"python": MAGIC_NUMBER.hex(), "code": {}, "registries": {}}
+        data = bytearray()
+        for mod_path, mod in node.mod_deps.items():
+            if not mod_path.endswith(".jac"):
+                continue
+            path = os.path.relpath(os.path.abspath(mod_path), base_dir)
+            blobs = {
+                "code": mod.gen.py_bytecode,
+                "registries": pickle.dumps(mod.registry) if mod.registry else None,
+            }
+            for section, blob in blobs.items():
+                if blob:
+                    index[section][path] = [len(data), len(blob)]
+                    data += blob
+        header = json.dumps(index).encode()
+        CompileCache.write(
+            os.path.abspath(file_path),
+            BUNDLE_MAGIC + len(header).to_bytes(4, "little") + header + data,
+        )
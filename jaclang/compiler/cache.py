@@ -0,0 +1,193 @@
+"""Persistent compilation cache for Jac modules.
+
+Bytecode is stored under a global cache directory (~/.jaclang/cache by default)
+so it is shared across checkouts and runs. Every module has a manifest keyed by
+the hash of its source, the jaclang version and the Python version. The manifest
+lists the hashes of the annexed .impl.jac/.test.jac files and imported Jac
+modules the bytecode was built against, all of which must still match for the
+cached bytecode to be used. The pickled semantic registry of the module is kept
+with its bytecode and restored to __jac_gen__ on a hit, since by llm lookups read
+it from there. Code loaded for a module at another path than it was compiled
+from is relocated to it. Files are written to a temporary name and renamed into
+place so concurrent compiles never see partial entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import suppress
+from importlib.metadata import PackageNotFoundError, version
+from types import CodeType
+from typing import Optional, TYPE_CHECKING
+
+from jaclang.compiler.semtable import RegistryCache
+from jaclang.settings import settings
+from jaclang.utils.helpers import find_annex_files
+from jaclang.utils.log import logging
+
+if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_jaclang_version() -> str:
+    """Get installed jaclang version."""
+    try:
+        return version("jaclang")
+    except PackageNotFoundError:
+        return "dev"
+
+
+class CompileCache:
+    """Content addressed bytecode cache."""
+
+    def __init__(self, cache_dir: str = "") -> None:
+        """Initialize compile cache."""
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.expanduser("~"), ".jaclang", "cache"
+        )
+        self.salt = f"{get_jaclang_version()}\0{sys.version}\0".encode()
+
+    @staticmethod
+    def hash_file(file_path: str) -> Optional[str]:
+        """Hash file content, None if it can't be read."""
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def source_key(self, file_path: str) -> Optional[str]:
+        """Get manifest key of a module source."""
+        try:
+            with open(file_path, "rb") as f:
+                return hashlib.sha256(self.salt + f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def entry_path(self, key: str, ext: str) -> str:
+        """Get path of a cache entry."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}{ext}")
+
+    def load(self, file_path: str) -> Optional[CodeType]:
+        """Get cached code of a module if it and its dependencies are intact."""
+        if not (key := self.source_key(file_path)):
+            return None
+        try:
+            with open(self.entry_path(key, ".json")) as f:
+                manifest = json.load(f)
+            base_dir = os.path.dirname(os.path.abspath(file_path))
+            impl_files, test_files = find_annex_files(file_path)
+            annexes = {os.path.relpath(i, base_dir) for i in impl_files + test_files}
+            deps: dict[str, str] = manifest["deps"]
+            if not annexes.issubset(deps) or any(
+                self.hash_file(os.path.join(base_dir, dep)) != digest
+                for dep, digest in deps.items()
+            ):
+                return None
+            with open(self.entry_path(manifest["code"], ".jbc"), "rb") as f:
+                code = marshal.load(f)
+            if manifest.get("registry"):
+                with open(self.entry_path(manifest["code"], ".reg"), "rb") as f:
+                    self.restore_registry(file_path, f.read())
+        except (OSError, ValueError, KeyError, EOFError, TypeError):
+            return None
+        if code.co_filename != file_path:
+            code = self.relocate(code, file_path)
+        return code
+
+    def relocate(self, code: CodeType, file_path: str) -> CodeType:
+        """Point code and nested code objects to another source file."""
+        return code.replace(
+            co_filename=file_path,
+            co_consts=tuple(
+                self.relocate(i, file_path) if isinstance(i, CodeType) else i
+                for i in code.co_consts
+            ),
+        )
+
+    def store(self, node: ast.Module) -> None:
+        """Store bytecode of a compiled module with its dependency hashes."""
+        import jaclang.compiler.absyntree as ast
+
+        file_path = node.loc.mod_path
+        if not node.gen.py_bytecode or not (key := self.source_key(file_path)):
+            return
+        base_dir = os.path.dirname(os.path.abspath(file_path))
+        deps: dict[str, str] = {}
+        for mod in node.get_all_sub_nodes(ast.Module):
+            mod_path = mod.loc.mod_path
+            if mod.stub_only or not mod_path.endswith(".jac"):
+                continue
+            if digest := self.hash_file(mod_path):
+                deps[os.path.relpath(os.path.abspath(mod_path), base_dir)] = digest
+        code_key = hashlib.sha256(
+            (key + json.dumps(deps, sort_keys=True)).encode()
+        ).hexdigest()
+        manifest = json.dumps(
+            {"deps": deps, "code": code_key, "registry": bool(node.registry)}
+        ).encode()
+        # an intact entry for the same sources is not written again
+        with suppress(OSError), open(self.entry_path(key, ".json"), "rb") as f:
+            if f.read() == manifest and os.path.exists(
+                self.entry_path(code_key, ".jbc")
+            ):
+                return
+        try:
+            self.write(self.entry_path(code_key, ".jbc"), node.gen.py_bytecode)
+            if node.registry:
+                registry = pickle.dumps(node.registry)
+                self.write(self.entry_path(code_key, ".reg"), registry)
+            self.write(self.entry_path(key, ".json"), manifest)
+        except OSError as e:
+            logger.warning(f"Can't write compile cache for {file_path}: {e}")
+
+    def restore_registry(self, file_path: str, data: bytes) -> None:
+        """Write the cached registry of a module to __jac_gen__ if it differs."""
+        path = RegistryCache.registry_path(file_path)
+        with suppress(OSError), open(path, "rb") as f:
+            if f.read() == data:
+                return
+        self.write(path, data)
+
+    def remove(self, file_path: str) -> bool:
+        """Remove the cache entry of a module source, tell if there was one."""
+        if not (key := self.source_key(file_path)):
+            return False
+        try:
+            with open(self.entry_path(key, ".json")) as f:
+                code_key = json.load(f)["code"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        for path in (
+            self.entry_path(code_key, ".jbc"),
+            self.entry_path(code_key, ".reg"),
+            self.entry_path(key, ".json"),
+        ):
+            with suppress(OSError):
+                os.remove(path)
+        return True
+
+    @staticmethod
+    def write(path: str, data: bytes) -> None:
+        """Write file atomically."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+compile_cache = CompileCache(settings.compile_cache_dir)
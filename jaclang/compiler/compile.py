@@ -1,5 +1,6 @@
 """Transpilation functions."""
 
+import time
 from typing import Optional, Type
 
 import jaclang.compiler.absyntree as ast
@@ -48,12 +49,14 @@ def jac_str_to_pass(
     if not target:
         target = schedule[-1] if schedule else None
     source = ast.JacSource(jac_str, mod_path=file_path)
+    start = time.perf_counter()
     ast_ret: Pass = JacParser(input_ir=source)
+    ast_ret.timings.append((JacParser.__name__, time.perf_counter() - start))
     for i in schedule:
         if i == target:
             break
-        ast_ret = i(input_ir=ast_ret.ir, prior=ast_ret)
-    ast_ret = target(input_ir=ast_ret.ir, prior=ast_ret) if target else ast_ret
+        ast_ret = run_pass(i, ast_ret)
+    ast_ret = run_pass(target, ast_ret) if target else ast_ret
     return ast_ret
 
 
@@ -73,8 +76,16 @@ def jac_ir_to_pass(
     for i in schedule[1:]:
         if i == target:
             break
-        ast_ret = i(input_ir=ast_ret.ir, prior=ast_ret)
-    ast_ret = target(input_ir=ast_ret.ir, prior=ast_ret) if target else ast_ret
+        ast_ret = run_pass(i, ast_ret)
+    ast_ret = run_pass(target, ast_ret) if target else ast_ret
+    return ast_ret
+
+
+def run_pass(pass_type: Type[Pass], prior: Pass) -> Pass:
+    """Run a pass on the output of another, recording how long it took."""
+    start = time.perf_counter()
+    ast_ret = pass_type(input_ir=prior.ir, prior=prior)
+    ast_ret.timings.append((pass_type.__name__, time.perf_counter() - start))
     return ast_ret
 
 
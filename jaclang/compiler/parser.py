@@ -25,6 +25,7 @@ class JacParser(Pass):
         self.source = input_ir
         self.mod_path = input_ir.loc.mod_path
         self.node_list: list[ast.AstNode] = []
+        self.node_ids: set[int] = set()
         if JacParser.dev_mode:
             JacParser.make_dev()
         Pass.__init__(self, input_ir=input_ir, prior=None)
@@ -133,7 +134,8 @@ class JacParser(Pass):
         def nu(self, node: ast.T) -> ast.T:
             """Update node."""
             self.parse_ref.cur_node = node
-            if node not in self.parse_ref.node_list:
+            if id(node) not in self.parse_ref.node_ids:
+                self.parse_ref.node_ids.add(id(node))
                 self.parse_ref.node_list.append(node)
             return node
 
@@ -1,7 +1,8 @@
 """Abstract class for IR Passes for Jac."""
 
 import time
-from typing import Optional, Type, TypeVar
+from abc import ABCMeta
+from typing import Callable, ClassVar, Iterator, Optional, Type, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
@@ -10,9 +11,58 @@ from jaclang.utils.helpers import pascal_to_snake
 
 T = TypeVar("T", bound=ast.AstNode)
 
+Handler = Optional[Callable[["Pass", ast.AstNode], None]]
 
-class Pass(Transform[T]):
-    """Abstract class for IR passes."""
+
+class PassMeta(ABCMeta):
+    """Pass metaclass keeping dispatch tables in sync with handler methods."""
+
+    def __setattr__(cls, name: str, value: object) -> None:
+        """Set class attribute, resetting dispatch tables if it is a handler."""
+        super().__setattr__(name, value)
+        cls.handler_changed(name)
+
+    def __delattr__(cls, name: str) -> None:
+        """Delete class attribute, resetting dispatch tables if it is a handler."""
+        super().__delattr__(name)
+        cls.handler_changed(name)
+
+    def handler_changed(cls, name: str) -> None:
+        """Reset dispatch tables of the pass and its subclasses on handler change."""
+        if name.startswith(("enter_", "exit_")):
+            stack: list[type] = [cls]
+            while stack:
+                sub = stack.pop()
+                if issubclass(sub, Pass):
+                    sub.reset_handlers()
+                stack.extend(sub.__subclasses__())
+
+
+class Pass(Transform[T], metaclass=PassMeta):
+    """Abstract class for IR passes.
+
+    Handlers named enter_<node_type>/exit_<node_type> are resolved once per pass
+    class and node type into a dispatch table, traversal only calls into a node
+    when the pass has a handler for its type or overrides enter_node/exit_node.
+    Tables are reset when handlers are set on or deleted from a pass class.
+    """
+
+    # node type -> (enter handler, exit handler), built per subclass
+    handlers: ClassVar[dict[type, tuple[Handler, Handler]]] = {}
+    custom_enter: ClassVar[bool] = False
+    custom_exit: ClassVar[bool] = False
+
+    def __init_subclass__(cls) -> None:
+        """Reset dispatch table for pass subclass."""
+        super().__init_subclass__()
+        cls.reset_handlers()
+
+    @classmethod
+    def reset_handlers(cls) -> None:
+        """Reset dispatch table of the pass."""
+        cls.handlers = {}
+        cls.custom_enter = cls.enter_node is not Pass.enter_node
+        cls.custom_exit = cls.exit_node is not Pass.exit_node
 
     def __init__(self, input_ir: T, prior: Optional[Transform]) -> None:
         """Initialize parser."""
@@ -20,6 +70,10 @@ class Pass(Transform[T]):
         self.prune_signal = False
         self.ir: ast.AstNode = input_ir
         self.time_taken = 0.0
+        # (pass name, seconds) of the passes run in a schedule, shared along it
+        self.timings: list[tuple[str, float]] = (
+            prior.timings if isinstance(prior, Pass) else []
+        )
         Transform.__init__(self, input_ir, prior)
 
     def before_pass(self) -> None:
@@ -30,15 +84,26 @@ class Pass(Transform[T]):
         """Run once after pass."""
         pass
 
+    @classmethod
+    def get_handlers(cls, node_type: type) -> tuple[Handler, Handler]:
+        """Get enter and exit handlers of the pass for a node type."""
+        if (handlers := cls.handlers.get(node_type)) is None:
+            name = pascal_to_snake(node_type.__name__)
+            handlers = cls.handlers[node_type] = (
+                getattr(cls, f"enter_{name}", None),
+                getattr(cls, f"exit_{name}", None),
+            )
+        return handlers
+
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        if enter := self.get_handlers(type(node))[0]:
+            enter(self, node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        if exit := self.get_handlers(type(node))[1]:
+            exit(self, node)
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -57,11 +122,9 @@ class Pass(Transform[T]):
         # Assumes pass built the sub node table
         if not node:
             return result
-        elif len(node._sub_node_tab):
-            if typ in node._sub_node_tab:
-                for i in node._sub_node_tab[typ]:
-                    if isinstance(i, typ):
-                        result.append(i)
+        elif node._sub_node_span:
+            index, start, pos = node._sub_node_span
+            return index.find(typ, start, pos)
         elif len(node.kid):
             if not brute_force:
                 raise ValueError(f"Node has no sub_node_tab. {node}")
@@ -93,12 +156,13 @@ class Pass(Transform[T]):
 
     def recalculate_parents(self, node: ast.AstNode) -> None:
         """Recalculate parents."""
-        if not node:
-            return
-        for i in node.kid:
-            if i:
-                i.parent = node
-                self.recalculate_parents(i)
+        stack = [node] if node else []
+        while stack:
+            cur = stack.pop()
+            for i in cur.kid:
+                if i:
+                    i.parent = cur
+                    stack.append(i)
 
     # Transform Implementations
     # -------------------------
@@ -121,21 +185,54 @@ class Pass(Transform[T]):
         return self.ir
 
     def traverse(self, node: ast.AstNode) -> ast.AstNode:
-        """Traverse tree."""
-        if self.term_signal:
-            return node
-        self.cur_node = node
-        self.enter_node(node)
-        if not self.prune_signal:
-            for i in node.kid:
-                if i:
-                    self.traverse(i)
-        else:
-            self.prune_signal = False
-        self.cur_node = node
+        """Traverse tree.
+
+        Walks the tree with an explicit stack of kid iterators instead of
+        recursing, so deeply nested trees don't hit the recursion limit.
+        """
         if self.term_signal:
             return node
-        self.exit_node(node)
+        handlers, custom_enter, custom_exit = (
+            self.handlers,
+            self.custom_enter,
+            self.custom_exit,
+        )
+        path: list[ast.AstNode] = []
+        stack: list[Iterator[ast.AstNode]] = [iter((node,))]
+        while stack:
+            for cur in stack[-1]:
+                if cur:
+                    break
+            else:
+                stack.pop()
+                if not path:
+                    break
+                cur = path.pop()
+                self.cur_node = cur
+                if self.term_signal:
+                    return node
+                if custom_exit:
+                    self.exit_node(cur)
+                else:
+                    hooks = handlers.get(type(cur)) or self.get_handlers(type(cur))
+                    if hooks[1]:
+                        hooks[1](self, cur)
+                continue
+            if self.term_signal:
+                return node
+            self.cur_node = cur
+            if custom_enter:
+                self.enter_node(cur)
+            else:
+                hooks = handlers.get(type(cur)) or self.get_handlers(type(cur))
+                if hooks[0]:
+                    hooks[0](self, cur)
+            path.append(cur)
+            if self.prune_signal:
+                self.prune_signal = False
+                stack.append(iter(()))
+            else:
+                stack.append(iter(cur.kid))
         return node
 
     def error(self, msg: str, node_override: Optional[ast.AstNode] = None) -> None:
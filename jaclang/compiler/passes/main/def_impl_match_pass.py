@@ -8,7 +8,6 @@ body field.
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
-from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.compiler.symtable import Symbol, SymbolTable
 
 
@@ -24,10 +23,6 @@ class DeclImplMatchPass(Pass):
         else:
             self.connect_def_impl(node.sym_tab)
 
-    def after_pass(self) -> None:
-        """Rebuild sub node table."""
-        self.ir = SubNodeTabPass(input_ir=self.ir, prior=self).ir
-
     def defn_lookup(self, lookup: Symbol) -> ast.NameAtom | None:
         """Lookup a definition in a symbol table."""
         for defn in range(len(lookup.defn)):
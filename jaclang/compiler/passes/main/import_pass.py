@@ -14,6 +14,7 @@ import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass, SymTabBuildPass
 from jaclang.settings import settings
+from jaclang.utils.helpers import find_annex_files
 from jaclang.utils.log import logging
 
 
@@ -40,7 +41,6 @@ class JacImportPass(Pass):
             for i in all_imports:
                 self.process_import(i)
                 self.enter_module_path(i)
-            SubNodeTabPass(prior=self, input_ir=node)
 
         node.mod_deps.update(self.import_table)
 
@@ -69,47 +69,19 @@ class JacImportPass(Pass):
             self.error("Module has no path")
         if not node.loc.mod_path.endswith(".jac"):
             return
-        base_path = node.loc.mod_path[:-4]
-        directory = os.path.dirname(node.loc.mod_path)
-        if not directory:
-            directory = os.getcwd()
-            base_path = os.path.join(directory, base_path)
-        impl_folder = base_path + ".impl"
-        test_folder = base_path + ".test"
-        search_files = [
-            os.path.join(directory, impl_file) for impl_file in os.listdir(directory)
-        ]
-        if os.path.exists(impl_folder):
-            search_files += [
-                os.path.join(impl_folder, impl_file)
-                for impl_file in os.listdir(impl_folder)
-            ]
-        if os.path.exists(test_folder):
-            search_files += [
-                os.path.join(test_folder, test_file)
-                for test_file in os.listdir(test_folder)
-            ]
-        for cur_file in search_files:
-            if node.loc.mod_path.endswith(cur_file):
-                continue
-            if (
-                cur_file.startswith(f"{base_path}.")
-                or impl_folder == os.path.dirname(cur_file)
-            ) and cur_file.endswith(".impl.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod:
-                    node.impl_mod.append(mod)
-                    node.add_kids_left([mod], pos_update=False)
-                    mod.parent = node
-            if (
-                cur_file.startswith(f"{base_path}.")
-                or test_folder == os.path.dirname(cur_file)
-            ) and cur_file.endswith(".test.jac"):
-                mod = self.import_jac_mod_from_file(cur_file)
-                if mod and not settings.ignore_test_annex:
-                    node.test_mod.append(mod)
-                    node.add_kids_right([mod], pos_update=False)
-                    mod.parent = node
+        impl_files, test_files = find_annex_files(node.loc.mod_path)
+        for cur_file in impl_files:
+            mod = self.import_jac_mod_from_file(cur_file)
+            if mod:
+                node.impl_mod.append(mod)
+                node.add_kids_left([mod], pos_update=False)
+                mod.parent = node
+        for cur_file in test_files:
+            mod = self.import_jac_mod_from_file(cur_file)
+            if mod and not settings.ignore_test_annex:
+                node.test_mod.append(mod)
+                node.add_kids_right([mod], pos_update=False)
+                mod.parent = node
 
     def enter_module_path(self, node: ast.ModulePath) -> None:
         """Sub objects.
@@ -3276,6 +3276,16 @@ class PyastGenPass(Pass):
                             value=self.sync(ast3.Constant(value=edges_only)),
                         )
                     ),
+                    self.sync(
+                        ast3.keyword(
+                            arg="edge_type",
+                            value=self.sync(
+                                node.filter_cond.f_type.gen.py_ast[0]
+                                if node.filter_cond and node.filter_cond.f_type
+                                else self.sync(ast3.Constant(value=None))
+                            ),
+                        )
+                    ),
                 ],
             )
         )
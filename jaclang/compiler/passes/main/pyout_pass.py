@@ -1,14 +1,15 @@
 """Connect Decls and Defs in AST.
 
 This pass creates and manages compilation of Python code from the AST. This pass
-also creates bytecode files from the Python code, and manages the caching of
-relevant files.
+also creates bytecode files from the Python code, and stores them in the global
+compile cache.
 """
 
 import os
 
 
 import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import compile_cache
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
 
@@ -40,6 +41,7 @@ class PyOutPass(Pass):
         ]
         for mod in mods:
             mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
+            compile_cache.store(mod)
             if os.path.exists(out_path_pyc) and os.path.getmtime(
                 out_path_pyc
             ) > os.path.getmtime(mod_path):
@@ -1,36 +1,113 @@
 """Subnode Table building pass.
 
-This pass builds a table of subnodes for each node in the AST. This is used
-for fast lookup of nodes of a certain type in the AST. This is just a utility
-pass and is not required for any other pass to work.
+This pass builds an index of subnodes for the AST. This is used for fast lookup
+of nodes of a certain type in the AST. This is just a utility pass and is not
+required for any other pass to work.
+
+The index keeps the nodes of the tree in one flat list in post order, so the
+subnodes of any node sit in a contiguous range right before the node itself,
+along with the positions of the nodes of each type. Every node only holds its
+index and range, looking up subnodes of a type is a bisect over the positions
+of that type. Subtrees attached later with add_kids_left/add_kids_right/
+insert_kids_at_pos (e.g. imported modules) are recorded as grafts with their
+own index instead of rebuilding it.
 """
 
-from copy import copy
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Sequence, Type, TypeVar, cast
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 
+T = TypeVar("T", bound=ast.AstNode)
+
+
+class SubNodeIndex:
+    """Post order index of the nodes of a tree by type."""
+
+    def __init__(self) -> None:
+        """Initialize sub node index."""
+        self.nodes: list[ast.AstNode] = []
+        self.positions: dict[type, list[int]] = {}
+        # grafted subtrees as (parent position, root), ordered by the position
+        # they are inserted at in graft_at so they merge in kid order
+        self.graft_at: list[int] = []
+        self.grafts: list[tuple[int, ast.AstNode]] = []
+
+    def add(self, node: ast.AstNode, start: int) -> None:
+        """Add node after its subnodes which start at start."""
+        pos = len(self.nodes)
+        self.nodes.append(node)
+        self.positions.setdefault(type(node), []).append(pos)
+        node._sub_node_span = (self, start, pos)
+
+    def find(self, typ: Type[T], start: int, pos: int) -> list[T]:
+        """Get nodes of type in range and in subtrees grafted to it."""
+        result: list[ast.AstNode] = []
+        positions = self.positions.get(typ, [])
+        lo = bisect_left(positions, start)
+        hi = bisect_left(positions, pos)
+        for i in range(
+            bisect_left(self.graft_at, start), bisect_right(self.graft_at, pos)
+        ):
+            parent, root = self.grafts[i]
+            if not start <= parent <= pos:
+                continue
+            cut = bisect_left(positions, self.graft_at[i], lo, hi)
+            result.extend(self.nodes[j] for j in positions[lo:cut])
+            lo = cut
+            index, root_start, root_pos = get_span(root)
+            result.extend(index.find(typ, root_start, root_pos))
+            if type(root) is typ:
+                result.append(root)
+        result.extend(self.nodes[j] for j in positions[lo:hi])
+        return cast(list[T], result)
+
+    def graft(
+        self, parent: ast.AstNode, nodes: Sequence[ast.AstNode], pos: int
+    ) -> None:
+        """Record subtrees about to be inserted into parent's kids at pos."""
+        _, _, parent_pos = get_span(parent)
+        following = parent.kid[pos] if pos < len(parent.kid) else None
+        grafted = next(
+            (i for i, (_, root) in enumerate(self.grafts) if root is following), None
+        )
+        if following and grafted is not None:
+            idx = grafted
+            at = self.graft_at[idx]
+        elif following and following._sub_node_span:
+            at = following._sub_node_span[1]
+            idx = bisect_left(self.graft_at, at)
+        else:
+            at = parent_pos
+            idx = bisect_right(self.graft_at, at)
+        self.graft_at[idx:idx] = [at] * len(nodes)
+        self.grafts[idx:idx] = [(parent_pos, i) for i in nodes]
+
+
+def get_span(node: ast.AstNode) -> tuple[SubNodeIndex, int, int]:
+    """Get index and range of node, indexing it if needed."""
+    if not node._sub_node_span:
+        SubNodeTabPass(input_ir=node, prior=None)
+    return cast(tuple[SubNodeIndex, int, int], node._sub_node_span)
+
 
 class SubNodeTabPass(Pass):
     """AST Enrichment Pass for basic high level semantics."""
 
+    def before_pass(self) -> None:
+        """Start a new index."""
+        self.index = SubNodeIndex()
+        self.starts: list[int] = []
+
     def enter_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().enter_node(node)
-        node._sub_node_tab = {}  # clears on entry
+        self.starts.append(len(self.index.nodes))
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Table builder."""
         super().exit_node(node)
-        for i in node.kid:
-            if not i:
-                continue
-            for k, v in i._sub_node_tab.items():
-                if k in node._sub_node_tab:
-                    node._sub_node_tab[k].extend(v)
-                else:
-                    node._sub_node_tab[k] = copy(v)
-            if type(i) in node._sub_node_tab:
-                node._sub_node_tab[type(i)].append(i)
-            else:
-                node._sub_node_tab[type(i)] = [i]
+        self.index.add(node, self.starts.pop())
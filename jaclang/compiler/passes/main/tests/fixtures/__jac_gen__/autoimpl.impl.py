@@ -0,0 +1 @@
+from __future__ import annotations
\ No newline at end of file
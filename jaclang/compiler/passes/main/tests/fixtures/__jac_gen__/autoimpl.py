@@ -0,0 +1,18 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/compiler/passes/main/tests/fixtures/autoimpl.impl.jac')
+def foo() -> None:
+    print('foo')
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/compiler/passes/main/tests/fixtures/autoimpl.something.else.impl.jac')
+def bar() -> None:
+    print('bar')
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/compiler/passes/main/tests/fixtures/autoimpl.impl/getme.impl.jac')
+def baz() -> None:
+    print('baz')
+foo()
+bar()
+baz()
\ No newline at end of file
@@ -1,9 +1,14 @@
 """Test registry pass."""
 
 import os
+import pickle
+from unittest.mock import Mock
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main import RegistryPass
+from jaclang.compiler.semtable import RegistryCache, SemInfo, SemRegistry
+from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.utils.test import TestCase
 
 
@@ -37,3 +42,76 @@ class RegistryPassTests(TestCase):
             )
         )
         self.assertIn("109", str(state.ir.to_dict()))
+
+    def test_registry_pickle(self) -> None:
+        """Test registry is pickled without its nodes and keeps its lookups."""
+        state = jac_file_to_pass(self.fixture_abs_path("registry.jac"), RegistryPass)
+        assert isinstance(state.ir, ast.Module)
+        registry = state.ir.registry
+        assert isinstance(registry, SemRegistry)
+        loaded = pickle.loads(pickle.dumps(registry))
+        self.assertEqual(registry.pp(), loaded.pp())
+        self.assertEqual(
+            [str(i) for i in registry.registry], [str(i) for i in loaded.registry]
+        )
+        for scope in registry.registry:
+            self.assertEqual(
+                repr(registry.lookup(scope)[1]), repr(loaded.lookup(scope)[1])
+            )
+        scope, info = loaded.lookup(name="Person")
+        assert isinstance(info, SemInfo)
+        self.assertIsNone(info._node)
+        self.assertEqual(info.semstr, "Person")
+        self.assertIs(scope, loaded.module_scope)
+        self.assertEqual(
+            [i.name for i in info.get_children(loaded, ast.HasVar)], ["name", "age"]
+        )
+        self.assertEqual(
+            [i.name for i in info.get_children(registry, ast.HasVar)],
+            ["name", "age"],
+        )
+        self.assertIs(
+            loaded.lookup(type="Enum")[1], loaded.lookup(name="Personality")[1]
+        )
+
+    def test_registry_pickle_nodes(self) -> None:
+        """Test nodes of a pickled registry are found again from their locations."""
+        state = jac_file_to_pass(self.fixture_abs_path("registry.jac"), RegistryPass)
+        assert isinstance(state.ir, ast.Module)
+        registry = state.ir.registry
+        assert isinstance(registry, SemRegistry)
+        loaded = pickle.loads(pickle.dumps(registry))
+        for scope, infos in registry.registry.items():
+            for info, other in zip(infos, loaded.lookup(scope)[1] or []):
+                assert info.node is not None and other.node is not None
+                self.assertIsNot(other.node, info.node)
+                self.assertIs(other.node.__class__, info.node.__class__)
+                self.assertEqual(other.node.loc.pos_start, info.node.loc.pos_start)
+        _, info = loaded.lookup(name="Personality")
+        assert isinstance(info, SemInfo)
+        self.assertIsInstance(info.node, ast.Enum)
+        self.assertIn(self.fixture_abs_path("registry.jac"), SemInfo.parsed)
+
+    def test_registry_cache(self) -> None:
+        """Test registries are loaded once until their file changes."""
+        file_loc = self.fixture_abs_path("registry.jac")
+        jac_file_to_pass(file_loc, RegistryPass)
+        cache = RegistryCache()
+        resolver = Mock(side_effect=lambda registry: registry.lookup(name="age"))
+        first = cache.resolve(file_loc, ("age",), resolver)
+        self.assertIs(cache.resolve(file_loc, ("age",), resolver), first)
+        self.assertIs(cache.get(file_loc), cache.get(file_loc))
+        self.assertEqual(resolver.call_count, 1)
+        path = cache.registry_path(file_loc)
+        mtime = os.stat(path).st_mtime_ns
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+        cache.resolve(file_loc, ("age",), resolver)
+        self.assertEqual(resolver.call_count, 2)
+        self.assertEqual(
+            Jac.get_semstr_type(file_loc, "registry(Module).Person(obj)", "age", True),
+            "Age of the Person",
+        )
+        self.assertEqual(
+            Jac.obj_scope(file_loc, "Person"), "registry(Module).Person(obj)"
+        )
+        self.assertIn(("Person", "Person"), Jac.get_sem_type(file_loc, "Person"))
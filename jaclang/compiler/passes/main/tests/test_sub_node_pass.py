@@ -1,6 +1,10 @@
 """Test sub node pass module."""
 
+import sys
+
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.utils.test import TestCase
 
@@ -19,7 +23,87 @@ class SubNodePassTests(TestCase):
             target=SubNodeTabPass,
         )
         for i in code_gen.ir.kid[1].kid:
-            for k, v in i._sub_node_tab.items():
-                for n in v:
-                    self.assertIn(n, code_gen.get_all_sub_nodes(i, k, brute_force=True))
+            sub_nodes: list[ast.AstNode] = []
+            stack = list(i.kid)
+            while stack:
+                sub_nodes.append(stack.pop())
+                stack.extend(sub_nodes[-1].kid)
+            for k in {type(n) for n in sub_nodes}:
+                self.assertCountEqual(
+                    code_gen.get_all_sub_nodes(i, k),
+                    [n for n in sub_nodes if type(n) is k],
+                )
         self.assertFalse(code_gen.errors_had)
+
+    def test_sub_node_index_grafts(self) -> None:
+        """Test attached subtrees show up as if the index was rebuilt."""
+        code_gen = jac_file_to_pass(
+            file_path=self.examples_abs_path("manual_code/circle.jac"),
+            target=SubNodeTabPass,
+        )
+        other = jac_file_to_pass(
+            file_path=self.examples_abs_path("manual_code/circle_pure.jac"),
+            target=SubNodeTabPass,
+        ).ir
+        ir = code_gen.ir
+        abilities = ir.get_all_sub_nodes(ast.Ability)
+        body = abilities[-1].body
+        assert isinstance(body, ast.SubNodeList)
+        abilities[0].add_kids_right([other], pos_update=False)
+        body.add_kids_left([other.kid[1]], pos_update=False)
+        types: list[type[ast.AstNode]] = [ast.Module, ast.Ability, ast.Name]
+        grafted = [ir.get_all_sub_nodes(k) for k in types]
+        self.assertIn(other, grafted[0])
+        self.assertGreater(len(grafted[1]), len(abilities))
+        SubNodeTabPass(input_ir=ir, prior=None)
+        self.assertEqual(grafted, [ir.get_all_sub_nodes(k) for k in types])
+
+    def test_deep_tree_traversal(self) -> None:
+        """Test passes walk trees nested past the recursion limit."""
+        code_gen = jac_file_to_pass(
+            file_path=self.examples_abs_path("manual_code/circle.jac"),
+            target=SubNodeTabPass,
+        )
+        leaf = code_gen.ir.get_all_sub_nodes(ast.Name)[0]
+        node: ast.AstNode = leaf
+        depth = sys.getrecursionlimit() * 2
+        for _ in range(depth):
+            node = ast.SubNodeList(items=[node], delim=None, kid=[node])
+        leaf.parent = None
+        sub_node_pass = SubNodeTabPass(input_ir=node, prior=None)
+        self.assertEqual(len(node.get_all_sub_nodes(ast.SubNodeList)), depth - 1)
+        self.assertEqual(node.get_all_sub_nodes(ast.Name), [leaf])
+        sub_node_pass.recalculate_parents(node)
+        self.assertIsInstance(leaf.parent, ast.SubNodeList)
+
+    def test_dispatch_tables(self) -> None:
+        """Test overridden and late added handlers are dispatched."""
+
+        class VisitPass(Pass):
+            def before_pass(self) -> None:
+                self.seen: list[str] = []
+
+            def enter_ability(self, node: ast.Ability) -> None:
+                self.seen.append("ability")
+
+        class OverridePass(VisitPass):
+            def enter_ability(self, node: ast.Ability) -> None:
+                self.seen.append("override")
+
+        ir = jac_file_to_pass(
+            file_path=self.examples_abs_path("manual_code/circle.jac"),
+            target=SubNodeTabPass,
+        ).ir
+        abilities = len(ir.get_all_sub_nodes(ast.Ability))
+        archs = len(ir.get_all_sub_nodes(ast.Architype))
+        self.assertEqual(VisitPass(ir, None).seen, ["ability"] * abilities)
+        self.assertEqual(OverridePass(ir, None).seen, ["override"] * abilities)
+
+        def exit_architype(self: VisitPass, node: ast.Architype) -> None:
+            self.seen.append("architype")
+
+        setattr(VisitPass, "exit_architype", exit_architype)  # noqa: B010
+        self.assertEqual(VisitPass(ir, None).seen.count("architype"), archs)
+        self.assertEqual(OverridePass(ir, None).seen.count("architype"), archs)
+        delattr(VisitPass, "exit_architype")  # noqa: B010
+        self.assertNotIn("architype", OverridePass(ir, None).seen)
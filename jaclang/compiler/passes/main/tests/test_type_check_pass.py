@@ -2,8 +2,11 @@
 
 from typing import List
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.compiler.passes.main.type_check_pass import JacTypeCheckPass
+from jaclang.settings import settings
 from jaclang.utils.lang_tools import AstTool
 from jaclang.utils.test import TestCase
 
@@ -62,3 +65,31 @@ class MypyTypeCheckPassTests(TestCase):
         self.assertEqual(out.count("Type: builtins.str"), 28)
         for i in lis:
             self.assertNotIn(i, out)
+
+    def test_incremental_type_check(self) -> None:
+        """Test unchanged modules are not checked again by a warm build."""
+
+        def check() -> tuple[list[str], list[str]]:
+            out = jac_file_to_pass(
+                file_path=self.fixture_abs_path("func.jac"),
+                schedule=py_code_gen_typed,
+            )
+            names = out.ir.get_all_sub_nodes(ast.Name)
+            return sorted(i.msg for i in out.warnings_had), [i.sym_type for i in names]
+
+        incremental = settings.incremental_type_check
+        settings.incremental_type_check = False
+        try:
+            cold = check()
+            settings.incremental_type_check = True
+            self.assertEqual(check(), cold)
+            (build,) = JacTypeCheckPass.mypy_builds.values()
+            states = dict(build.graph)
+            self.assertEqual(check(), cold)
+            self.assertEqual(list(JacTypeCheckPass.mypy_builds.values()), [build])
+            self.assertIn("func2", build.hashes)
+            for mod_id in [*build.hashes, "builtins"]:
+                self.assertIs(build.graph[mod_id], states[mod_id])
+        finally:
+            settings.incremental_type_check = incremental
+            JacTypeCheckPass.mypy_builds.clear()
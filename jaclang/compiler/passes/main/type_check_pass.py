@@ -2,21 +2,136 @@
 
 This is used to call mypy type checking into Jac files by integrating
 mypy apis into Jac and use jac py ast in it.
+
+The mypy cache of the Python modules Jac code depends on is kept in the compile
+cache directory, so it persists across runs. With incremental_type_check set,
+as the language server does, the build manager and the modules it loaded stay
+in memory between type checks. Jac modules are then only checked again when
+the hash of their generated Python AST or one of their dependencies changed,
+otherwise their Jac nodes are linked to the mypy nodes of the last check.
 """
 
+import ast as ast3
+import hashlib
 import os
 import pathlib
 import sys
 
 import jaclang.compiler.absyntree as ast
 import jaclang.compiler.passes.utils.mypy_ast_build as myab
-from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.cache import compile_cache
 from jaclang.compiler.passes import Pass
+from jaclang.settings import settings
+
+
+def py_ast_hash(module: ast.Module) -> str:
+    """Hash the generated Python AST of a module and its links to Jac nodes."""
+    tree = module.gen.py_ast[0]
+    digest = hashlib.sha256(ast3.dump(tree, include_attributes=True).encode())
+    digest.update(
+        bytes(min(len(getattr(i, "jac_link", [])), 255) for i in ast3.walk(tree))
+    )
+    return digest.hexdigest()
+
+
+def get_mtime(path: str) -> float:
+    """Get modification time of a file, -1 if it is missing."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return -1
+
+
+class MypyBuild:
+    """Mypy build manager kept between type checks with the modules it loaded."""
+
+    def __init__(
+        self,
+        options: myab.Options,
+        errors: myab.Errors,
+        manager: myab.BuildManager,
+    ) -> None:
+        """Initialize mypy build."""
+        self.options = options
+        self.errors = errors
+        self.manager = manager
+        self.graph: myab.Graph = {}
+        self.mtimes: dict[str, float] = {}
+        self.hashes: dict[str, str] = {}
+        self.links: dict[str, list[myab.myfp.Node]] = {}
+        self.messages: dict[str, list[tuple[str, myab.NodeKey]]] = {}
+
+    def reuse(self, cur_pass: "JacTypeCheckPass", modules: list[ast.Module]) -> None:
+        """Drop the states of changed modules and those depending on them."""
+        manager = self.manager
+        self.errors.cur_pass = cur_pass
+        self.errors.reset()
+        self.errors.reported = {}
+        manager.flush_errors = cur_pass.default_message_cb
+        manager.fscache.flush()
+        manager.find_module_cache.clear()
+        manager.missing_modules.clear()
+        manager.rechecked_modules.clear()
+        myab.mypy_to_jac_node_map.clear()
+        hashes = {i.name: py_ast_hash(i) for i in modules}
+        paths = {i.name: "File:" + i.loc.mod_path for i in modules}
+
+        def is_fresh(mod_id: str, st: myab.myb.State) -> bool:
+            """Check a kept state was built from the current module source."""
+            if mod_id not in manager.modules:
+                return False
+            if mod_id in hashes:
+                return (
+                    self.hashes.get(mod_id) == hashes[mod_id]
+                    and st.xpath == paths[mod_id]
+                )
+            if mod_id in self.hashes:
+                return False
+            return self.mtimes.get(st.xpath) == get_mtime(st.xpath)
+
+        kept = {mod_id: st for mod_id, st in self.graph.items() if is_fresh(mod_id, st)}
+        changed = True
+        while changed:
+            changed = False
+            for mod_id, st in list(kept.items()):
+                if any(
+                    dep in self.graph and dep not in kept
+                    for dep in st.dependencies + (st.ancestors or [])
+                ):
+                    del kept[mod_id]
+                    changed = True
+        for mod_id in self.graph.keys() - kept.keys():
+            manager.modules.pop(mod_id, None)
+            manager.ast_cache.pop(mod_id, None)
+        self.graph = kept
+        self.hashes = hashes
+
+    def update(self, graph: myab.Graph, links: dict[str, list]) -> None:
+        """Keep the states, links and messages of the last check."""
+        self.messages = {
+            mod_id: (
+                self.messages.get(mod_id, [])
+                if mod_id in self.graph
+                else self.errors.reported.get(graph[mod_id].xpath, [])
+            )
+            for mod_id in self.hashes
+        }
+        self.graph = graph
+        self.links = links
+        self.mtimes = {
+            st.xpath: get_mtime(st.xpath)
+            for mod_id, st in graph.items()
+            if mod_id not in self.hashes
+        }
 
 
 class JacTypeCheckPass(Pass):
     """Python and bytecode file printing pass."""
 
+    # warm builds by mypy path, which differs for modules in other directories
+    mypy_builds: dict[tuple[str, ...], MypyBuild] = {}
+    max_mypy_builds = 4
+
     def before_pass(self) -> None:
         """Before pass."""
         self.__path = (
@@ -36,6 +151,7 @@ class JacTypeCheckPass(Pass):
         try:
             self.api(os.path.dirname(self.ir.loc.mod_path))
         except Exception as e:
+            JacTypeCheckPass.mypy_builds.clear()
             self.error(f"Unable to run type checking: {e}")
         return super().after_pass()
 
@@ -44,21 +160,8 @@ class JacTypeCheckPass(Pass):
     ) -> None:
         """Mypy errors reporter."""
 
-    def api(self, top_module_path: str = "") -> None:
-        """Call mypy APIs to implement type checking in Jac."""
-        # Creating mypy api objects
-        options = myab.myb.Options()
-        options.ignore_missing_imports = True
-        options.cache_dir = Con.JAC_MYPY_CACHE
-        options.mypy_path = [
-            str(
-                pathlib.Path(os.path.dirname(__file__)).parent.parent.parent.parent
-                / "stubs"
-            )
-        ]
-        if top_module_path != "":
-            options.mypy_path.append(top_module_path)
-
+    def new_build(self, options: myab.Options) -> MypyBuild:
+        """Create mypy api objects."""
         errors = myab.Errors(self, options)
         fs_cache = myab.FileSystemCache()
         search_paths = myab.compute_search_paths([], options, str(self.__path))
@@ -80,17 +183,53 @@ class JacTypeCheckPass(Pass):
             stdout=sys.stdout,
             stderr=sys.stderr,
         )
+        return MypyBuild(options, errors, manager)
+
+    def api(self, top_module_path: str = "") -> None:
+        """Call mypy APIs to implement type checking in Jac."""
+        options = myab.myb.Options()
+        options.ignore_missing_imports = True
+        options.cache_dir = os.path.join(compile_cache.cache_dir, "mypy")
+        options.mypy_path = [
+            str(
+                pathlib.Path(os.path.dirname(__file__)).parent.parent.parent.parent
+                / "stubs"
+            )
+        ]
+        if top_module_path != "":
+            options.mypy_path.append(top_module_path)
+
+        builds = JacTypeCheckPass.mypy_builds
+        key = tuple(options.mypy_path)
+        build = builds.pop(key, None)
+        if not settings.incremental_type_check:
+            builds.clear()
+            build = self.new_build(options)
+        else:
+            build = build or self.new_build(options)
+            build.reuse(self, self.__modules)
+            builds[key] = build
+            while len(builds) > JacTypeCheckPass.max_mypy_builds:
+                builds.pop(next(iter(builds)))
+        manager = build.manager
+        kept = set(build.graph)
 
-        mypy_graph: myab.Graph = {}
+        mypy_graph: myab.Graph = dict(build.graph)
         new_modules = []
+        links: dict[str, list] = {}
         for module in self.__modules:
-            tree = myab.ASTConverter(
-                options=options,
+            converter = myab.ASTConverter(
+                options=build.options,
                 is_stub=False,
-                errors=errors,
+                errors=build.errors,
                 strip_function_bodies=False,
                 path=module.loc.mod_path,
-            ).visit(module.gen.py_ast[0])
+                reuse=build.links[module.name] if module.name in kept else None,
+            )
+            tree = converter.visit(module.gen.py_ast[0])
+            links[module.name] = converter.links
+            if module.name in kept:
+                continue
 
             st = myab.State(
                 id=module.name,
@@ -105,13 +244,12 @@ class JacTypeCheckPass(Pass):
 
         if not isinstance(self.ir, ast.Module):
             raise self.ice("Expected module node. Impossible")
+        builtins = myab.BuildSource(
+            path=str(self.__path / "typeshed" / "stdlib" / "builtins.pyi"),
+            module="builtins",
+        )
         mypy_graph = myab.load_graph(
-            [
-                myab.BuildSource(
-                    path=str(self.__path / "typeshed" / "stdlib" / "builtins.pyi"),
-                    module="builtins",
-                ),
-            ],
+            [builtins] if "builtins" not in mypy_graph else [],
             manager,
             old_graph=mypy_graph,
             new_modules=new_modules,  # To parse the dependancies of modules
@@ -122,4 +260,11 @@ class JacTypeCheckPass(Pass):
                 self.ir.py_mod_dep_map[j] = str(
                     myab.find_module_with_reason(j, manager)
                 )
-        myab.process_graph(mypy_graph, manager)
+        if stale := myab.StaleGraph(mypy_graph, kept):
+            myab.process_graph(stale, manager)
+        for mod_id in kept & build.messages.keys():
+            for msg, loc in build.messages[mod_id]:
+                if loc in myab.mypy_to_jac_node_map:
+                    self.warning(msg, node_override=myab.mypy_to_jac_node_map[loc][0])
+        if settings.incremental_type_check:
+            build.update(mypy_graph, links)
@@ -36,9 +36,8 @@ if TYPE_CHECKING:
     from mypy.report import Reports  # Avoid unconditional slow import
 
 
-mypy_to_jac_node_map: dict[
-    tuple[int, int | None, int | None, int | None], list[AstNode]
-] = {}
+NodeKey = tuple[int, int | None, int | None, int | None]
+mypy_to_jac_node_map: dict[NodeKey, list[AstNode]] = {}
 
 
 class BuildManager(myb.BuildManager):
@@ -444,7 +443,23 @@ class State(myb.State):
 
 
 class ASTConverter(myfp.ASTConverter):
-    """Overrides to mypy AST converter for direct AST pass through."""
+    """Overrides to mypy AST converter for direct AST pass through.
+
+    The mypy nodes linked to Jac nodes are recorded in links in the order they
+    are converted. When given the links of an earlier conversion of the same
+    Python AST, the Jac nodes are linked to those mypy nodes instead.
+    """
+
+    def __init__(
+        self,
+        *args,  # noqa: ANN002
+        reuse: list[myfp.Node] | None = None,
+        **kwargs,  # noqa: ANN003
+    ) -> None:
+        """Override to mypy AST converter for direct AST pass through."""
+        super().__init__(*args, **kwargs)
+        self.links: list[myfp.Node] = []
+        self.reuse = reuse
 
     def visit(self, node: ast.AST | None) -> myfp.Any:  # noqa: ANN401
         """Override to mypy AST converter for direct AST pass through."""
@@ -471,6 +486,9 @@ class ASTConverter(myfp.ASTConverter):
     ) -> None:
         """Link mypy AST node to Jac AST node."""
         if hasattr(node, "jac_link"):
+            if self.reuse is not None:
+                ret = self.reuse[len(self.links)]
+            self.links.append(ret)
             for i in range(len(node.jac_link)):
                 node.jac_link[i].gen.mypy_ast.append(ret)
             mypy_to_jac_node_map[
@@ -486,6 +504,7 @@ class Errors(mye.Errors):
     def __init__(self, cur_pass: Pass, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
         """Override to mypy errors for direct AST pass through."""
         self.cur_pass = cur_pass
+        self.reported: dict[str, list[tuple[str, NodeKey]]] = {}
         super().__init__(*args, **kwargs)
 
     def report(
@@ -522,6 +541,9 @@ class Errors(mye.Errors):
             end_column=end_column,
         )
         if (line, column, end_line, end_column) in mypy_to_jac_node_map:
+            self.reported.setdefault(file or self.file, []).append(
+                (message, (line, column, end_line, end_column))
+            )
             self.cur_pass.warning(
                 msg=message,
                 node_override=mypy_to_jac_node_map[
@@ -530,6 +552,19 @@ class Errors(mye.Errors):
             )
 
 
+class StaleGraph(dict):
+    """Modules of a graph to process, looking up the loaded ones in the graph."""
+
+    def __init__(self, graph: Graph, loaded: set[str]) -> None:
+        """Initialize stale graph."""
+        super().__init__((i, st) for i, st in graph.items() if i not in loaded)
+        self.graph = graph
+
+    def __missing__(self, key: str) -> myb.State:
+        """Get a loaded module, semantic analysis looks up builtins this way."""
+        return self.graph[key]
+
+
 def load_graph(
     sources: list[BuildSource],
     manager: BuildManager,
@@ -704,6 +739,7 @@ def load_graph(
 
 __all__ = [
     "BuildManager",
+    "NodeKey",
     "State",
     "BuildSource",
     "BuildSourceSet",
@@ -713,6 +749,7 @@ __all__ = [
     "load_graph",
     "load_plugins",
     "process_graph",
+    "StaleGraph",
     "Errors",
     "Options",
     "ASTConverter",
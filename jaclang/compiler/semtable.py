@@ -2,31 +2,99 @@
 
 This module contains classes and functions for managing the registry of
 semantic information.
+
+The registry is indexed by the string form of each scope, with the entries of
+a scope indexed by name and type, so adding and looking up entries doesn't
+scan the registry. When pickled only the scopes and the name, type, semstr,
+node type and node location of the entries are kept instead of the AST nodes
+they point to. The node of a loaded entry is found again from its location on
+first access, parsing its module once.
+
+At runtime registries are loaded through registry_cache, which keeps each
+loaded registry until its file changes along with the answers resolved from it.
 """
 
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+import os
+import pickle
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Mapping,
+    Optional,
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     import jaclang.compiler.absyntree as ast
 
+T = TypeVar("T")
+
 
 class SemInfo:
     """Semantic information class."""
 
+    # module path -> (mtime, parsed module) for nodes of loaded entries
+    parsed: ClassVar[dict[str, tuple[int, ast.AstNode]]] = {}
+
     def __init__(
         self,
-        node: ast.AstNode,
+        node: Optional[ast.AstNode],
         name: str,
         type: Optional[str] = None,
         semstr: str = "",
+        node_type: str = "",
+        node_loc: Optional[tuple[str, int]] = None,
     ) -> None:
         """Initialize the class."""
-        self.node = node
+        self._node = node
         self.name = name
         self.type = type
         self.semstr = semstr
+        self.node_type = node_type or (node.__class__.__name__ if node else "")
+        self.node_loc = node_loc or (
+            (node.loc.mod_path, node.loc.pos_start) if node else None
+        )
+
+    @property
+    def node(self) -> Optional[ast.AstNode]:
+        """Get the node, found again from its location for loaded entries."""
+        if self._node is None and self.node_loc:
+            self._node = self.find_node(self.node_type, *self.node_loc)
+        return self._node
+
+    @node.setter
+    def node(self, node: Optional[ast.AstNode]) -> None:
+        """Set the node."""
+        self._node = node
+
+    @classmethod
+    def find_node(
+        cls, node_type: str, mod_path: str, pos: int
+    ) -> Optional[ast.AstNode]:
+        """Find the node of a type starting at a position of a module."""
+        import jaclang.compiler.absyntree as ast
+        from jaclang.compiler.compile import jac_file_to_pass
+
+        typ = getattr(ast, node_type, None)
+        if not (isinstance(typ, type) and issubclass(typ, ast.AstNode)):
+            return None
+        try:
+            mtime = os.stat(mod_path).st_mtime_ns
+        except OSError:
+            return None
+        if (cached := cls.parsed.get(mod_path)) is None or cached[0] != mtime:
+            cached = cls.parsed[mod_path] = (
+                mtime,
+                jac_file_to_pass(mod_path, schedule=[]).ir,
+            )
+        for node in cached[1].get_all_sub_nodes(typ):
+            if node.loc.pos_start == pos and node.loc.mod_path == mod_path:
+                return node
+        return None
 
     def __repr__(self) -> str:
         """Return the string representation of the class."""
@@ -40,9 +108,18 @@ class SemInfo:
         self_scope = str(scope) + f".{self.name}({self.type})"
         _, children = sem_registry.lookup(scope=SemScope.get_scope_from_str(self_scope))
         if filter and children and isinstance(children, list):
-            return [i for i in children if isinstance(i.node, filter)]
+            return [i for i in children if i.is_node_of(filter)]
         return children if children and isinstance(children, list) else []
 
+    def is_node_of(self, filter: type[ast.AstNode]) -> bool:
+        """Check the node type, also for entries loaded without their node."""
+        if self._node is not None:
+            return isinstance(self._node, filter)
+        import jaclang.compiler.absyntree as ast
+
+        node_type = getattr(ast, self.node_type, None)
+        return isinstance(node_type, type) and issubclass(node_type, filter)
+
 
 class SemScope:
     """Scope class."""
@@ -98,16 +175,39 @@ class SemRegistry:
     def __init__(self) -> None:
         """Initialize the class."""
         self.registry: dict[SemScope, list[SemInfo]] = {}
+        self.scopes: dict[str, SemScope] = {}
+        self.order: dict[str, int] = {}
+        self.names: dict[str, dict[str, SemInfo]] = {}
+        self.types: dict[str, dict[str, SemInfo]] = {}
+        # first entry of each name/type over all scopes, with its scope order
+        self.all_names: dict[str, tuple[int, SemScope, SemInfo]] = {}
+        self.all_types: dict[str, tuple[int, SemScope, SemInfo]] = {}
 
     def add(self, scope: SemScope, seminfo: SemInfo) -> None:
         """Add semantic information to the registry."""
-        for k in self.registry.keys():
-            if str(k) == str(scope):
-                scope = k
-                break
+        self._add(str(scope), scope, seminfo)
+
+    def _add(self, key: str, scope: SemScope, seminfo: SemInfo) -> None:
+        """Add semantic information under the scope string key."""
+        if key in self.scopes:
+            scope = self.scopes[key]
         else:
+            self.order[key] = len(self.scopes)
+            self.scopes[key] = scope
             self.registry[scope] = []
+            self.names[key] = {}
+            self.types[key] = {}
         self.registry[scope].append(seminfo)
+        self.names[key].setdefault(seminfo.name, seminfo)
+        if seminfo.type is not None:
+            self.types[key].setdefault(seminfo.type, seminfo)
+        order = self.order[key]
+        for index, attr in (
+            (self.all_names, seminfo.name),
+            (self.all_types, seminfo.type),
+        ):
+            if attr is not None and (attr not in index or index[attr][0] > order):
+                index[attr] = (order, scope, seminfo)
 
     def lookup(
         self,
@@ -117,30 +217,69 @@ class SemRegistry:
     ) -> tuple[Optional[SemScope], Optional[SemInfo | list[SemInfo]]]:
         """Lookup semantic information in the registry."""
         if scope:
-            for k, v in self.registry.items():
-                if str(k) == str(scope):
-                    if name:
-                        for i in v:
-                            if i.name == name:
-                                return k, i
-                    elif type:
-                        for i in v:
-                            if i.type == type:
-                                return k, i
-                    else:
-                        return k, v
-        else:
-            for k, v in self.registry.items():
+            key = str(scope)
+            if key in self.scopes:
+                k = self.scopes[key]
                 if name:
-                    for i in v:
-                        if i.name == name:
-                            return k, i
+                    if name in self.names[key]:
+                        return k, self.names[key][name]
                 elif type:
-                    for i in v:
-                        if i.type == type:
-                            return k, i
+                    if type in self.types[key]:
+                        return k, self.types[key][type]
+                else:
+                    return k, self.registry[k]
+        elif name:
+            if name in self.all_names:
+                return self.all_names[name][1:]
+        elif type and type in self.all_types:
+            return self.all_types[type][1:]
         return None, None
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Keep the scopes and entries with node locations instead of nodes."""
+        return {
+            "scopes": [
+                (
+                    self._chain(k),
+                    [(i.name, i.type, i.semstr, i.node_type, i.node_loc) for i in v],
+                )
+                for k, v in self.registry.items()
+            ]
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Rebuild the registry and its indexes."""
+        SemRegistry.__init__(self)
+        if "scopes" not in state:  # pickled with the nodes by an older version
+            for k, v in state["registry"].items():
+                for i in v:
+                    node = i.__dict__.get("node")
+                    self.add(k, SemInfo(node, i.name, i.type, i.semstr))
+            return
+        scopes: dict[tuple[tuple[str, str], ...], SemScope] = {}
+        for chain, infos in state["scopes"]:
+            for i, (name, typ) in enumerate(chain):
+                if chain[: i + 1] not in scopes:
+                    scopes[chain[: i + 1]] = SemScope(name, typ, scopes.get(chain[:i]))
+            scope = scopes[chain]
+            key = ".".join(f"{name}({typ})" for name, typ in chain)
+            for name, typ, semstr, node_type, *node_loc in infos:
+                self._add(
+                    key,
+                    scope,
+                    SemInfo(None, name, typ, semstr, node_type, *node_loc),
+                )
+
+    @staticmethod
+    def _chain(scope: SemScope) -> tuple[tuple[str, str], ...]:
+        """Get the (scope, type) pairs from the outermost scope to scope."""
+        chain: list[tuple[str, str]] = []
+        node: Optional[SemScope] = scope
+        while node:
+            chain.append((node.scope, node.type))
+            node = node.parent
+        return tuple(reversed(chain))
+
     @property
     def module_scope(self) -> SemScope:
         """Get the module scope."""
@@ -157,3 +296,70 @@ class SemRegistry:
             for i in v:
                 ret_str += f"  {i.name} {i.type} {i.semstr}\n"
         return ret_str
+
+
+class RegistryCache:
+    """Process wide cache of the registries saved for Jac modules."""
+
+    def __init__(self) -> None:
+        """Initialize registry cache."""
+        # registry path -> (mtime, registry, resolved answers)
+        self.entries: dict[str, tuple[int, SemRegistry, dict[tuple, Any]]] = {}
+        # pickled registries by Jac module path, e.g. from bytecode bundles
+        self.bundled: list[Mapping[str, bytes]] = []
+
+    @staticmethod
+    def registry_path(file_loc: str) -> str:
+        """Get the path of the registry saved for a Jac module."""
+        return os.path.join(
+            os.path.dirname(file_loc),
+            "__jac_gen__",
+            os.path.basename(file_loc).replace(".jac", ".registry.pkl"),
+        )
+
+    def get(self, file_loc: str) -> SemRegistry:
+        """Get the registry of a Jac module, reloading it if it changed."""
+        return self.get_entry(file_loc)[1]
+
+    def get_entry(self, file_loc: str) -> tuple[int, SemRegistry, dict[tuple, Any]]:
+        """Get the cache entry of a Jac module, reloading it if it changed."""
+        path = self.registry_path(file_loc)
+        entry = self.entries.get(path)
+        if entry and entry[0] < 0:
+            return entry
+        for registries in self.bundled:
+            if file_loc in registries:
+                entry = (-1, pickle.loads(registries[file_loc]), {})
+                self.entries[path] = entry
+                return entry
+        mtime = os.stat(path).st_mtime_ns
+        if not entry or entry[0] != mtime:
+            with open(path, "rb") as f:
+                entry = (mtime, pickle.load(f), {})
+            self.entries[path] = entry
+        return entry
+
+    def resolve(
+        self, file_loc: str, key: tuple, resolver: Callable[[SemRegistry], T]
+    ) -> T:
+        """Resolve key against the registry of a Jac module, memoized."""
+        _, registry, answers = self.get_entry(file_loc)
+        if key not in answers:
+            answers[key] = resolver(registry)
+        return answers[key]
+
+    def remove_bundled(self, registries: Mapping[str, bytes]) -> None:
+        """Drop the registries of a bundle and the entries loaded from them."""
+        self.bundled = [i for i in self.bundled if i is not registries]
+        for file_loc in registries:
+            path = self.registry_path(file_loc)
+            if path in self.entries and self.entries[path][0] < 0:
+                del self.entries[path]
+
+    def clear(self) -> None:
+        """Drop all loaded registries."""
+        self.entries.clear()
+        self.bundled.clear()
+
+
+registry_cache = RegistryCache()
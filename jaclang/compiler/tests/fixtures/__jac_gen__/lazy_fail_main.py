@@ -0,0 +1,12 @@
+"""Module using a lazily imported module that fails to run."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import lazy_fail_mod
+else:
+    lazy_fail_mod, = __jac_import__(target='lazy_fail_mod', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={})
+try:
+    print(lazy_fail_mod.value)
+except ValueError as e:
+    print('caught', e)
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""Module raising while it is executed."""
+from __future__ import annotations
+value = 5
+raise ValueError('lazy_fail_mod broken')
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""Module importing a module used after it starts running."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import lazy_mod
+else:
+    lazy_mod, = __jac_import__(target='lazy_mod', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={})
+print('main running')
+print(lazy_mod.value)
\ No newline at end of file
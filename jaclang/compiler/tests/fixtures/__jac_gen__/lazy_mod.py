@@ -0,0 +1,4 @@
+"""Module reporting when it is executed."""
+from __future__ import annotations
+value = 5
+print('lazy_mod running')
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Tests for the persistent compile cache."""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from jaclang.compiler.cache import CompileCache
+from jaclang.compiler.compile import compile_jac
+from jaclang.compiler.semtable import RegistryCache
+from jaclang.utils.test import TestCase
+
+
+class TestCompileCache(TestCase):
+    """Test compile cache."""
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = CompileCache(os.path.join(self.tmp_dir, "cache"))
+        self.src_dir = os.path.join(self.tmp_dir, "src")
+        os.makedirs(self.src_dir)
+        self.write("dep.jac", "glob x = 1;\n")
+        self.write("main.jac", "import:jac dep;\n\nwith entry { print(dep.x); }\n")
+
+    def tearDown(self) -> None:
+        """Tear down test."""
+        shutil.rmtree(self.tmp_dir)
+        super().tearDown()
+
+    def write(self, name: str, content: str, src_dir: str = "") -> str:
+        """Write source file."""
+        path = os.path.join(src_dir or self.src_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def compile(self, file_path: str) -> None:
+        """Compile module and store it in the cache."""
+        result = compile_jac(file_path)
+        self.assertFalse(result.errors_had)
+        self.cache.store(result.ir)
+
+    def test_cache_hit_and_dependency_invalidation(self) -> None:
+        """Test cached code is dropped when a dependency or annex changes."""
+        main = os.path.join(self.src_dir, "main.jac")
+        self.assertIsNone(self.cache.load(main))
+        self.compile(main)
+        self.assertEqual(self.cache.load(main).co_filename, main)
+
+        self.write("dep.jac", "glob x = 2;\n")
+        self.assertIsNone(self.cache.load(main))
+        self.write("dep.jac", "glob x = 1;\n")
+        self.assertIsNotNone(self.cache.load(main))
+
+        self.write("main.impl.jac", "")
+        self.assertIsNone(self.cache.load(main))
+
+    def test_cache_shared_across_checkouts(self) -> None:
+        """Test cached code is relocated to the module loading it."""
+        self.compile(os.path.join(self.src_dir, "main.jac"))
+        other_dir = shutil.copytree(self.src_dir, os.path.join(self.tmp_dir, "other"))
+        code = self.cache.load(os.path.join(other_dir, "main.jac"))
+        self.assertEqual(code.co_filename, os.path.join(other_dir, "main.jac"))
+        for _, _, files in os.walk(self.cache.cache_dir):
+            self.assertFalse([f for f in files if f.endswith(".tmp")])
+
+    def test_registry_restored_and_entry_removed(self) -> None:
+        """Test a hit restores the module registry and entries can be removed."""
+        main = os.path.join(self.src_dir, "main.jac")
+        self.compile(main)
+        registry_path = RegistryCache.registry_path(main)
+        os.remove(registry_path)
+        self.assertIsNotNone(self.cache.load(main))
+        self.assertTrue(os.path.exists(registry_path))
+
+        self.assertTrue(self.cache.remove(main))
+        self.assertIsNone(self.cache.load(main))
+        self.assertFalse(self.cache.remove(main))
+
+    def test_unchanged_store_skips_writes(self) -> None:
+        """Test storing an unchanged module does not rewrite its entry."""
+        main = os.path.join(self.src_dir, "main.jac")
+        self.compile(main)
+        with patch.object(CompileCache, "write") as write:
+            self.compile(main)
+            write.assert_not_called()
+            self.write("dep.jac", "glob x = 2;\n")
+            self.compile(main)
+            write.assert_called()
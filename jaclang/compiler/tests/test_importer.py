@@ -5,7 +5,10 @@ import sys
 
 from jaclang import jac_import
 from jaclang.cli import cli
+from jaclang.compiler.semtable import registry_cache
+from jaclang.runtimelib.importer import LazyModule
 from jaclang.runtimelib.machine import JacMachine, JacProgram
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 
@@ -37,6 +40,18 @@ class TestLoader(TestCase):
         )
         JacMachine.detach()
 
+    def test_bundled_registries_detached(self) -> None:
+        """Test bundle registries are dropped with the program holding them."""
+        registries = {self.fixture_abs_path("hello_world.jac"): b""}
+        machine = JacMachine(self.fixture_abs_path(__file__))
+        machine.attach_program(JacProgram(None, None, registries=registries))
+        self.assertEqual(registry_cache.bundled, [registries])
+        machine.attach_program(JacProgram(None, None, registries=dict(registries)))
+        self.assertEqual(len(registry_cache.bundled), 1)
+        self.assertIsNot(registry_cache.bundled[0], registries)
+        JacMachine.detach()
+        self.assertEqual(registry_cache.bundled, [])
+
     def test_jac_py_import(self) -> None:
         """Basic test for pass."""
         captured_output = io.StringIO()
@@ -62,3 +77,32 @@ class TestLoader(TestCase):
             "{SomeObj(a=10): 'check'} [MyObj(apple=5, banana=7), MyObj(apple=5, banana=7)]",
             stdout_value,
         )
+
+    def test_lazy_import(self) -> None:
+        """Test imported modules run on first use with lazy imports."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        settings.lazy_import = True
+        try:
+            cli.run(self.fixture_abs_path("lazy_main.jac"))
+        finally:
+            settings.lazy_import = False
+            sys.stdout = sys.__stdout__
+        self.assertEqual(
+            captured_output.getvalue().split(),
+            ["main", "running", "lazy_mod", "running", "5"],
+        )
+        self.assertNotIsInstance(sys.modules["lazy_mod"], LazyModule)
+
+    def test_lazy_import_failure(self) -> None:
+        """Test a lazily imported module that raises is not left loaded."""
+        captured_output = io.StringIO()
+        sys.stdout = captured_output
+        settings.lazy_import = True
+        try:
+            cli.run(self.fixture_abs_path("lazy_fail_main.jac"))
+        finally:
+            settings.lazy_import = False
+            sys.stdout = sys.__stdout__
+        self.assertIn("caught lazy_fail_mod broken", captured_output.getvalue())
+        self.assertNotIn("lazy_fail_mod", sys.modules)
@@ -3,26 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Sequence
 
 import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import CompileCache
 from jaclang.compiler.compile import jac_str_to_pass
 from jaclang.compiler.parser import JacParser
 from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
 from jaclang.compiler.passes.tool import FuseCommentsPass, JacFormatPass
+from jaclang.compiler.symtable import Symbol
+from jaclang.langserve.incremental import IncrementalParser
+from jaclang.langserve.indexer import (
+    Span,
+    SymbolIndex,
+    get_key,
+    get_span,
+    is_annex_path,
+    resolve_decl,
+    span_range,
+)
 from jaclang.langserve.sem_manager import SemTokManager
 from jaclang.langserve.utils import (
     add_unique_text_edit,
     collect_all_symbols_in_scope,
     create_range,
-    find_deepest_symbol_node_at_pos,
-    find_index,
+    debounce,
     gen_diagnostics,
     get_location_range,
+    get_module_deps,
+    get_module_owner,
     get_symbols_for_outline,
     parse_symbol_path,
     resolve_completion_symbol_table,
@@ -40,10 +57,12 @@ class ModuleInfo:
         self,
         ir: ast.Module,
         impl_parent: Optional[ModuleInfo] = None,
+        key: str = "",
     ) -> None:
         """Initialize module info."""
         self.ir = ir
         self.impl_parent: Optional[ModuleInfo] = impl_parent
+        self.key = key  # hash of the sources the module was built from
         self.sem_manager = SemTokManager(ir=ir)
 
     @property
@@ -61,41 +80,133 @@ class JacLangServer(LanguageServer):
         self.modules: dict[str, ModuleInfo] = {}
         self.executor = ThreadPoolExecutor()
         self.tasks: dict[str, asyncio.Task] = {}
+        self.index = SymbolIndex()
+        self.index_path: Optional[str] = None
+        self.index_queue: dict[str, None] = {}
+        self.indexer: Optional[Future] = None
+        self.queue_lock = threading.Lock()
+        self.build_lock = threading.Lock()
+        self.parsers: dict[str, IncrementalParser] = {}
+        self.dependencies: dict[str, set[str]] = {}
+        self.closures: dict[str, frozenset[str]] = {}
+        self.checked: dict[str, tuple[str, Pass]] = {}
+        self.file_hashes: dict[str, tuple[int, Optional[str]]] = {}
+        self.sem_token_results: dict[str, tuple[str, list[int]]] = {}
+        self.sem_token_ids = itertools.count()
 
     def update_modules(
         self, file_path: str, build: Pass, refresh: bool = False
     ) -> None:
-        """Update modules."""
+        """Update modules, keeping those built from unchanged sources."""
         if not isinstance(build.ir, ast.Module):
             self.log_error("Error with module build.")
             return
+        with self.build_lock:
+            for mod in [build.ir, *build.ir.mod_deps.values()]:
+                deps = get_module_deps(mod)
+                if self.dependencies.get(path := mod.loc.mod_path) != deps:
+                    self.dependencies[path] = deps
+                    # only closures reaching the module change with its imports
+                    self.closures = {
+                        i: closure
+                        for i, closure in self.closures.items()
+                        if path not in closure
+                    }
         keep_parent = (
             self.modules[file_path].impl_parent if file_path in self.modules else None
         )
-        self.modules[file_path] = ModuleInfo(ir=build.ir, impl_parent=keep_parent)
-        for p in build.ir.mod_deps.keys():
+        document = self.workspace.get_text_document(file_path)
+        self.modules[file_path] = ModuleInfo(
+            ir=build.ir,
+            impl_parent=keep_parent,
+            key=self.get_key(build.ir.loc.mod_path, document.source),
+        )
+        for p, mod in build.ir.mod_deps.items():
             uri = uris.from_fs_path(p)
-            if file_path != uri:
-                self.modules[uri] = ModuleInfo(
-                    ir=build.ir.mod_deps[p],
-                    impl_parent=self.modules[file_path],
-                )
-
-    def quick_check(self, file_path: str) -> bool:
-        """Rebuild a file."""
-        try:
-            document = self.workspace.get_text_document(file_path)
-            build = jac_str_to_pass(
-                jac_str=document.source, file_path=document.path, schedule=[]
+            if file_path == uri:
+                continue
+            key = self.get_key(p)
+            if uri in self.modules and self.modules[uri].key == key:
+                continue
+            owner = get_module_owner(mod)
+            self.modules[uri] = ModuleInfo(
+                ir=mod,
+                impl_parent=(
+                    self.modules.get(uris.from_fs_path(owner.loc.mod_path))
+                    if owner
+                    else None
+                ),
+                key=key,
             )
-            self.publish_diagnostics(
-                file_path,
-                gen_diagnostics(file_path, build.errors_had, build.warnings_had),
+
+    def get_key(self, path: str, source: Optional[str] = None) -> str:
+        """Hash sources of a module and the modules it depends on."""
+        digest = hashlib.sha256()
+        for i in sorted(self.get_closure(path)):
+            file_hash = (
+                hashlib.sha256(source.encode()).hexdigest()
+                if i == path and source is not None
+                else self.hash_file(i)
             )
-            return len(build.errors_had) == 0
-        except Exception as e:
-            self.log_error(f"Error during syntax check: {e}")
-            return False
+            digest.update(f"{i}\0{file_hash}\0".encode())
+        return digest.hexdigest()
+
+    def get_closure(self, path: str) -> frozenset[str]:
+        """Get a module and the modules it depends on, directly or not."""
+        with self.build_lock:
+            if (closure := self.closures.get(path)) is None:
+                found, stack = set(), [path]
+                while stack:
+                    if (cur := stack.pop()) not in found:
+                        found.add(cur)
+                        stack.extend(self.dependencies.get(cur, ()))
+                closure = self.closures[path] = frozenset(found)
+        return closure
+
+    def hash_file(self, path: str) -> Optional[str]:
+        """Hash a file, reusing the last hash while its mtime is unchanged."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        with self.build_lock:
+            cached = self.file_hashes.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        file_hash = CompileCache.hash_file(path)
+        with self.build_lock:
+            self.file_hashes[path] = (mtime, file_hash)
+        return file_hash
+
+    def get_dependents(self, path: str) -> set[str]:
+        """Get modules depending on a module, directly or through others."""
+        with self.build_lock:
+            dependencies = list(self.dependencies.items())
+        found, stack = set(), [path]
+        while stack:
+            cur = stack.pop()
+            for mod, deps in dependencies:
+                if cur in deps and mod not in found:
+                    found.add(mod)
+                    stack.append(mod)
+        found.discard(path)
+        return found
+
+    def check_dependents(self, path: str) -> list[Future]:
+        """Check open modules depending on a module again in the background."""
+        return [
+            self.executor.submit(self.deep_check, uri)
+            for dep in sorted(self.get_dependents(path))
+            if (uri := uris.from_fs_path(dep)) in self.workspace.text_documents
+        ]
+
+    def record_changes(
+        self, uri: str, changes: Sequence[lspt.TextDocumentContentChangeEvent]
+    ) -> None:
+        """Record changes of a document for its next syntax check."""
+        if uri not in self.parsers:
+            self.parsers[uri] = IncrementalParser(uri)
+        self.parsers[uri].changes.extend(changes)
 
     def deep_check(self, file_path: str, annex_view: Optional[str] = None) -> bool:
         """Rebuild a file and its dependencies."""
@@ -108,12 +219,33 @@ class JacLangServer(LanguageServer):
                 return self.deep_check(
                     uris.from_fs_path(parent.ir.loc.mod_path), annex_view=file_path
                 )
-            build = jac_str_to_pass(
-                jac_str=document.source,
-                file_path=document.path,
-                schedule=py_code_gen_typed,
-            )
-            self.update_modules(file_path, build)
+            if not annex_view and (base := self.index.annexes.get(document.path)):
+                return self.deep_check(uris.from_fs_path(base), annex_view=file_path)
+            key = self.get_key(document.path, document.source)
+            with self.build_lock:
+                checked = self.checked.get(file_path)
+            if checked and checked[0] == key and file_path in self.modules:
+                build, built = checked[1], False
+            else:
+                build = jac_str_to_pass(
+                    jac_str=document.source,
+                    file_path=document.path,
+                    schedule=py_code_gen_typed,
+                )
+                built = True
+                self.update_modules(file_path, build)
+                with self.build_lock:
+                    self.checked[file_path] = (self.modules[file_path].key, build)
+            if built:
+                if isinstance(build.ir, ast.Module):
+                    self.queue_index(self.index.add_module(build.ir))
+                self.log_py(
+                    "PROFILE: Pass timings: "
+                    + ", ".join(f"{i} {t:.3f}s" for i, t in build.timings)
+                )
+                self.check_dependents(document.path)
+            else:
+                self.log_py(f"Sources of {file_path} unchanged since last check.")
             if discover := self.modules[file_path].ir.annexable_by:
                 return self.deep_check(
                     uris.from_fs_path(discover), annex_view=file_path
@@ -142,11 +274,25 @@ class JacLangServer(LanguageServer):
             self.log_error(f"Error during deep check: {e}")
             return False
 
+    @debounce(0.3)
     async def launch_quick_check(self, uri: str) -> None:
-        """Analyze and publish diagnostics."""
-        await asyncio.get_event_loop().run_in_executor(
-            self.executor, self.quick_check, uri
-        )
+        """Parse changed parts of a document and publish diagnostics."""
+        if not (parser := self.parsers.get(uri)):
+            return
+        async with parser.lock:
+            changes = parser.changes[:]
+            source = self.workspace.get_text_document(uri).source
+            try:
+                parser.segments = await asyncio.get_event_loop().run_in_executor(
+                    self.executor, parser.reparse, source, changes
+                )
+                failed = False
+            except Exception as e:
+                self.log_error(f"Error during syntax check: {e}")
+                parser.segments, failed = [], True
+            del parser.changes[: len(changes)]
+        if not parser.changes and not failed:
+            self.publish_diagnostics(uri, parser.diagnostics())
 
     async def launch_deep_check(self, uri: str) -> None:
         """Analyze and publish diagnostics."""
@@ -168,6 +314,90 @@ class JacLangServer(LanguageServer):
         self.tasks[uri] = task
         await task
 
+    def index_workspace(self) -> Optional[Future]:
+        """Index the Jac files of the workspace in the background."""
+        roots = [
+            uris.to_fs_path(folder.uri) for folder in self.workspace.folders.values()
+        ] or [self.workspace.root_path]
+        roots = sorted(i for i in roots if i and os.path.isdir(i))
+        if not roots:
+            return None
+        self.index_path = SymbolIndex.cache_path(roots)
+        self.index.load(self.index_path)
+        files = []
+        for root in roots:
+            for dir_path, dir_names, file_names in os.walk(root):
+                dir_names[:] = [
+                    i
+                    for i in dir_names
+                    if not i.startswith((".", "__")) and i != "node_modules"
+                ]
+                files += [
+                    os.path.join(dir_path, i) for i in file_names if i.endswith(".jac")
+                ]
+        with self.index.lock:
+            files += [i for i in self.index.files if not os.path.isfile(i)]
+        # modules first, so their annexes are indexed with them
+        files.sort(key=is_annex_path)
+        return self.queue_index(files)
+
+    def queue_index(self, paths: Iterable[str]) -> Optional[Future]:
+        """Queue files to index, start the indexer if it is not running."""
+        with self.queue_lock:
+            self.index_queue.update(dict.fromkeys(paths))
+            if self.index_queue and not self.indexer:
+                self.indexer = self.executor.submit(self.run_indexer)
+            return self.indexer
+
+    def run_indexer(self) -> None:
+        """Index queued files one at a time and save the index."""
+        start_time = time.time()
+        while True:
+            with self.queue_lock:
+                if not self.index_queue:
+                    self.indexer = None
+                    break
+                path = next(iter(self.index_queue))
+                del self.index_queue[path]
+            try:
+                self.index_file(path)
+            except Exception as e:
+                self.log_py(f"Error while indexing {path}: {e}")
+        self.index.save(self.index_path)
+        self.log_py(f"PROFILE: Indexing took {time.time() - start_time} seconds.")
+
+    def index_file(self, path: str) -> None:
+        """Build a file and index it unless its index is up to date."""
+        if not os.path.isfile(path):
+            self.queue_index(self.index.remove(path))
+            return
+        base = self.index.annexes.get(path, path)
+        if self.index.is_current(path) and self.index.is_current(base):
+            return
+        document = self.workspace.get_text_document(uris.from_fs_path(base))
+        if is_annex_path(base):
+            parsed = jac_str_to_pass(
+                jac_str=document.source, file_path=document.path, schedule=[]
+            )
+            if isinstance(parsed.ir, ast.Module) and (
+                discover := parsed.ir.annexable_by
+            ):
+                document = self.workspace.get_text_document(uris.from_fs_path(discover))
+        build = jac_str_to_pass(
+            jac_str=document.source,
+            file_path=document.path,
+            schedule=py_code_gen_typed,
+        )
+        if isinstance(build.ir, ast.Module):
+            self.queue_index(self.index.add_module(build.ir))
+
+    def shutdown(self) -> None:
+        """Stop indexing and background checks and shutdown server."""
+        with self.queue_lock:
+            self.index_queue.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        super().shutdown()
+
     def get_completion(
         self, file_path: str, position: lspt.Position, completion_trigger: Optional[str]
     ) -> lspt.CompletionList:
@@ -178,10 +408,8 @@ class JacLangServer(LanguageServer):
         current_pos = position.character
         current_symbol_path = parse_symbol_path(current_line, current_pos)
 
-        node_selected = find_deepest_symbol_node_at_pos(
-            self.modules[file_path].ir,
-            position.line,
-            position.character - 2,
+        node_selected = self.modules[file_path].sem_manager.find_node_at_pos(
+            position.line, position.character - 2
         )
         mod_tab = (
             self.modules[file_path].ir.sym_tab
@@ -221,11 +449,18 @@ class JacLangServer(LanguageServer):
         if old_path in self.modules and new_path != old_path:
             self.modules[new_path] = self.modules[old_path]
             del self.modules[old_path]
+        with self.build_lock:
+            self.checked.pop(old_path, None)
+        self.queue_index([uris.to_fs_path(old_path), uris.to_fs_path(new_path)])
 
     def delete_module(self, uri: str) -> None:
         """Delete module."""
         if uri in self.modules:
             del self.modules[uri]
+        with self.build_lock:
+            self.checked.pop(uri, None)
+            self.file_hashes.pop(uris.to_fs_path(uri), None)
+        self.queue_index([uris.to_fs_path(uri)])
 
     def formatted_jac(self, file_path: str) -> list[lspt.TextEdit]:
         """Return formatted jac."""
@@ -263,10 +498,8 @@ class JacLangServer(LanguageServer):
         """Return hover information for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -318,10 +551,8 @@ class JacLangServer(LanguageServer):
         """Return definition location for a file."""
         if file_path not in self.modules:
             return None
-        token_index = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        token_index = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if token_index is None:
             return None
@@ -407,59 +638,91 @@ class JacLangServer(LanguageServer):
         """Return references for a file."""
         if file_path not in self.modules:
             return []
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return []
         node_selected = self.modules[file_path].sem_manager.static_sem_tokens[index1][3]
         if node_selected and node_selected.sym:
             list_of_references: list[lspt.Location] = [
-                lspt.Location(
-                    uri=uris.from_fs_path(node.loc.mod_path),
-                    range=create_range(node.loc),
-                )
-                for node in node_selected.sym.uses
+                lspt.Location(uri=uris.from_fs_path(path), range=span_range(span))
+                for path, span in self.get_sym_refs(node_selected.sym)
             ]
             return list_of_references
         return []
 
+    def get_sym_refs(self, sym: Symbol) -> list[tuple[str, Span]]:
+        """Return files and ranges of the uses of a symbol in the workspace."""
+        refs = [(node.loc.mod_path, get_span(node.loc)) for node in sym.uses]
+        if (decl := resolve_decl(sym)).loc.first_line:
+            refs += self.index.references(get_key(decl))
+        return list(dict.fromkeys(refs))
+
     def rename_symbol(
         self, file_path: str, position: lspt.Position, new_name: str
     ) -> Optional[lspt.WorkspaceEdit]:
         """Rename a symbol in a file."""
         if file_path not in self.modules:
             return None
-        index1 = find_index(
-            self.modules[file_path].sem_manager.sem_tokens,
-            position.line,
-            position.character,
+        index1 = self.modules[file_path].sem_manager.find_index(
+            position.line, position.character
         )
         if index1 is None:
             return None
         node_selected = self.modules[file_path].sem_manager.static_sem_tokens[index1][3]
         if node_selected and node_selected.sym:
             changes: dict[str, list[lspt.TextEdit]] = {}
-            for node in [
-                *node_selected.sym.uses,
-                node_selected.sym.defn[0],
+            decls = [node_selected.sym.defn[0], resolve_decl(node_selected.sym)]
+            for path, span in [
+                *self.get_sym_refs(node_selected.sym),
+                *((node.loc.mod_path, get_span(node.loc)) for node in decls),
             ]:
-                key = uris.from_fs_path(node.loc.mod_path)
+                key = uris.from_fs_path(path)
                 new_edit = lspt.TextEdit(
-                    range=create_range(node.loc),
+                    range=span_range(span),
                     new_text=new_name,
                 )
                 add_unique_text_edit(changes, key, new_edit)
             return lspt.WorkspaceEdit(changes=changes)
         return None
 
+    def snapshot_sem_tokens(self, file_path: str) -> tuple[str, list[int]]:
+        """Save the semantic tokens of a file sent under a new result id."""
+        tokens = (
+            list(self.modules[file_path].sem_manager.sem_tokens)
+            if file_path in self.modules
+            else []
+        )
+        result_id = str(next(self.sem_token_ids))
+        self.sem_token_results[file_path] = (result_id, tokens)
+        return result_id, tokens
+
     def get_semantic_tokens(self, file_path: str) -> lspt.SemanticTokens:
         """Return semantic tokens for a file."""
+        result_id, tokens = self.snapshot_sem_tokens(file_path)
+        return lspt.SemanticTokens(data=tokens, result_id=result_id)
+
+    def get_semantic_tokens_delta(
+        self, file_path: str, previous_result_id: str
+    ) -> lspt.SemanticTokens | lspt.SemanticTokensDelta:
+        """Return edits to the semantic tokens sent with a previous result."""
+        previous = self.sem_token_results.get(file_path)
+        result_id, tokens = self.snapshot_sem_tokens(file_path)
+        if not previous or previous[0] != previous_result_id:
+            return lspt.SemanticTokens(data=tokens, result_id=result_id)
+        return lspt.SemanticTokensDelta(
+            edits=SemTokManager.diff_tokens(previous[1], tokens), result_id=result_id
+        )
+
+    def get_semantic_tokens_range(
+        self, file_path: str, token_range: lspt.Range
+    ) -> lspt.SemanticTokens:
+        """Return semantic tokens for a range of a file."""
         if file_path not in self.modules:
             return lspt.SemanticTokens(data=[])
-        return lspt.SemanticTokens(data=self.modules[file_path].sem_manager.sem_tokens)
+        sem_manager = self.modules[file_path].sem_manager
+        return lspt.SemanticTokens(data=sem_manager.get_range_tokens(token_range))
 
     def log_error(self, message: str) -> None:
         """Log an error message."""
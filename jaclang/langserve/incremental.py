@@ -0,0 +1,163 @@
+"""Incremental syntax check of documents being edited.
+
+A document is split into segments of whole lines, each holding one or more top
+level elements (architypes, abilities, impl blocks, ...) with the blank lines,
+comments and docstrings before them. Top level elements parse independently of
+each other, so on change only the segments touched by the edit ranges are parsed
+again, the others keep their diagnostics. If an edit leaves a segment unfinished,
+e.g. with an unclosed brace, the following segments are added to it until it
+parses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import re
+from typing import Optional, Sequence
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.compile import jac_str_to_pass
+from jaclang.langserve.utils import gen_diagnostics
+from jaclang.vendor.pygls import uris
+
+import lsprotocol.types as lspt
+
+
+class Segment:
+    """Lines of a document parsed together."""
+
+    def __init__(self, start: int, size: int) -> None:
+        """Initialize segment."""
+        self.start = start  # first line when parsed
+        self.size = size
+        self.diagnostics: list[lspt.Diagnostic] = []
+
+
+def split_lines(source: str) -> list[str]:
+    """Split source into lines keeping line ends, one more than line breaks."""
+    lines = source.split("\n")
+    return [i + "\n" for i in lines[:-1]] + [lines[-1]]
+
+
+def shift_diagnostic(diagnostic: lspt.Diagnostic, lines: int) -> lspt.Diagnostic:
+    """Move a diagnostic down by some lines."""
+    start, end = diagnostic.range.start, diagnostic.range.end
+    message = re.sub(
+        r"at line (\d+)",
+        lambda m: f"at line {int(m.group(1)) + lines}",
+        diagnostic.message,
+    )
+    return lspt.Diagnostic(
+        range=lspt.Range(
+            start=lspt.Position(line=start.line + lines, character=start.character),
+            end=lspt.Position(line=end.line + lines, character=end.character),
+        ),
+        message=message,
+        severity=diagnostic.severity,
+    )
+
+
+def get_changed_lines(
+    changes: Sequence[lspt.TextDocumentContentChangeEvent],
+) -> Optional[tuple[int, int, int]]:
+    """Get first and last changed line after changes and lines added by them."""
+    first, last, added = -1, -1, 0
+    for change in changes:
+        if not isinstance(change, lspt.TextDocumentContentChangeEvent_Type1):
+            return None
+        start, end = change.range.start.line, change.range.end.line
+        new_end = start + change.text.count("\n")
+        shift = new_end - end
+        if first < 0:
+            first, last = start, new_end
+        else:
+            if last > end:
+                last += shift
+            elif last >= start:
+                last = new_end
+            first, last = min(first, start), max(last, new_end)
+        added += shift
+    return (first, last, added) if first >= 0 else None
+
+
+class IncrementalParser:
+    """Syntax check of a document parsing only the segments changed."""
+
+    def __init__(self, file_path: str) -> None:
+        """Initialize incremental parser."""
+        self.file_path = file_path
+        self.segments: list[Segment] = []
+        self.changes: list[lspt.TextDocumentContentChangeEvent] = []
+        self.lock = asyncio.Lock()
+
+    def parse(self, lines: list[str], start: int = 0) -> tuple[list[Segment], bool]:
+        """Parse lines from a start line into segments, tell if they end unfinished."""
+        if not lines:
+            return [], False
+        build = jac_str_to_pass(
+            jac_str="\n" * start + "".join(lines),
+            file_path=uris.to_fs_path(self.file_path),
+            schedule=[],
+        )
+        diagnostics = gen_diagnostics(
+            self.file_path, build.errors_had, build.warnings_had
+        )
+        ends: list[int] = []
+        if not build.errors_had and isinstance(build.ir, ast.Module):
+            for elem in build.ir.body:
+                if ends and elem.loc.first_line <= ends[-1]:
+                    ends[-1] = max(ends[-1], elem.loc.last_line)
+                else:
+                    ends.append(elem.loc.last_line)
+        ends = ends[:-1] + [start + len(lines)]
+        starts = [start, *ends[:-1]]
+        segments = [Segment(i, end - i) for i, end in zip(starts, ends)]
+        for diagnostic in diagnostics:
+            line = diagnostic.range.start.line
+            idx = min(bisect.bisect_right(ends, line), len(ends) - 1)
+            segments[idx].diagnostics.append(diagnostic)
+        unfinished = any("'$END'" in i.msg for i in build.errors_had)
+        return segments, unfinished
+
+    def reparse(
+        self, source: str, changes: Sequence[lspt.TextDocumentContentChangeEvent]
+    ) -> list[Segment]:
+        """Get segments of source after changes, parsing the changed lines."""
+        lines = split_lines(source)
+        segments = self.segments
+        changed = get_changed_lines(changes) if segments else None
+        total = sum(i.size for i in segments)
+        if not changed or total + changed[2] != len(lines):
+            return self.parse(lines)[0]
+        first, last, added = changed
+        i = start = 0
+        while i < len(segments) and start + segments[i].size <= first:
+            start += segments[i].size
+            i += 1
+        j, end = len(segments), total
+        while j > i and end - segments[j - 1].size > last - added:
+            j -= 1
+            end -= segments[j].size
+        step = 1
+        while True:
+            new_segments, unfinished = self.parse(lines[start : end + added], start)
+            if not unfinished or j == len(segments):
+                break
+            end += sum(i.size for i in segments[j : j + step])
+            j, step = min(j + step, len(segments)), step * 2
+        return segments[:i] + new_segments + segments[j:]
+
+    def diagnostics(self) -> list[lspt.Diagnostic]:
+        """Get diagnostics of the document."""
+        diagnostics, start = [], 0
+        for segment in self.segments:
+            if segment.start == start:
+                diagnostics += segment.diagnostics
+            else:
+                diagnostics += [
+                    shift_diagnostic(i, start - segment.start)
+                    for i in segment.diagnostics
+                ]
+            start += segment.size
+        return diagnostics
@@ -0,0 +1,220 @@
+"""Workspace symbol index of the language server.
+
+The index keeps for every indexed Jac file the symbols it declares and the
+ranges where it references symbols of any module, keyed by the location of the
+declaration. Names imported from other modules are followed to the declaration
+in their module, so references across files share a key. Annexed .impl.jac and
+.test.jac files are indexed with the module they belong to. The index is saved
+to the compile cache and entries stay valid while the mtimes of the file and the
+files it references are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import Optional
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import CompileCache, compile_cache
+from jaclang.compiler.codeloc import CodeLocInfo
+from jaclang.compiler.symtable import Symbol
+from jaclang.utils.log import logging
+
+import lsprotocol.types as lspt
+
+Span = tuple[int, int, int, int]
+SymKey = tuple[str, int, int, int, int]
+
+logger = logging.getLogger(__name__)
+
+
+def get_span(loc: CodeLocInfo) -> Span:
+    """Get zero based range of a location."""
+    return (
+        max(loc.first_line - 1, 0),
+        max(loc.col_start - 1, 0),
+        max(loc.last_line - 1, 0),
+        max(loc.col_end - 1, 0),
+    )
+
+
+def span_range(span: Span) -> lspt.Range:
+    """Create an lspt.Range from a span."""
+    return lspt.Range(
+        start=lspt.Position(line=span[0], character=span[1]),
+        end=lspt.Position(line=span[2], character=span[3]),
+    )
+
+
+def get_key(decl: ast.NameAtom) -> SymKey:
+    """Get index key of a declaration."""
+    return (decl.loc.mod_path, *get_span(decl.loc))
+
+
+def get_mtime(path: str) -> float:
+    """Get modification time of a file, -1 if it is missing."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return -1
+
+
+def is_annex_path(path: str) -> bool:
+    """Check if a path looks like an .impl.jac or .test.jac annex."""
+    in_annex_dir = os.path.dirname(path).endswith((".impl", ".test"))
+    return in_annex_dir or path.endswith((".impl.jac", ".test.jac"))
+
+
+def resolve_decl(sym: Symbol) -> ast.NameAtom:
+    """Follow names imported without alias to their declaration."""
+    decl, seen = sym.decl, set()
+    while (
+        isinstance(item := decl.parent, ast.ModuleItem)
+        and not item.alias
+        and id(item) not in seen
+    ):
+        seen.add(id(item))
+        try:
+            mod = item.from_mod_path.sub_module
+        except ValueError:
+            break
+        if not mod or not mod._sym_tab:
+            break
+        if not (found := mod._sym_tab.lookup(item.name.value)):
+            break
+        decl = found.decl
+    return decl
+
+
+class FileIndex:
+    """Symbols declared and referenced in a file."""
+
+    def __init__(self) -> None:
+        """Initialize file index."""
+        self.mtimes: dict[str, float] = {}
+        self.decls: set[SymKey] = set()
+        self.refs: dict[SymKey, list[Span]] = {}
+
+
+class SymbolIndex:
+    """Index of symbol declarations, references and annexes of a workspace."""
+
+    def __init__(self) -> None:
+        """Initialize symbol index."""
+        self.files: dict[str, FileIndex] = {}
+        self.annexes: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def cache_path(roots: list[str]) -> str:
+        """Get path the index of workspace roots is saved to."""
+        digest = hashlib.sha256("\0".join(sorted(roots)).encode()).hexdigest()
+        return os.path.join(compile_cache.cache_dir, "lsp", f"{digest[:32]}.idx")
+
+    @staticmethod
+    def index_module(mod: ast.Module) -> FileIndex:
+        """Collect symbols declared and referenced in a module."""
+        entry = FileIndex()
+        uses: dict[int, set[int]] = {}
+        for node in mod._in_mod_nodes:
+            if not isinstance(node, ast.NameAtom) or not (sym := node.sym):
+                continue
+            decl = resolve_decl(sym)
+            if not decl.loc.first_line:  # builtins
+                continue
+            key = get_key(decl)
+            if decl is node:
+                entry.decls.add(key)
+                continue
+            if id(sym) not in uses:
+                uses[id(sym)] = {id(i) for i in sym.uses}
+            if id(node) in uses[id(sym)] or node is sym.decl:
+                entry.refs.setdefault(key, []).append(get_span(node.loc))
+        mod_path = mod.loc.mod_path
+        for path in [mod_path, *{key[0] for key in entry.refs}]:
+            entry.mtimes[path] = get_mtime(path)
+        return entry
+
+    def add_module(self, module: ast.Module) -> set[str]:
+        """Index a built module with its annexes, get files to index again."""
+        mods = [module, *module.impl_mod, *module.test_mod]
+        entries = {mod.loc.mod_path: self.index_module(mod) for mod in mods}
+        stale: set[str] = set()
+        with self.lock:
+            for path, base in list(self.annexes.items()):
+                if base == module.loc.mod_path and path not in entries:
+                    del self.annexes[path]
+            for mod in mods[1:]:
+                self.annexes[mod.loc.mod_path] = module.loc.mod_path
+            for path, entry in entries.items():
+                old = self.files.get(path)
+                if old and old.decls != entry.decls:
+                    stale |= self.users(path)
+                self.files[path] = entry
+            for path in stale - entries.keys():
+                self.files[path].mtimes = {}
+        return stale - entries.keys()
+
+    def remove(self, path: str) -> set[str]:
+        """Remove a file from the index, get files to index again."""
+        with self.lock:
+            self.files.pop(path, None)
+            stale = self.users(path)
+            if base := self.annexes.pop(path, None):
+                stale.add(base)
+            for i in stale & self.files.keys():
+                self.files[i].mtimes = {}
+        return stale
+
+    def users(self, path: str) -> set[str]:
+        """Get files referencing symbols declared in a file."""
+        return {
+            i
+            for i, entry in self.files.items()
+            if i != path and any(key[0] == path for key in entry.refs)
+        }
+
+    def is_current(self, path: str) -> bool:
+        """Check if index of a file is up to date."""
+        entry = self.files.get(path)
+        return (
+            entry is not None
+            and path in entry.mtimes
+            and all(get_mtime(i) == mtime for i, mtime in entry.mtimes.items())
+        )
+
+    def references(self, key: SymKey) -> list[tuple[str, Span]]:
+        """Get files and ranges referencing a symbol."""
+        with self.lock:
+            return sorted(
+                (path, span)
+                for path, entry in self.files.items()
+                for span in entry.refs.get(key, [])
+            )
+
+    def load(self, path: str) -> None:
+        """Load a saved index."""
+        try:
+            with open(path, "rb") as f:
+                salt, files, annexes = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError, TypeError):
+            return
+        if salt != compile_cache.salt:
+            return
+        with self.lock:
+            self.files = {**files, **self.files}
+            self.annexes = {**annexes, **self.annexes}
+
+    def save(self, path: Optional[str]) -> None:
+        """Save the index."""
+        if not path:
+            return
+        with self.lock:
+            data = pickle.dumps((compile_cache.salt, self.files, self.annexes))
+        try:
+            CompileCache.write(path, data)
+        except OSError as e:
+            logger.warning(f"Can't save symbol index to {path}: {e}")
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import bisect
 from typing import List, Optional, Tuple
 
 import jaclang.compiler.absyntree as ast
 from jaclang.langserve.utils import (
     find_surrounding_tokens,
     get_line_of_code,
+    get_token_positions,
     get_token_start,
 )
 
 import lsprotocol.types as lspt
 
+# (start, end, index of enclosing span or -1, node), positions are (line, char)
+SymbolSpan = Tuple[Tuple[int, int], Tuple[int, int], int, ast.AstSymbolNode]
+
 
 class SemTokManager:
     """Semantic Token Manager class."""
@@ -23,6 +28,9 @@ class SemTokManager:
         self.static_sem_tokens: List[
             Tuple[lspt.Position, int, int, ast.AstSymbolNode]
         ] = self.gen_sem_tok_node(ir)
+        self.symbol_spans: List[SymbolSpan] = self.gen_symbol_spans(ir)
+        # absolute positions of sem_tokens, reset when they are updated
+        self.token_positions: Optional[List[Tuple[int, int, int]]] = None
 
     def gen_sem_tokens(self, ir: ast.Module) -> list[int]:
         """Return semantic tokens."""
@@ -62,6 +70,103 @@ class SemTokManager:
                 tokens += [(pos, col_end, length, node)]
         return tokens
 
+    def gen_symbol_spans(self, ir: ast.Module) -> List[SymbolSpan]:
+        """Return spans of the symbol nodes of a module sorted by start."""
+        spans, seen = [], set()
+        stack: List[ast.AstNode] = [ir]
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, ast.AstSymbolNode):
+                spans.append(
+                    (
+                        (cur.loc.first_line - 1, cur.loc.col_start - 1),
+                        (cur.loc.last_line - 1, cur.loc.col_end - 1),
+                        cur,
+                    )
+                )
+            for i in cur.kid:
+                if i.loc.mod_path == cur.loc.mod_path and id(i) not in seen:
+                    seen.add(id(i))
+                    stack.append(i)
+        spans.sort(key=lambda i: (i[0], -i[1][0], -i[1][1]))
+        symbol_spans: List[SymbolSpan] = []
+        enclosing: List[int] = []
+        for start, end, node in spans:
+            while enclosing and symbol_spans[enclosing[-1]][1] < start:
+                enclosing.pop()
+            symbol_spans.append((start, end, enclosing[-1] if enclosing else -1, node))
+            enclosing.append(len(symbol_spans) - 1)
+        return symbol_spans
+
+    def find_node_at_pos(self, line: int, char: int) -> Optional[ast.AstSymbolNode]:
+        """Return the deepest symbol node spanning a position.
+
+        Spans enclosing the position are all enclosing the last span starting
+        before it, so only that span's chain of enclosing spans is checked.
+        """
+        pos = (line, char)
+        i = bisect.bisect_right(self.symbol_spans, pos, key=lambda i: i[0]) - 1
+        while i >= 0:
+            start, end, enclosing, node = self.symbol_spans[i]
+            if start <= pos <= end:
+                return node
+            i = enclosing
+        return None
+
+    def get_positions(self) -> List[Tuple[int, int, int]]:
+        """Return line, start and end character of the semantic tokens."""
+        if self.token_positions is None:
+            self.token_positions = get_token_positions(self.sem_tokens)
+        return self.token_positions
+
+    def find_index(self, line: int, char: int) -> Optional[int]:
+        """Return index of the first token spanning a position."""
+        positions = self.get_positions()
+        i = bisect.bisect_right(positions, (line, char), key=lambda i: i[:2])
+        index = None
+        while i > 0 and positions[i - 1][0] == line:
+            i -= 1
+            if positions[i][2] >= char:
+                index = i
+        return index
+
+    def get_range_tokens(self, token_range: lspt.Range) -> List[int]:
+        """Return semantic tokens starting within a range."""
+        positions = self.get_positions()
+        start, end = token_range.start, token_range.end
+        first = bisect.bisect_left(
+            positions, (start.line, start.character), key=lambda i: i[:2]
+        )
+        last = bisect.bisect_left(
+            positions, (end.line, end.character), key=lambda i: i[:2]
+        )
+        tokens = self.sem_tokens[first * 5 : last * 5]
+        if tokens:
+            tokens[0], tokens[1] = positions[first][:2]
+        return tokens
+
+    @staticmethod
+    def diff_tokens(old: List[int], new: List[int]) -> List[lspt.SemanticTokensEdit]:
+        """Return edit turning old semantic tokens into new, on token boundaries."""
+        size = min(len(old), len(new))
+        prefix = 0
+        while prefix < size and old[prefix] == new[prefix]:
+            prefix += 1
+        prefix -= prefix % 5
+        suffix = 0
+        while suffix < size - prefix and old[-suffix - 1] == new[-suffix - 1]:
+            suffix += 1
+        suffix -= suffix % 5
+        if prefix == len(old) == len(new):
+            return []
+        return [
+            lspt.SemanticTokensEdit(
+                start=prefix,
+                delete_count=len(old) - prefix - suffix,
+                data=new[prefix : len(new) - suffix],
+            )
+        ]
+
     def update_sem_tokens(
         self,
         content_changes: lspt.DidChangeTextDocumentParams,
@@ -10,19 +10,36 @@ from jaclang.compiler.constant import (
 )
 from jaclang.langserve.engine import JacLangServer
 from jaclang.settings import settings
+from jaclang.vendor.pygls import uris
 
 import lsprotocol.types as lspt
 
 server = JacLangServer()
 
 
+@server.feature(lspt.INITIALIZED)
+def initialized(ls: JacLangServer, params: lspt.InitializedParams) -> None:
+    """Index the workspace in the background."""
+    ls.index_workspace()
+
+
 @server.feature(lspt.TEXT_DOCUMENT_DID_OPEN)
 async def did_open(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
+    ls.parsers.pop(params.text_document.uri, None)
     ls.deep_check(params.text_document.uri)
     ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
 
 
+@server.feature(lspt.TEXT_DOCUMENT_DID_CLOSE)
+def did_close(ls: JacLangServer, params: lspt.DidCloseTextDocumentParams) -> None:
+    """Drop syntax check, semantic tokens and build state of a closed document."""
+    ls.parsers.pop(params.text_document.uri, None)
+    ls.sem_token_results.pop(params.text_document.uri, None)
+    with ls.build_lock:
+        ls.checked.pop(params.text_document.uri, None)
+
+
 @server.feature(lspt.TEXT_DOCUMENT_DID_SAVE)
 async def did_save(ls: JacLangServer, params: lspt.DidOpenTextDocumentParams) -> None:
     """Check syntax on change."""
@@ -35,13 +52,14 @@ async def did_change(
     ls: JacLangServer, params: lspt.DidChangeTextDocumentParams
 ) -> None:
     """Check syntax on change."""
-    await ls.launch_quick_check(file_path := params.text_document.uri)
+    ls.record_changes(file_path := params.text_document.uri, params.content_changes)
+    await ls.launch_quick_check(file_path)
     if file_path in ls.modules:
         document = ls.workspace.get_text_document(file_path)
         lines = document.source.splitlines()
-        ls.modules[file_path].sem_manager.update_sem_tokens(
-            params, ls.modules[file_path].sem_manager.sem_tokens, lines
-        )
+        sem_manager = ls.modules[file_path].sem_manager
+        sem_manager.update_sem_tokens(params, sem_manager.sem_tokens, lines)
+        sem_manager.token_positions = None
         ls.lsp.send_request(lspt.WORKSPACE_SEMANTIC_TOKENS_REFRESH)
 
 
@@ -63,6 +81,7 @@ def formatting(
 )
 def did_create_files(ls: JacLangServer, params: lspt.CreateFilesParams) -> None:
     """Check syntax on file creation."""
+    ls.queue_index([uris.to_fs_path(file.uri) for file in params.files])
 
 
 @server.feature(
@@ -95,6 +114,18 @@ def did_delete_files(ls: JacLangServer, params: lspt.DeleteFilesParams) -> None:
         ls.delete_module(file.uri)
 
 
+@server.feature(lspt.WORKSPACE_DID_CHANGE_WATCHED_FILES)
+def did_change_watched_files(
+    ls: JacLangServer, params: lspt.DidChangeWatchedFilesParams
+) -> None:
+    """Index files changed outside of the editor."""
+    ls.queue_index(
+        uris.to_fs_path(change.uri)
+        for change in params.changes
+        if change.uri.endswith(".jac")
+    )
+
+
 @server.feature(
     lspt.TEXT_DOCUMENT_COMPLETION,
     lspt.CompletionOptions(trigger_characters=[".", ":", "a-zA-Z0-9"]),
@@ -161,9 +192,28 @@ def semantic_tokens_full(
     return ls.get_semantic_tokens(params.text_document.uri)
 
 
+@server.feature(lspt.TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL_DELTA)
+def semantic_tokens_delta(
+    ls: JacLangServer, params: lspt.SemanticTokensDeltaParams
+) -> lspt.SemanticTokens | lspt.SemanticTokensDelta:
+    """Provide edits to semantic tokens since a previous result."""
+    return ls.get_semantic_tokens_delta(
+        params.text_document.uri, params.previous_result_id
+    )
+
+
+@server.feature(lspt.TEXT_DOCUMENT_SEMANTIC_TOKENS_RANGE)
+def semantic_tokens_range(
+    ls: JacLangServer, params: lspt.SemanticTokensRangeParams
+) -> lspt.SemanticTokens:
+    """Provide semantic tokens for a range."""
+    return ls.get_semantic_tokens_range(params.text_document.uri, params.range)
+
+
 def run_lang_server() -> None:
     """Run the language server."""
     settings.pass_timer = True
+    settings.incremental_type_check = True
     server.start_io()
 
 
@@ -1,7 +1,19 @@
+import asyncio
+import inspect
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import jaclang.compiler.absyntree as ast
+from jaclang.compiler.cache import CompileCache
+from jaclang.compiler.compile import jac_str_to_pass
 from jaclang.utils.test import TestCase
 from jaclang.vendor.pygls import uris
 from jaclang.vendor.pygls.workspace import Workspace
 from jaclang.langserve.engine import JacLangServer
+from jaclang.langserve.incremental import IncrementalParser
+from jaclang.langserve.utils import debounce, get_token_positions
 from .session import LspSession
 
 import lsprotocol.types as lspt
@@ -569,3 +581,198 @@ class TestJacLangServer(TestCase):
             )
             for expected in expected_refs:
                 self.assertIn(expected, references)
+
+    def test_workspace_index(self) -> None:
+        """Test that references across files are served from the index."""
+        lsp = JacLangServer()
+        workspace_path = self.fixture_abs_path("workspace")
+        workspace = Workspace(uris.from_fs_path(workspace_path), lsp)
+        lsp.lsp._workspace = workspace
+        lsp.index_workspace().result()
+        shape_file = self.fixture_abs_path("workspace/shape.jac")
+        impl_file = self.fixture_abs_path("workspace/shape.impl.jac")
+        self.assertEqual(lsp.index.annexes, {impl_file: shape_file})
+        lsp.deep_check(uris.from_fs_path(impl_file))
+        main_uri = uris.from_fs_path(self.fixture_abs_path("workspace/main.jac"))
+        self.assertNotIn(main_uri, lsp.modules)
+        shape_uri = uris.from_fs_path(shape_file)
+        references = str(lsp.get_references(shape_uri, lspt.Position(2, 6)))
+        for expected in [
+            "shape.jac:8:20-8:26",
+            "shape.impl.jac:0:5-0:11",
+            "main.jac:0:24-0:30",
+            "main.jac:3:9-3:15",
+        ]:
+            self.assertIn(expected, references)
+        edits = lsp.rename_symbol(shape_uri, lspt.Position(8, 6), "twice_area")
+        self.assertEqual(
+            sorted(str(i.range) for i in edits.changes[main_uri]),
+            ["0:32-0:43", "4:21-4:32"],
+        )
+
+    def test_incremental_syntax_check(self) -> None:
+        """Test that edits only reparse the segments they touch."""
+        parser = IncrementalParser(
+            uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        )
+        with open(self.fixture_abs_path("circle.jac")) as f:
+            source = f.read()
+        parser.segments = parser.reparse(source, [])
+        self.assertGreater(len(parser.segments), 5)
+        self.assertEqual(parser.diagnostics(), [])
+
+        def edit(line: int, col: int, end_col: int, text: str) -> None:
+            nonlocal source
+            lines = source.split("\n")
+            lines[line] = lines[line][:col] + text + lines[line][end_col:]
+            source = "\n".join(lines)
+            change = lspt.TextDocumentContentChangeEvent_Type1(
+                range=lspt.Range(
+                    start=lspt.Position(line, col), end=lspt.Position(line, end_col)
+                ),
+                text=text,
+            )
+            old = parser.segments
+            parser.segments = parser.reparse(source, [change])
+            kept = [i for i in parser.segments if any(i is j for j in old)]
+            self.assertGreater(len(kept), 0)
+            full = IncrementalParser(parser.file_path)
+            full.segments = full.reparse(source, [])
+            first_lines = [
+                [(i.range.start, i.message.splitlines()[0]) for i in p.diagnostics()]
+                for p in (full, parser)
+            ]
+            self.assertEqual(first_lines[0], first_lines[1][:1])
+
+        edit(4, 0, 0, "obj Extra {}\n\n")
+        edit(30, 0, 0, "x = ")
+        edit(30, 0, 4, "")
+        closing = source.split("\n").index("}", 20)
+        edit(closing, 0, 1, "")
+        edit(closing, 0, 0, "}")
+        self.assertEqual(parser.diagnostics(), [])
+
+    def test_deep_check_dependents(self) -> None:
+        """Test that deep checks reuse unchanged modules and recheck importers."""
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copytree(self.fixture_abs_path("workspace"), tmp, dirs_exist_ok=True)
+            lsp = JacLangServer()
+            workspace = Workspace(uris.from_fs_path(tmp), lsp)
+            lsp.lsp._workspace = workspace
+            main_path = os.path.join(tmp, "main.jac")
+            shape_path = os.path.join(tmp, "shape.jac")
+            main_uri = uris.from_fs_path(main_path)
+            shape_uri = uris.from_fs_path(shape_path)
+            impl_path = os.path.join(tmp, "shape.impl.jac")
+            impl_uri = uris.from_fs_path(impl_path)
+            with open(main_path) as f:
+                workspace.put_text_document(
+                    lspt.TextDocumentItem(main_uri, "jac", 0, f.read())
+                )
+            self.assertTrue(lsp.deep_check(main_uri))
+            self.assertEqual(lsp.dependencies[main_path], {shape_path})
+            self.assertEqual(
+                lsp.closures[main_path], {main_path, shape_path, impl_path}
+            )
+            self.assertIsNone(lsp.modules[shape_uri].impl_parent)
+            self.assertIs(lsp.modules[impl_uri].impl_parent, lsp.modules[shape_uri])
+            build = lsp.checked[main_uri][1]
+            passes = [i for i, _ in build.timings]
+            self.assertEqual(passes[:2], ["JacParser", "SubNodeTabPass"])
+            self.assertIn("JacTypeCheckPass", passes)
+            with patch.object(CompileCache, "hash_file") as hash_file:
+                self.assertTrue(lsp.deep_check(main_uri))
+            self.assertFalse(hash_file.called)
+            self.assertIs(lsp.checked[main_uri][1], build)
+
+            def compile_unlocked(**kwargs: object) -> object:
+                self.assertFalse(lsp.build_lock.locked())
+                return jac_str_to_pass(**kwargs)  # type: ignore
+
+            with open(shape_path, "a") as f:
+                f.write("\nobj Circle {}\n")
+            with patch(
+                "jaclang.langserve.engine.jac_str_to_pass", side_effect=compile_unlocked
+            ) as compile:
+                self.assertTrue(lsp.deep_check(shape_uri))
+            self.assertTrue(compile.called)
+            self.assertNotIn(main_path, lsp.dependencies[shape_path])
+            self.assertEqual(
+                lsp.closures[main_path], {main_path, shape_path, impl_path}
+            )
+            shape_info = lsp.modules[shape_uri]
+            for future in lsp.check_dependents(shape_path):
+                self.assertTrue(future.result())
+            self.assertIsNot(lsp.checked[main_uri][1], build)
+            self.assertIs(lsp.modules[shape_uri], shape_info)
+            lsp.delete_module(main_uri)
+            self.assertNotIn(main_uri, lsp.checked)
+
+    def test_position_index(self) -> None:
+        """Test that position queries find the tokens and nodes spanning them."""
+        lsp = JacLangServer()
+        workspace_path = self.fixture_abs_path("")
+        workspace = Workspace(workspace_path, lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        lsp.deep_check(circle_file)
+        sem_manager = lsp.modules[circle_file].sem_manager
+        for i, (pos, col_end, _, node) in enumerate(sem_manager.static_sem_tokens):
+            for char in (pos.character, col_end):
+                self.assertEqual(sem_manager.find_index(pos.line, char), i)
+                self.assertIs(sem_manager.find_node_at_pos(pos.line, char), node)
+        self.assertIsNone(sem_manager.find_index(0, 0))
+        ability = sem_manager.find_node_at_pos(30, 0)
+        self.assertIsInstance(ability, ast.Ability)
+        self.assertEqual(ability.sym_name, "area")
+        self.assertIsInstance(sem_manager.find_node_at_pos(31, 0), ast.Architype)
+
+    def test_sem_tokens_delta_range(self) -> None:
+        """Test semantic token edits since a result and tokens of a range."""
+        lsp = JacLangServer()
+        workspace_path = self.fixture_abs_path("")
+        workspace = Workspace(workspace_path, lsp)
+        lsp.lsp._workspace = workspace
+        circle_file = uris.from_fs_path(self.fixture_abs_path("circle.jac"))
+        lsp.deep_check(circle_file)
+        full = lsp.get_semantic_tokens(circle_file)
+        sem_manager = lsp.modules[circle_file].sem_manager
+        sem_manager.sem_tokens[7] += 1
+        sem_manager.sem_tokens[-5:] = []
+        delta = lsp.get_semantic_tokens_delta(circle_file, full.result_id)
+        assert isinstance(delta, lspt.SemanticTokensDelta)
+        self.assertNotEqual(delta.result_id, full.result_id)
+        data = list(full.data)
+        for edit in reversed(delta.edits):
+            data[edit.start : edit.start + edit.delete_count] = edit.data or []
+        self.assertEqual(data, sem_manager.sem_tokens)
+        stale = lsp.get_semantic_tokens_delta(circle_file, full.result_id)
+        self.assertIsInstance(stale, lspt.SemanticTokens)
+        sem_manager.token_positions = None
+        positions = sem_manager.get_positions()
+        token_range = lspt.Range(
+            start=lspt.Position(line=30, character=0),
+            end=lspt.Position(line=33, character=0),
+        )
+        expected = [i for i in positions if (30, 0) <= i[:2] < (33, 0)]
+        data = lsp.get_semantic_tokens_range(circle_file, token_range).data
+        self.assertTrue(expected)
+        self.assertEqual(get_token_positions(data), expected)
+
+    def test_debounce(self) -> None:
+        """Test debounced calls run once per argument and release their tasks."""
+        calls: list[str] = []
+
+        async def call(name: str) -> None:
+            calls.append(name)
+
+        debounced = debounce(0.01)(call)
+
+        async def run() -> None:
+            for name in ["a", "b", "a"]:
+                await debounced(name)
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        self.assertEqual(sorted(calls), ["a", "b"])
+        self.assertEqual(inspect.getclosurevars(debounced).nonlocals["tasks"], {})
@@ -43,16 +43,19 @@ def gen_diagnostics(
 
 
 def debounce(wait: float) -> Callable[[T], Callable[..., Awaitable[None]]]:
-    """Debounce decorator for async functions."""
+    """Debounce decorator for async functions, separately for each arguments."""
 
     def decorator(fn: T) -> Callable[..., Awaitable[None]]:
+        tasks: dict[tuple, asyncio.Task] = {}
+
         @wraps(fn)
         async def debounced(*args: P.args, **kwargs: P.kwargs) -> None:
             async def call_it() -> None:
                 await fn(*args, **kwargs)
 
-            if hasattr(debounced, "_task"):
-                debounced._task.cancel()
+            key = (*args, *sorted(kwargs.items()))
+            if key in tasks:
+                tasks[key].cancel()
 
             async def debounced_coro() -> None:
                 try:
@@ -61,15 +64,42 @@ def debounce(wait: float) -> Callable[[T], Callable[..., Awaitable[None]]]:
                 except asyncio.CancelledError:
                     pass
 
-            setattr(  # noqa: B010
-                debounced, "_task", asyncio.create_task(debounced_coro())
+            task = asyncio.create_task(debounced_coro())
+            task.add_done_callback(
+                lambda t: tasks.pop(key) if tasks.get(key) is t else None
             )
+            tasks[key] = task
 
         return debounced
 
     return decorator
 
 
+def get_module_owner(mod: ast.Module) -> Optional[ast.Module]:
+    """Get module annexing or including a module."""
+    if isinstance(mod.parent, ast.Module):
+        return mod.parent
+    if (
+        isinstance(mod.parent, ast.ModulePath)
+        and (imp := mod.parent.find_parent_of_type(ast.Import))
+        and imp.is_absorb
+    ):
+        return mod.parent.find_parent_of_type(ast.Module)
+    return None
+
+
+def get_module_deps(mod: ast.Module) -> set[str]:
+    """Get paths of modules a module imports, annexes or belongs to."""
+    paths = {i.loc.mod_path for i in [*mod.impl_mod, *mod.test_mod]}
+    if owner := get_module_owner(mod):
+        paths.add(owner.loc.mod_path)
+    for node in mod._in_mod_nodes:
+        if isinstance(node, (ast.ModulePath, ast.ModuleItem)) and node.sub_module:
+            paths.add(node.sub_module.loc.mod_path)
+    paths.discard(mod.loc.mod_path)
+    return paths
+
+
 def sym_tab_list(sym_tab: SymbolTable, file_path: str) -> list[SymbolTable]:
     """Iterate through symbol table."""
     sym_tabs = (
@@ -88,20 +118,23 @@ def sym_tab_list(sym_tab: SymbolTable, file_path: str) -> list[SymbolTable]:
 def find_deepest_symbol_node_at_pos(
     node: ast.AstNode, line: int, character: int
 ) -> Optional[ast.AstSymbolNode]:
-    """Return the deepest symbol node that contains the given position."""
-    last_symbol_node = None
-
-    if position_within_node(node, line, character):
-        if isinstance(node, ast.AstSymbolNode):
-            last_symbol_node = node
-
-        for child in [i for i in node.kid if i.loc.mod_path == node.loc.mod_path]:
-            if position_within_node(child, line, character):
-                deeper_node = find_deepest_symbol_node_at_pos(child, line, character)
-                if deeper_node is not None:
-                    last_symbol_node = deeper_node
-
-    return last_symbol_node
+    """Return the deepest symbol node that contains the given position.
+
+    Kids are walked last to first and a node is checked after its kids, so the
+    first symbol node found is the deepest one in the last matching kid.
+    """
+    stack = [(node, False)]
+    while stack:
+        cur, visited = stack.pop()
+        if visited:
+            if isinstance(cur, ast.AstSymbolNode):
+                return cur
+        elif position_within_node(cur, line, character):
+            stack.append((cur, True))
+            stack.extend(
+                (i, False) for i in cur.kid if i.loc.mod_path == cur.loc.mod_path
+            )
+    return None
 
 
 def position_within_node(node: ast.AstNode, line: int, character: int) -> bool:
@@ -133,9 +166,7 @@ def find_index(
 ) -> Optional[int]:
     """Find index."""
     index = None
-    for i, j in enumerate(
-        [get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)]
-    ):
+    for i, j in enumerate(get_token_positions(sem_tokens)):
         if j[0] == line and j[1] <= char <= j[2]:
             return i
 
@@ -486,6 +517,19 @@ def get_token_start(
     )
 
 
+def get_token_positions(sem_tokens: list[int]) -> list[tuple[int, int, int]]:
+    """Return the line, start and end character of every token."""
+    positions = []
+    line, char = 0, 0
+    for i in range(0, len(sem_tokens), 5):
+        if sem_tokens[i] > 0:
+            line += sem_tokens[i]
+            char = 0
+        char += sem_tokens[i + 1]
+        positions.append((line, char, char + sem_tokens[i + 2]))
+    return positions
+
+
 def find_surrounding_tokens(
     change_start_line: int,
     change_start_char: int,
@@ -497,9 +541,7 @@ def find_surrounding_tokens(
     prev_token_index = None
     next_token_index = None
     inside_tok = False
-    for i, tok in enumerate(
-        [get_token_start(i, sem_tokens) for i in range(0, len(sem_tokens), 5)][0:]
-    ):
+    for i, tok in enumerate(get_token_positions(sem_tokens)):
         if (not (prev_token_index is None or next_token_index is None)) and (
             tok[0] > change_end_line
             or (tok[0] == change_end_line and tok[1] > change_end_char)
@@ -6,18 +6,24 @@ import ast as ast3
 import fnmatch
 import html
 import os
-import pickle
 import types
 from collections import OrderedDict
 from dataclasses import field
 from functools import wraps
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Type,
+    Union,
+)
 from uuid import UUID
 
-import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import EdgeDir, colors
-from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
-from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope, registry_cache
 from jaclang.runtimelib.constructs import (
     Architype,
     DSFunc,
@@ -34,10 +40,14 @@ from jaclang.runtimelib.constructs import (
 )
 from jaclang.runtimelib.importer import ImportPathSpec, JacImporter, PythonImporter
 from jaclang.runtimelib.machine import JacMachine, JacProgram
-from jaclang.runtimelib.utils import traverse_graph
+from jaclang.runtimelib.utils import resolve_attr_scope, traverse_graph
 from jaclang.plugin.feature import JacFeature as Jac  # noqa: I100
 from jaclang.plugin.spec import P, T
 
+if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
+
 
 import pluggy
 
@@ -60,6 +70,69 @@ __all__ = [
 ]
 
 
+class EdgeBuilder:
+    """Edge spec built for a connect expression."""
+
+    def __init__(
+        self,
+        is_undirected: bool,
+        conn_type: Type[EdgeArchitype] | EdgeArchitype,
+        conn_assign: Optional[tuple[tuple, tuple]],
+    ) -> None:
+        """Create edge builder."""
+        self.is_undirected = is_undirected
+        self.conn_type = conn_type
+        self.conn_assign = conn_assign
+        # nodes already saved by this builder, so fan-out saves each node once
+        self.saved: set[NodeAnchor] = set()
+
+    def __call__(self, source: NodeAnchor, target: NodeAnchor) -> EdgeArchitype:
+        """Build an edge from source to target."""
+        edge = self.make(source, target, True)
+        self.save([edge.__jac__])
+        return edge
+
+    def make(
+        self, source: NodeAnchor, target: NodeAnchor, linked: bool
+    ) -> EdgeArchitype:
+        """Create an edge with its assigned fields."""
+        conn_type = self.conn_type
+        edge = conn_type() if isinstance(conn_type, type) else conn_type
+        edge.__attach__(source, target, self.is_undirected, linked)
+        if self.conn_assign:
+            for fld, val in zip(self.conn_assign[0], self.conn_assign[1]):
+                if hasattr(edge, fld):
+                    setattr(edge, fld, val)
+                else:
+                    raise ValueError(f"Invalid attribute: {fld}")
+        return edge
+
+    def build(
+        self, sources: list[NodeAnchor], targets: list[NodeAnchor]
+    ) -> list[EdgeArchitype]:
+        """Build edges from every source to every target in one pass."""
+        rows = [
+            [self.make(src, trg, False).__jac__ for trg in targets] for src in sources
+        ]
+        for source, row in zip(sources, rows):
+            source.edges.extend(row)
+        for i, target in enumerate(targets):
+            target.edges.extend(row[i] for row in rows)
+        anchors = [anchor for row in rows for anchor in row]
+        self.save(anchors)
+        return [anchor.architype for anchor in anchors]
+
+    def save(self, edges: list[EdgeAnchor]) -> None:
+        """Save edges touching a persistent node along with their nodes."""
+        for edge in edges:
+            if edge.source.persistent or edge.target.persistent:
+                edge.save()
+                for anchor in (edge.target, edge.source):
+                    if anchor not in self.saved:
+                        anchor.save()
+                        self.saved.add(anchor)
+
+
 class JacFeatureDefaults:
     """Jac Feature."""
 
@@ -97,6 +170,7 @@ class JacFeatureDefaults:
         """Create a new architype."""
         for i in on_entry + on_exit:
             i.resolve(cls)
+        WalkerAnchor.generation += 1
         if not hasattr(cls, "_jac_entry_funcs_") or not hasattr(
             cls, "_jac_exit_funcs_"
         ):
@@ -432,6 +506,7 @@ class JacFeatureDefaults:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
+        edge_type: Optional[type | types.UnionType],
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         if isinstance(node_obj, NodeArchitype):
@@ -445,7 +520,7 @@ class JacFeatureDefaults:
             connected_edges: list[EdgeArchitype] = []
             for node in node_obj:
                 connected_edges += node.__jac__.get_edges(
-                    dir, filter_func, target_obj=targ_obj_set
+                    dir, filter_func, target_obj=targ_obj_set, edge_type=edge_type
                 )
             return list(set(connected_edges))
         else:
@@ -453,7 +528,7 @@ class JacFeatureDefaults:
             for node in node_obj:
                 connected_nodes.extend(
                     node.__jac__.edges_to_nodes(
-                        dir, filter_func, target_obj=targ_obj_set
+                        dir, filter_func, target_obj=targ_obj_set, edge_type=edge_type
                     )
                 )
             return list(set(connected_nodes))
@@ -472,17 +547,20 @@ class JacFeatureDefaults:
         """
         left = [left] if isinstance(left, NodeArchitype) else left
         right = [right] if isinstance(right, NodeArchitype) else right
-        edges = []
 
         root = Jac.get_root().__jac__
 
-        for i in left:
-            _left = i.__jac__
-            if root.has_connect_access(_left):
-                for j in right:
-                    _right = j.__jac__
-                    if root.has_connect_access(_right):
-                        edges.append(edge_spec(_left, _right))
+        # access is resolved once per node instead of once per pair
+        sources = [i.__jac__ for i in left if root.has_connect_access(i.__jac__)]
+        targets = (
+            [j.__jac__ for j in right if root.has_connect_access(j.__jac__)]
+            if sources
+            else []
+        )
+        if isinstance(edge_spec, EdgeBuilder):
+            edges = edge_spec.build(sources, targets)
+        else:
+            edges = [edge_spec(src, trg) for src in sources for trg in targets]
         return right if not edges_only else edges
 
     @staticmethod
@@ -501,31 +579,10 @@ class JacFeatureDefaults:
         root = Jac.get_root().__jac__
 
         for i in left:
-            node = i.__jac__
-            for anchor in set(node.edges):
-                if (
-                    (source := anchor.source)
-                    and (target := anchor.target)
-                    and (not filter_func or filter_func([anchor.architype]))
-                    and source.architype
-                    and target.architype
-                ):
-                    if (
-                        dir in [EdgeDir.OUT, EdgeDir.ANY]
-                        and node == source
-                        and target.architype in right
-                        and root.has_write_access(target)
-                    ):
-                        anchor.destroy() if anchor.persistent else anchor.detach()
-                        disconnect_occurred = True
-                    if (
-                        dir in [EdgeDir.IN, EdgeDir.ANY]
-                        and node == target
-                        and source.architype in right
-                        and root.has_write_access(source)
-                    ):
-                        anchor.destroy() if anchor.persistent else anchor.detach()
-                        disconnect_occurred = True
+            for anchor, other in i.__jac__.find_edges(dir, filter_func, right):
+                if root.has_write_access(other):
+                    anchor.destroy() if anchor.persistent else anchor.detach()
+                    disconnect_occurred = True
 
         return disconnect_occurred
 
@@ -561,24 +618,7 @@ class JacFeatureDefaults:
         conn_assign: Optional[tuple[tuple, tuple]],
     ) -> Callable[[NodeAnchor, NodeAnchor], EdgeArchitype]:
         """Jac's root getter."""
-        conn_type = conn_type if conn_type else GenericEdge
-
-        def builder(source: NodeAnchor, target: NodeAnchor) -> EdgeArchitype:
-            edge = conn_type() if isinstance(conn_type, type) else conn_type
-            edge.__attach__(source, target, is_undirected)
-            if conn_assign:
-                for fld, val in zip(conn_assign[0], conn_assign[1]):
-                    if hasattr(edge, fld):
-                        setattr(edge, fld, val)
-                    else:
-                        raise ValueError(f"Invalid attribute: {fld}")
-            if source.persistent or target.persistent:
-                edge.__jac__.save()
-                target.save()
-                source.save()
-            return edge
-
-        return builder
+        return EdgeBuilder(is_undirected, conn_type or GenericEdge, conn_assign)
 
     @staticmethod
     @hookimpl
@@ -586,103 +626,38 @@ class JacFeatureDefaults:
         file_loc: str, scope: str, attr: str, return_semstr: bool
     ) -> Optional[str]:
         """Jac's get_semstr_type feature."""
-        _scope = SemScope.get_scope_from_str(scope)
-        with open(
-            os.path.join(
-                os.path.dirname(file_loc),
-                "__jac_gen__",
-                os.path.basename(file_loc).replace(".jac", ".registry.pkl"),
-            ),
-            "rb",
-        ) as f:
-            mod_registry: SemRegistry = pickle.load(f)
-        _, attr_seminfo = mod_registry.lookup(_scope, attr)
-        if attr_seminfo and isinstance(attr_seminfo, SemInfo):
-            return attr_seminfo.semstr if return_semstr else attr_seminfo.type
-        return None
+
+        def resolve(mod_registry: SemRegistry) -> Optional[str]:
+            _scope = SemScope.get_scope_from_str(scope)
+            _, attr_seminfo = mod_registry.lookup(_scope, attr)
+            if attr_seminfo and isinstance(attr_seminfo, SemInfo):
+                return attr_seminfo.semstr if return_semstr else attr_seminfo.type
+            return None
+
+        return registry_cache.resolve(
+            file_loc, ("get_semstr_type", scope, attr, return_semstr), resolve
+        )
 
     @staticmethod
     @hookimpl
     def obj_scope(file_loc: str, attr: str) -> str:
         """Jac's gather_scope feature."""
-        with open(
-            os.path.join(
-                os.path.dirname(file_loc),
-                "__jac_gen__",
-                os.path.basename(file_loc).replace(".jac", ".registry.pkl"),
-            ),
-            "rb",
-        ) as f:
-            mod_registry: SemRegistry = pickle.load(f)
-
-        attr_scope = None
-        for x in attr.split("."):
-            attr_scope, attr_sem_info = mod_registry.lookup(attr_scope, x)
-            if isinstance(attr_sem_info, SemInfo) and attr_sem_info.type not in [
-                "class",
-                "obj",
-                "node",
-                "edge",
-            ]:
-                attr_scope, attr_sem_info = mod_registry.lookup(
-                    None, attr_sem_info.type
-                )
-                if isinstance(attr_sem_info, SemInfo) and isinstance(
-                    attr_sem_info.type, str
-                ):
-                    attr_scope = SemScope(
-                        attr_sem_info.name, attr_sem_info.type, attr_scope
-                    )
-            else:
-                if isinstance(attr_sem_info, SemInfo) and isinstance(
-                    attr_sem_info.type, str
-                ):
-                    attr_scope = SemScope(
-                        attr_sem_info.name, attr_sem_info.type, attr_scope
-                    )
-        return str(attr_scope)
+        return registry_cache.resolve(
+            file_loc,
+            ("obj_scope", attr),
+            lambda mod_registry: str(resolve_attr_scope(mod_registry, attr)[0]),
+        )
 
     @staticmethod
     @hookimpl
     def get_sem_type(file_loc: str, attr: str) -> tuple[str | None, str | None]:
-        with open(
-            os.path.join(
-                os.path.dirname(file_loc),
-                "__jac_gen__",
-                os.path.basename(file_loc).replace(".jac", ".registry.pkl"),
-            ),
-            "rb",
-        ) as f:
-            mod_registry: SemRegistry = pickle.load(f)
-
-        attr_scope = None
-        for x in attr.split("."):
-            attr_scope, attr_sem_info = mod_registry.lookup(attr_scope, x)
-            if isinstance(attr_sem_info, SemInfo) and attr_sem_info.type not in [
-                "class",
-                "obj",
-                "node",
-                "edge",
-            ]:
-                attr_scope, attr_sem_info = mod_registry.lookup(
-                    None, attr_sem_info.type
-                )
-                if isinstance(attr_sem_info, SemInfo) and isinstance(
-                    attr_sem_info.type, str
-                ):
-                    attr_scope = SemScope(
-                        attr_sem_info.name, attr_sem_info.type, attr_scope
-                    )
-            else:
-                if isinstance(attr_sem_info, SemInfo) and isinstance(
-                    attr_sem_info.type, str
-                ):
-                    attr_scope = SemScope(
-                        attr_sem_info.name, attr_sem_info.type, attr_scope
-                    )
-        if isinstance(attr_sem_info, SemInfo) and isinstance(attr_scope, SemScope):
-            return attr_sem_info.semstr, attr_scope.as_type_str
-        return "", ""
+        def resolve(mod_registry: SemRegistry) -> tuple[str | None, str | None]:
+            attr_scope, attr_sem_info = resolve_attr_scope(mod_registry, attr)
+            if isinstance(attr_sem_info, SemInfo) and isinstance(attr_scope, SemScope):
+                return attr_sem_info.semstr, attr_scope.as_type_str
+            return "", ""
+
+        return registry_cache.resolve(file_loc, ("get_sem_type", attr), resolve)
 
     @staticmethod
     @hookimpl
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import ast as ast3
 import types
-from typing import Any, Callable, Mapping, Optional, Sequence, Type, TypeAlias, Union
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Type,
+    TypeAlias,
+    Union,
+)
 
-import jaclang.compiler.absyntree as ast
-from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
 from jaclang.plugin.spec import JacBuiltin, JacCmdSpec, JacFeatureSpec, P, T
 from jaclang.runtimelib.constructs import (
     Architype,
@@ -19,6 +27,10 @@ from jaclang.runtimelib.constructs import (
 )
 from jaclang.runtimelib.context import ExecutionContext
 
+if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
+
 import pluggy
 
 pm = pluggy.PluginManager("jac")
@@ -212,6 +224,7 @@ class JacFeature:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool = False,
+        edge_type: Optional[type | types.UnionType] = None,
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         return pm.hook.edge_ref(
@@ -220,6 +233,7 @@ class JacFeature:
             dir=dir,
             filter_func=filter_func,
             edges_only=edges_only,
+            edge_type=edge_type,
         )
 
     @staticmethod
@@ -17,10 +17,9 @@ from typing import (
     Union,
 )
 
-import jaclang.compiler.absyntree as ast
-from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
-
 if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_gen_pass import PyastGenPass
     from jaclang.plugin.default import (
         Architype,
         EdgeDir,
@@ -214,6 +213,7 @@ class JacFeatureSpec:
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         edges_only: bool,
+        edge_type: Optional[type | types.UnionType],
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
         raise NotImplementedError
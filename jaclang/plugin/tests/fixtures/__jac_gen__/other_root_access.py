@@ -0,0 +1,94 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    from jaclang.runtimelib.architype import Anchor
+else:
+    Anchor, = __jac_import__(target='jaclang.runtimelib.architype', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'Anchor': None})
+if _jac_typ.TYPE_CHECKING:
+    from uuid import UUID
+else:
+    UUID, = __jac_import__(target='uuid', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'UUID': None})
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class A(_Jac.Node):
+    val: int
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter', _Jac.RootType), _Jac.DSFunc('enter2', A)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class check_node(_Jac.Walker):
+
+    def enter(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    def enter2(self, _jac_here_: A) -> None:
+        print(_jac_here_)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter2', A)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class update_node(_Jac.Walker):
+    val: int
+
+    def enter2(self, _jac_here_: A) -> None:
+        _jac_here_.val = self.val
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class create_node(_Jac.Walker):
+    val: int
+
+    def enter(self, _jac_here_: _Jac.RootType) -> None:
+        a = A(val=self.val)
+        _Jac.connect(left=_jac_here_, right=a, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+        print(a.__jac__.id)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class create_other_root(_Jac.Walker):
+
+    def enter(self, _jac_here_: _Jac.RootType) -> None:
+        other_root = _Jac.RootType().__jac__
+        other_root.save()
+        print(other_root.id)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter_root', _Jac.RootType), _Jac.DSFunc('enter_nested', A)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class allow_other_root_access(_Jac.Walker):
+    root_id: str
+    level: int | str = _Jac.has_instance_default(gen_func=lambda: 1)
+    via_all: bool = _Jac.has_instance_default(gen_func=lambda: False)
+
+    def enter_root(self, _jac_here_: _Jac.RootType) -> None:
+        if self.via_all:
+            _jac_here_.__jac__.unrestrict(self.level)
+        else:
+            _jac_here_.__jac__.allow_root(UUID(self.root_id), self.level)
+
+    def enter_nested(self, _jac_here_: A) -> None:
+        if self.via_all:
+            _jac_here_.__jac__.unrestrict(self.level)
+        else:
+            _jac_here_.__jac__.allow_root(UUID(self.root_id), self.level)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('enter_root', _Jac.RootType), _Jac.DSFunc('enter_nested', A)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class disallow_other_root_access(_Jac.Walker):
+    root_id: str
+    via_all: bool = _Jac.has_instance_default(gen_func=lambda: False)
+
+    def enter_root(self, _jac_here_: _Jac.RootType) -> None:
+        if self.via_all:
+            _jac_here_.__jac__.restrict()
+        else:
+            _jac_here_.__jac__.disallow_root(UUID(self.root_id))
+
+    def enter_nested(self, _jac_here_: A) -> None:
+        if self.via_all:
+            _jac_here_.__jac__.restrict()
+        else:
+            _jac_here_.__jac__.disallow_root(UUID(self.root_id))
\ No newline at end of file
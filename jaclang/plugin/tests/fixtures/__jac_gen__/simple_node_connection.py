@@ -0,0 +1,67 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class simple(_Jac.Node):
+    tag: str
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class simple_edge(_Jac.Edge):
+    index: int = _Jac.has_instance_default(gen_func=lambda: 0)
+if not _Jac.edge_ref(_Jac.get_root(), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None):
+    _Jac.connect(left=_Jac.get_root(), right=simple(tag='first'), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=simple_edge, conn_assign=(('index',), (0,))))
+    _Jac.connect(left=_Jac.get_root(), right=simple(tag='second'), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=simple_edge, conn_assign=(('index',), (1,))))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_edge_get_edge(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        print(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, simple_edge) if i.index == 1], edges_only=True, edge_type=simple_edge))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_edge_get_node(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        print(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, simple_edge) if i.index == 1], edges_only=False, edge_type=simple_edge))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_node_get_node(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        print((lambda x: [i for i in x if i.tag == 'second'])(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_node_get_edge(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        print((lambda x: [i for i in x if i.tag == 'second'])(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=True, edge_type=None)))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType), _Jac.DSFunc('end', simple)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_edge_visit(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, simple_edge) if i.index == 0], edges_only=False, edge_type=simple_edge)):
+            pass
+
+    def end(self, _jac_here_: simple) -> None:
+        print(_jac_here_)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('filter', _Jac.RootType), _Jac.DSFunc('end', simple)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class filter_on_node_visit(_Jac.Walker):
+
+    def filter(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, (lambda x: [i for i in x if i.tag == 'first'])(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None))):
+            pass
+
+    def end(self, _jac_here_: simple) -> None:
+        print(_jac_here_)
\ No newline at end of file
@@ -1,10 +1,32 @@
 """Test for jaseci plugin."""
 
+import gc
 import io
 import os
 import sys
+import weakref
+from dataclasses import dataclass
+from unittest.mock import patch
 
 from jaclang.cli import cli
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.architype import (
+    AccessLevel,
+    Anchor,
+    DSFunc,
+    EdgeAnchor,
+    EdgeList,
+    NodeAnchor,
+    WalkerAnchor,
+)
+from jaclang.runtimelib.constructs import (
+    ExecutionContext,
+    NodeArchitype,
+    Root,
+    WalkerArchitype,
+)
+from jaclang.settings import settings
 from jaclang.utils.test import TestCase
 
 session = ""
@@ -58,6 +80,21 @@ class TestJaseciPlugin(TestCase):
         self.assertEqual(output, "node a\nnode b")
         self._del_session(session)
 
+    def test_walker_sqlite_persistent(self) -> None:
+        """Test simple persistent object on sqlite session."""
+        session = self.fixture_abs_path("test_walker_sqlite_persistent.db")
+        self._output2buffer()
+        for entrypoint in ("create", "traverse"):
+            cli.enter(
+                filename=self.fixture_abs_path("simple_persistent.jac"),
+                session=f"sqlite://{session}",
+                entrypoint=entrypoint,
+                args=[],
+            )
+        output = self.capturedOutput.getvalue().strip()
+        self.assertEqual(output, "node a\nnode b")
+        self._del_session(session)
+
     def test_entrypoint_root(self) -> None:
         """Test entrypoint being root."""
         session = self.fixture_abs_path("test_entrypoint_root.session")
@@ -589,3 +626,292 @@ class TestJaseciPlugin(TestCase):
         )
 
         self._del_session(session)
+
+    def test_access_cache_invalidation(self) -> None:
+        """Test cached access decisions are dropped on permission changes."""
+        jctx = ExecutionContext.create()
+        owner = Root().__jac__
+        owner.save()
+        jctx.root = owner
+        anchor = NodeArchitype().__jac__
+        anchor.save()
+
+        other = Root().__jac__
+        jctx.root = other
+        self.assertFalse(other.has_read_access(anchor))
+        self.assertIn((other.id, anchor.id), jctx.access_cache)
+
+        anchor.allow_root(other.id)
+        self.assertTrue(other.has_read_access(anchor))
+        self.assertFalse(other.has_connect_access(anchor))
+
+        owner.unrestrict(AccessLevel.WRITE)
+        self.assertTrue(other.has_write_access(anchor))
+
+        owner.restrict()
+        anchor.disallow_root(other.id)
+        self.assertFalse(other.has_read_access(anchor))
+        jctx.close()
+
+    def test_dirty_tracking(self) -> None:
+        """Test only changed anchors are flagged for write back."""
+        session = self.fixture_abs_path("test_dirty_tracking.session")
+        jctx = ExecutionContext.create(session=session)
+        edge_spec = Jac.build_edge(False, None, None)
+        Jac.connect(jctx.root.architype, NodeArchitype(), edge_spec)
+        jctx.close()
+
+        jctx = ExecutionContext.create(session=session)
+        root = jctx.root
+        self.assertFalse(root.is_dirty())
+        edge = next(iter(root.edges))
+        node = edge.target
+        self.assertFalse(edge.is_dirty() or node.is_dirty())
+
+        node.architype.val = 1
+        self.assertTrue(node.is_dirty())
+        self.assertFalse(root.is_dirty())
+
+        edge.destroy()
+        self.assertTrue(root.is_dirty())
+        jctx.close()
+
+        jctx = ExecutionContext.create(session=session)
+        self.assertEqual(len(jctx.root.edges), 0)
+        jctx.close()
+        self._del_session(session)
+
+    def test_in_place_mutation(self) -> None:
+        """Test containers mutated in place are written back on close."""
+        for session in (
+            self.fixture_abs_path("test_in_place_mutation.session"),
+            "sqlite://" + self.fixture_abs_path("test_in_place_mutation.db"),
+        ):
+            jctx = ExecutionContext.create(session=session)
+            node = NodeArchitype()
+            node.items = []
+            Jac.connect(jctx.root.architype, node, Jac.build_edge(False, None, None))
+            jctx.close()
+
+            jctx = ExecutionContext.create(session=session)
+            with patch.object(
+                Anchor, "mutable_hash", autospec=True, side_effect=Anchor.mutable_hash
+            ) as mutable_hash:
+                (node,) = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+                # loading reads the stored hash, it is only computed when checked
+                self.assertFalse(mutable_hash.called)
+                self.assertFalse(node.__jac__.is_dirty())
+            self.assertEqual(mutable_hash.call_count, 1)
+            node.items.append(1)
+            self.assertTrue(node.__jac__.is_dirty())
+            jctx.close()
+
+            jctx = ExecutionContext.create(session=session)
+            (node,) = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+            self.assertEqual(node.items, [1])
+            jctx.close()
+            self._del_session(session.rpartition("://")[2])
+
+    def test_memory_budget_in_place_mutation(self) -> None:
+        """Test in place changes to anchors beyond the budget are written back."""
+        for session in (
+            self.fixture_abs_path("test_budget_mutation.session"),
+            "sqlite://" + self.fixture_abs_path("test_budget_mutation.db"),
+        ):
+            jctx = ExecutionContext.create(session=session)
+            nodes = [NodeArchitype() for _ in range(50)]
+            for node in nodes:
+                node.tags = []
+            Jac.connect(jctx.root.architype, nodes, Jac.build_edge(False, None, None))
+            jctx.close()
+
+            with patch.object(settings, "memory_budget", 3):
+                jctx = ExecutionContext.create(session=session)
+            for node in jctx.root.edges_to_nodes(EdgeDir.OUT, None, None):
+                node.tags.append(1)
+            del nodes, node
+            gc.collect()
+            jctx.close()
+
+            jctx = ExecutionContext.create(session=session)
+            nodes = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+            self.assertEqual([node.tags for node in nodes], [[1]] * 50)
+            jctx.close()
+            self._del_session(session.rpartition("://")[2])
+
+    def test_batch_edge_population(self) -> None:
+        """Test persisted edges and nodes are populated through batch finds."""
+        session = self.fixture_abs_path("test_batch_edge_population.session")
+        jctx = ExecutionContext.create(session=session)
+        nodes = [NodeArchitype() for _ in range(3)]
+        Jac.connect(jctx.root.architype, nodes, Jac.build_edge(False, None, None))
+        jctx.close()
+
+        jctx = ExecutionContext.create(session=session)
+        root = jctx.root
+        self.assertEqual(root.edges.pages, [None])
+
+        mem = jctx.mem
+        with patch.object(mem, "find", wraps=mem.find) as find, patch.object(
+            mem, "find_by_id", wraps=mem.find_by_id
+        ) as find_by_id:
+            self.assertEqual(len(root.edges_to_nodes(EdgeDir.OUT, None, None)), 3)
+        self.assertEqual([len(call.args[0]) for call in find.call_args_list], [3, 3])
+        find_by_id.assert_not_called()
+        jctx.close()
+        self._del_session(session)
+
+    def test_connect_bulk(self) -> None:
+        """Test connect adds the edges of a node at once."""
+        jctx = ExecutionContext.create()
+        hubs = [NodeArchitype() for _ in range(2)]
+        leaves = [NodeArchitype() for _ in range(3)]
+        with patch.object(
+            EdgeList, "extend", autospec=True, side_effect=EdgeList.extend
+        ) as extend, patch.object(EdgeList, "append") as append:
+            edges = Jac.connect(
+                hubs, leaves, Jac.build_edge(False, None, None), edges_only=True
+            )
+        self.assertEqual(extend.call_count, 5)
+        append.assert_not_called()
+        self.assertEqual(len(edges), 6)
+        self.assertEqual([len(hub.__jac__.edges) for hub in hubs], [3, 3])
+        self.assertEqual([len(leaf.__jac__.edges) for leaf in leaves], [2, 2, 2])
+        self.assertEqual(
+            [edge.__jac__.target.architype for edge in edges], leaves + leaves
+        )
+        jctx.close()
+
+    def test_walker_abilities_weak(self) -> None:
+        """Test cached abilities are kept on the walker and drop node classes."""
+        jctx = ExecutionContext.create()
+
+        @Jac.make_walker(on_entry=[DSFunc("greet", None)], on_exit=[])
+        @dataclass(eq=False)
+        class Greeter(WalkerArchitype):
+            """Test walker."""
+
+            count: int = 0
+
+            def greet(self, _: object) -> None:
+                self.count += 1
+
+        @Jac.make_node(on_entry=[], on_exit=[])
+        @dataclass(eq=False)
+        class Item(NodeArchitype):
+            """Test node."""
+
+        self.assertEqual(Jac.spawn_call(Greeter(), Item()).count, 1)
+        generation, table = Greeter.__dict__["_jac_abilities_"]
+        self.assertEqual(generation, WalkerAnchor.generation)
+        self.assertEqual(list(table), [Item])
+        self.assertNotIn("_jac_abilities_", WalkerArchitype.__dict__)
+        jctx.close()
+
+        item = weakref.ref(Item)
+        del Item
+        gc.collect()
+        self.assertIsNone(item())
+        self.assertEqual(list(table), [])
+
+    def test_edge_pages(self) -> None:
+        """Test edges are stored in pages loaded and written only as needed."""
+        for session in (
+            self.fixture_abs_path("test_edge_pages.session"),
+            "sqlite://" + self.fixture_abs_path("test_edge_pages.db"),
+        ):
+            with patch.object(EdgeList, "PAGE_SIZE", 2):
+                jctx = ExecutionContext.create(session=session)
+                nodes = [NodeArchitype() for _ in range(5)]
+                edge_spec = Jac.build_edge(False, None, None)
+                Jac.connect(jctx.root.architype, nodes, edge_spec)
+                jctx.close()
+
+                jctx = ExecutionContext.create(session=session)
+                root = jctx.root
+                self.assertEqual((len(root.edges), root.edges.pages), (5, [None] * 3))
+                Jac.connect(root.architype, NodeArchitype(), edge_spec)
+                self.assertEqual(root.edges.pages, [None] * 3)
+                with patch.object(
+                    jctx.mem, "load_edge_page", wraps=jctx.mem.load_edge_page
+                ) as load_edge_page:
+                    jctx.close()
+                load_edge_page.assert_called_once_with(root.id, 2)
+
+                jctx = ExecutionContext.create(session=session)
+                nodes = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+                ids = [node.__jac__.id for node in nodes]
+                edges = [edge.id for edge in jctx.root.edges]
+                self.assertEqual(len(ids), 6)
+                self.assertEqual(len(jctx.root.edges.pages), 3)
+                nodes[0].__jac__.destroy()
+                jctx.close()
+
+                jctx = ExecutionContext.create(session=session)
+                root = jctx.root
+                self.assertEqual(len(root.edges.pages), 3)
+                nodes = root.edges_to_nodes(EdgeDir.OUT, None, None)
+                self.assertEqual([node.__jac__.id for node in nodes], ids[1:])
+                jctx.close()
+
+                jctx = ExecutionContext.create(session=session)
+                root = jctx.root
+                edge = jctx.mem.find_by_id(edges[4])
+                assert isinstance(edge, EdgeAnchor)
+                with patch.object(
+                    jctx.mem, "load_edge_page", wraps=jctx.mem.load_edge_page
+                ) as load_edge_page:
+                    self.assertIn(edge, root.edges)
+                    root.edges.remove(edge)
+                    self.assertNotIn(edge, root.edges)
+                load_edge_page.assert_called_once_with(root.id, 1)
+                jctx.close()
+
+                jctx = ExecutionContext.create(session=session)
+                nodes = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+                self.assertEqual(
+                    [node.__jac__.id for node in nodes], ids[1:4] + ids[5:]
+                )
+                jctx.close()
+            self._del_session(session.rpartition("://")[2])
+
+    def test_memory_budget(self) -> None:
+        """Test clean anchors are evicted beyond the budget unless still in use."""
+        session = self.fixture_abs_path("test_memory_budget.session")
+        jctx = ExecutionContext.create(session=session)
+        nodes = [NodeArchitype() for _ in range(5)]
+        Jac.connect(jctx.root.architype, nodes, Jac.build_edge(False, None, None))
+        jctx.close()
+
+        with patch.object(settings, "memory_budget", 4):
+            jctx = ExecutionContext.create(session=session)
+        nodes = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(set(jctx.mem.__mem__), {n.__jac__.id for n in nodes})
+        for node in nodes:
+            self.assertIs(jctx.mem.find_by_id(node.__jac__.id), node.__jac__)
+        self.assertEqual(len(jctx.mem.__mem__), 5)
+
+        nodes[0].val = 1
+        del nodes
+        gc.collect()
+        self.assertEqual(list(jctx.mem.__evicted__), [jctx.root.id])
+        jctx.close()
+
+        jctx = ExecutionContext.create(session=session)
+        nodes = jctx.root.edges_to_nodes(EdgeDir.OUT, None, None)
+        self.assertEqual([getattr(node, "val", None) for node in nodes[:2]], [1, None])
+        jctx.close()
+
+        with patch.object(settings, "memory_budget", 2):
+            jctx = ExecutionContext.create(session=session)
+        with patch.object(
+            NodeAnchor, "is_dirty", autospec=True, side_effect=NodeAnchor.is_dirty
+        ) as is_dirty:
+            nodes = [NodeArchitype() for _ in range(200)]
+            Jac.connect(jctx.root.architype, nodes, Jac.build_edge(False, None, None))
+        # new anchors are never eviction candidates, so they aren't rescanned
+        self.assertLess(is_dirty.call_count, 10)
+        self.assertEqual(len(jctx.mem.__clean__), 0)
+        jctx.close()
+        self._del_session(session)
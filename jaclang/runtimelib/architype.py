@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
-from enum import IntEnum
+from collections import deque
+from dataclasses import InitVar, asdict, dataclass, field, fields, is_dataclass
+from enum import Enum, IntEnum
+from hashlib import blake2b
 from logging import getLogger
 from pickle import dumps
 from types import UnionType
-from typing import Any, Callable, ClassVar, Iterable, Optional, TypeVar
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, TypeVar
 from uuid import UUID, uuid4
+from weakref import WeakKeyDictionary
 
 from jaclang.compiler.constant import EdgeDir
 from jaclang.runtimelib.utils import collect_node_connections
@@ -18,6 +21,9 @@ logger = getLogger(__name__)
 TARCH = TypeVar("TARCH", bound="Architype")
 TANCH = TypeVar("TANCH", bound="Anchor")
 
+# architype field values that can only change by assignment
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, UUID, Enum)
+
 
 class AccessLevel(IntEnum):
     """Access level enum."""
@@ -68,14 +74,23 @@ class AnchorReport:
 
 @dataclass(eq=False, repr=False, kw_only=True)
 class Anchor:
-    """Object Anchor."""
+    """Object Anchor.
+
+    `dirty` marks anchors that must be written back on close. It is set for new
+    anchors, on attribute assignment to the architype and on permission or edge
+    changes. Fields that can be mutated in place (containers and objects) are
+    hashed into `hash` when the anchor is written, which is stored with it. A
+    loaded anchor not flagged dirty is only hashed again when checked on close or
+    eviction.
+    """
 
     architype: Architype
     id: UUID = field(default_factory=uuid4)
     root: Optional[UUID] = None
     access: Permission = field(default_factory=Permission)
     persistent: bool = False
-    hash: int = 0
+    dirty: bool = True
+    hash: Optional[bytes] = None
 
     ##########################################################################
     #                             ACCESS CONTROL: TODO: Make Base Type       #
@@ -91,6 +106,7 @@ class Anchor:
         _root_id = str(root_id)
         if level != access.anchors.get(_root_id, AccessLevel.NO_ACCESS):
             access.anchors[_root_id] = level
+            self.access_changed()
 
     def disallow_root(
         self, root_id: UUID, level: AccessLevel | int | str = AccessLevel.READ
@@ -99,18 +115,29 @@ class Anchor:
         level = AccessLevel.cast(level)
         access = self.access.roots
 
-        access.anchors.pop(str(root_id), None)
+        if access.anchors.pop(str(root_id), None) is not None:
+            self.access_changed()
 
     def unrestrict(self, level: AccessLevel | int | str = AccessLevel.READ) -> None:
         """Allow everyone to access current Architype."""
         level = AccessLevel.cast(level)
         if level != self.access.all:
             self.access.all = level
+            self.access_changed()
 
     def restrict(self) -> None:
         """Disallow others to access current Architype."""
         if self.access.all > AccessLevel.NO_ACCESS:
             self.access.all = AccessLevel.NO_ACCESS
+            self.access_changed()
+
+    def access_changed(self) -> None:
+        """Drop cached access decisions after a permission change."""
+        self.mark_dirty()
+        if self.persistent:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            Jac.get_context().access_cache.clear()
 
     def has_read_access(self, to: Anchor) -> bool:
         """Read Access Validation."""
@@ -138,6 +165,9 @@ class Anchor:
 
     def access_level(self, to: Anchor) -> AccessLevel:
         """Access validation."""
+        if not to.is_populated():
+            to.populate()
+
         if not to.persistent:
             return AccessLevel.WRITE
 
@@ -153,6 +183,10 @@ class Anchor:
         if jroot == jctx.system_root or jroot.id == to.root or jroot == to:
             return AccessLevel.WRITE
 
+        # decisions are cached per current root and target until permissions change
+        if (access_level := jctx.access_cache.get((jroot.id, to.id))) is not None:
+            return access_level
+
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
@@ -175,6 +209,7 @@ class Anchor:
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
+        jctx.access_cache[(jroot.id, to.id)] = access_level
         return access_level
 
     # ---------------------------------------------------------------------- #
@@ -185,6 +220,10 @@ class Anchor:
 
         jctx = Jac.get_context()
 
+        if self.persistent and self.root != jctx.root.id:
+            jctx.access_cache.clear()
+            self.mark_dirty()
+
         self.persistent = True
         self.root = jctx.root.id
 
@@ -199,6 +238,34 @@ class Anchor:
         if jctx.root.has_write_access(self):
             jctx.mem.remove(self.id)
 
+    def mark_dirty(self) -> None:
+        """Flag anchor for write back."""
+        # populated stubs are copies, the architype links the loaded anchor
+        anchor = self.architype.__jac__
+        if not anchor.dirty:
+            anchor.dirty = True
+            if anchor.persistent:
+                from jaclang.plugin.feature import JacFeature as Jac
+
+                # evicted anchors are only weakly held, keep it until closed
+                Jac.get_context().mem.get(anchor.id)
+
+    def is_dirty(self) -> bool:
+        """Check if anchor has unsaved changes."""
+        anchor = self.architype.__jac__
+        if not anchor.dirty:
+            anchor.dirty = anchor.hash != anchor.mutable_hash()
+        return anchor.dirty
+
+    def mutable_hash(self) -> Optional[bytes]:
+        """Hash architype fields that can change in place, None if there are none."""
+        state = {
+            name: value
+            for name, value in self.architype.__dict__.items()
+            if name != "__jac__" and not isinstance(value, IMMUTABLE_TYPES)
+        }
+        return blake2b(dumps(state), digest_size=16).digest() if state else None
+
     def is_populated(self) -> bool:
         """Check if state."""
         return "architype" in self.__dict__
@@ -218,7 +285,7 @@ class Anchor:
         jsrc = Jac.get_context().mem
 
         if anchor := jsrc.find_by_id(self.id):
-            self.__dict__.update(anchor.__dict__)
+            jsrc.link(self, anchor)
 
     def __getattr__(self, name: str) -> object:
         """Trigger load if detects unloaded state."""
@@ -249,6 +316,7 @@ class Anchor:
                 "root": self.root,
                 "access": self.access,
                 "persistent": self.persistent,
+                "hash": self.hash,
             }
         else:
             return {"id": self.id}
@@ -257,9 +325,13 @@ class Anchor:
         """Deserialize Anchor."""
         self.__dict__.update(state)
 
+        self.dirty = False
+
         if self.is_populated() and self.architype:
             self.architype.__jac__ = self
-            self.hash = hash(dumps(self))
+            if "hash" not in state:
+                # records from before hashes were stored with them
+                self.hash = self.mutable_hash()
 
     def __repr__(self) -> str:
         """Override representation."""
@@ -297,89 +369,340 @@ class Anchor:
         return False
 
 
+class EdgeList:
+    """Ordered edges of a node with adjacency index by direction and type.
+
+    Persisted edges are stored apart from their node in pages of `PAGE_SIZE`
+    edge stubs, loaded through `Memory.load_edge_page` only when traversal
+    reaches them. Edges added since loading are kept in `added` without loading
+    any page. Pages and `added` are id keyed dicts so removal is O(1) while
+    iteration keeps insertion order, and a self loop is stored once even though
+    both of its ends append it. The page of a stored edge is found through
+    `Memory.find_edge_page` so removal and membership load only that page, and
+    `removed` keeps the stored edges whose page entry must be dropped. The
+    adjacency index is built lazily on first
+    lookup, populating the edge stubs with a single `Memory.find` call. `dirty`
+    is set once edges are added or removed, `stale` once a stored edge is
+    removed and every page must be written again.
+    """
+
+    PAGE_SIZE: ClassVar[int] = 256
+
+    def __init__(
+        self,
+        edges: Iterable[EdgeAnchor] = (),
+        node: Optional[UUID] = None,
+        count: int = 0,
+    ) -> None:
+        """Create edge list of a node with count edges in stored pages."""
+        self.node = node
+        self.count = count
+        self.pages: list[Optional[dict[UUID, EdgeAnchor]]] = [None] * -(
+            -count // self.PAGE_SIZE
+        )
+        self.added: dict[UUID, EdgeAnchor] = {edge.id: edge for edge in edges}
+        self.removed: set[UUID] = set()
+        self.indexed = False
+        self.dirty = False
+        self.stale = False
+        self.outgoing: dict[UUID, dict[type, dict[UUID, EdgeAnchor]]] = {}
+        self.incoming: dict[UUID, dict[type, dict[UUID, EdgeAnchor]]] = {}
+        self.pairs: dict[tuple[UUID, UUID], dict[UUID, EdgeAnchor]] = {}
+
+    def load(self, page: int) -> dict[UUID, EdgeAnchor]:
+        """Get a stored page, loading it on first access."""
+        if (edges := self.pages[page]) is None:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            assert self.node is not None
+            edges = self.pages[page] = {
+                edge.id: edge
+                for edge in Jac.get_context().mem.load_edge_page(self.node, page)
+            }
+        return edges
+
+    def locate(self, edge: UUID) -> Optional[int]:
+        """Get the stored page holding an edge, loading no other page."""
+        for page, edges in enumerate(self.pages):
+            if edges is not None and edge in edges:
+                return page
+        if self.node is not None and None in self.pages:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            found = Jac.get_context().mem.find_edge_page(self.node, edge)
+            if (
+                found is not None
+                and found < len(self.pages)
+                and self.pages[found] is None
+                and edge in self.load(found)
+            ):
+                return found
+        return None
+
+    def groups(self) -> Iterator[dict[UUID, EdgeAnchor]]:
+        """Yield stored pages in order, loading them as reached, then additions."""
+        for page in range(len(self.pages)):
+            yield self.load(page)
+        yield self.added
+
+    def append(self, edge: EdgeAnchor) -> None:
+        """Add edge."""
+        if self.added.setdefault(edge.id, edge) is edge:
+            self.dirty = True
+            if self.indexed:
+                self.index(edge)
+
+    def extend(self, edges: Iterable[EdgeAnchor]) -> None:
+        """Add edges at once."""
+        added, indexed = self.added, self.indexed
+        for edge in edges:
+            if added.setdefault(edge.id, edge) is edge:
+                self.dirty = True
+                if indexed:
+                    self.index(edge)
+
+    def remove(self, edge: EdgeAnchor) -> None:
+        """Remove edge by id if present."""
+        if (ed := self.added.pop(edge.id, None)) is None:
+            if (page := self.locate(edge.id)) is None:
+                return
+            ed = self.load(page).pop(edge.id)
+            self.count -= 1
+            self.stale = True
+            self.removed.add(edge.id)
+        self.dirty = True
+        if self.indexed:
+            self.unindex(ed)
+
+    def clear(self) -> None:
+        """Remove all edges."""
+        if self:
+            self.dirty = True
+        self.stale = self.stale or bool(self.pages)
+        for page in range(len(self.pages)):
+            self.removed.update(self.load(page))
+        self.pages = [{} for _ in self.pages]
+        self.count = 0
+        self.added.clear()
+        self.outgoing.clear()
+        self.incoming.clear()
+        self.pairs.clear()
+
+    def index(self, edge: EdgeAnchor) -> None:
+        """Add edge to adjacency index."""
+        src, trg = edge.source.id, edge.target.id
+        cls = edge.architype.__class__
+        self.outgoing.setdefault(src, {}).setdefault(cls, {})[edge.id] = edge
+        self.incoming.setdefault(trg, {}).setdefault(cls, {})[edge.id] = edge
+        self.pairs.setdefault((src, trg), {})[edge.id] = edge
+
+    def unindex(self, edge: EdgeAnchor) -> None:
+        """Remove edge from adjacency index."""
+        src, trg = edge.source.id, edge.target.id
+        cls = edge.architype.__class__
+        for bucket, key in ((self.outgoing, src), (self.incoming, trg)):
+            if (types := bucket.get(key)) and (edges := types.get(cls)):
+                edges.pop(edge.id, None)
+                if not edges:
+                    types.pop(cls)
+                    if not types:
+                        bucket.pop(key)
+        if edges := self.pairs.get((src, trg)):
+            edges.pop(edge.id, None)
+            if not edges:
+                self.pairs.pop((src, trg))
+
+    def reindex(self) -> None:
+        """Rebuild adjacency index from edges."""
+        self.outgoing.clear()
+        self.incoming.clear()
+        self.pairs.clear()
+        if stubs := [edge for edge in self if not edge.is_populated()]:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            Jac.get_context().mem.populate(stubs)
+        for edge in self:
+            self.index(edge)
+        self.indexed = True
+
+    def changes(
+        self,
+    ) -> tuple[dict[int, list[EdgeAnchor]], range, dict[UUID, int], set[UUID]]:
+        """Get pages to write, pages to delete, moved edges and dropped edges."""
+        size = self.PAGE_SIZE
+        if self.stale:
+            first, edges, kept = 0, list(self), 0
+        else:
+            first = self.count // size
+            edges = [
+                *(self.load(first).values() if first < len(self.pages) else ()),
+                *self.added.values(),
+            ]
+            kept = len(edges) - len(self.added)
+        pages = {
+            first + i // size: [edge.make_stub() for edge in edges[i : i + size]]
+            for i in range(0, len(edges), size)
+        }
+        # edges already on the first written page keep their page entry
+        moved = {
+            edge.id: first + (kept + i) // size for i, edge in enumerate(edges[kept:])
+        }
+        return (
+            pages,
+            range(first + len(pages), len(self.pages)),
+            moved,
+            self.removed - moved.keys(),
+        )
+
+    def select(
+        self,
+        node: UUID,
+        dir: EdgeDir,
+        edge_type: Optional[type | UnionType] = None,
+        others: Optional[Iterable[UUID]] = None,
+    ) -> Iterator[tuple[EdgeAnchor, NodeAnchor]]:
+        """Yield (edge, other node) pairs of node matching dir, type and endpoints."""
+        if not self.indexed:
+            self.reindex()
+
+        if others is not None:
+            others = list(dict.fromkeys(others))
+
+        if dir in [EdgeDir.OUT, EdgeDir.ANY]:
+            for edge in self.lookup(self.outgoing, node, edge_type, others, True):
+                yield edge, edge.target
+        if dir in [EdgeDir.IN, EdgeDir.ANY]:
+            for edge in self.lookup(self.incoming, node, edge_type, others, False):
+                yield edge, edge.source
+
+    def lookup(
+        self,
+        buckets: dict[UUID, dict[type, dict[UUID, EdgeAnchor]]],
+        node: UUID,
+        edge_type: Optional[type | UnionType],
+        others: Optional[list[UUID]],
+        outgoing: bool,
+    ) -> Iterator[EdgeAnchor]:
+        """Yield indexed edges from one direction."""
+        if others is not None:
+            for other in others:
+                pair = (node, other) if outgoing else (other, node)
+                for edge in self.pairs.get(pair, {}).values():
+                    if not edge_type or isinstance(edge.architype, edge_type):
+                        yield edge
+        else:
+            for cls, edges in buckets.get(node, {}).items():
+                if not edge_type or issubclass(cls, edge_type):
+                    yield from edges.values()
+
+    def __iter__(self) -> Iterator[EdgeAnchor]:
+        """Iterate edges in insertion order."""
+        for edges in self.groups():
+            yield from edges.values()
+
+    def __len__(self) -> int:
+        """Count edges."""
+        return self.count + len(self.added)
+
+    def __contains__(self, edge: object) -> bool:
+        """Check edge membership by id."""
+        return isinstance(edge, EdgeAnchor) and (
+            edge.id in self.added or self.locate(edge.id) is not None
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare edges in order."""
+        if isinstance(other, EdgeList):
+            return [edge.id for edge in self] == [edge.id for edge in other]
+        if isinstance(other, list):
+            return list(self) == other
+        return False
+
+    def __repr__(self) -> str:
+        """Override representation."""
+        return repr(list(self))
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class NodeAnchor(Anchor):
     """Node Anchor."""
 
     architype: NodeArchitype
-    edges: list[EdgeAnchor]
+    edges: EdgeList = field(default_factory=EdgeList)
+
+    def __post_init__(self) -> None:
+        """Wrap raw edge lists and tie them to the node."""
+        if not isinstance(self.edges, EdgeList):
+            self.edges = EdgeList(self.edges)
+        self.edges.node = self.id
+
+    def find_edges(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType] = None,
+    ) -> list[tuple[EdgeAnchor, NodeAnchor]]:
+        """Get edges connected to this node paired with the node on the other end."""
+        found = list(
+            self.edges.select(
+                self.id,
+                dir,
+                edge_type,
+                None if target_obj is None else (i.__jac__.id for i in target_obj),
+            )
+        )
+        if filter_func and found:
+            passed = {id(arch) for arch in filter_func([e.architype for e, _ in found])}
+            found = [(e, n) for e, n in found if id(e.architype) in passed]
+        if stubs := [node for _, node in found if not node.is_populated()]:
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            Jac.get_context().mem.populate(stubs)
+        return found
 
     def get_edges(
         self,
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType] = None,
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
         from jaclang.plugin.feature import JacFeature as Jac
 
         root = Jac.get_root().__jac__
-        ret_edges: list[EdgeArchitype] = []
-        for anchor in self.edges:
-            if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
-                and source.architype
-                and target.architype
-            ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and self == source
-                    and (not target_obj or target.architype in target_obj)
-                    and root.has_read_access(target)
-                ):
-                    ret_edges.append(anchor.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and self == target
-                    and (not target_obj or source.architype in target_obj)
-                    and root.has_read_access(source)
-                ):
-                    ret_edges.append(anchor.architype)
-        return ret_edges
+        return [
+            anchor.architype
+            for anchor, node in self.find_edges(dir, filter_func, target_obj, edge_type)
+            if root.has_read_access(node)
+        ]
 
     def edges_to_nodes(
         self,
         dir: EdgeDir,
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
         target_obj: Optional[list[NodeArchitype]],
+        edge_type: Optional[type | UnionType] = None,
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
         from jaclang.plugin.feature import JacFeature as Jac
 
         root = Jac.get_root().__jac__
-        ret_edges: list[NodeArchitype] = []
-        for anchor in self.edges:
-            if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
-                and source.architype
-                and target.architype
-            ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and self == source
-                    and (not target_obj or target.architype in target_obj)
-                    and root.has_read_access(target)
-                ):
-                    ret_edges.append(target.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and self == target
-                    and (not target_obj or source.architype in target_obj)
-                    and root.has_read_access(source)
-                ):
-                    ret_edges.append(source.architype)
-        return ret_edges
+        return [
+            node.architype
+            for _, node in self.find_edges(dir, filter_func, target_obj, edge_type)
+            if root.has_read_access(node)
+        ]
+
+    def is_dirty(self) -> bool:
+        """Check if node or its edges have unsaved changes."""
+        return super().is_dirty() or self.edges.dirty
 
     def remove_edge(self, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
-        for idx, ed in enumerate(self.edges):
-            if ed.id == edge.id:
-                self.edges.pop(idx)
-                break
+        self.edges.remove(edge)
+        self.mark_dirty()
 
     def gen_dot(self, dot_file: Optional[str] = None) -> str:
         """Generate Dot file for visualizing nodes and edges."""
@@ -415,7 +738,9 @@ class NodeAnchor(Anchor):
         jctx = Jac.get_context()
 
         if jctx.root.has_write_access(self):
-            for edge in self.edges:
+            edges = list(self.edges)
+            jctx.mem.populate(edge for edge in edges if not edge.is_populated())
+            for edge in edges:
                 edge.destroy()
 
             jctx.mem.remove(self.id)
@@ -425,10 +750,21 @@ class NodeAnchor(Anchor):
         state = super().__getstate__()
 
         if self.is_populated():
-            state["edges"] = [edge.make_stub() for edge in self.edges]
+            # edges are stored in pages written by the memory handler
+            state["edges"] = len(self.edges)
 
         return state
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Deserialize Node Anchor."""
+        if isinstance(edges := state.get("edges"), int):
+            state["edges"] = EdgeList(node=state["id"], count=edges)
+        elif edges is not None:
+            # records from before edge pages are written back with pages
+            state["edges"] = EdgeList(edges, state["id"])
+            state["edges"].dirty = bool(edges)
+        super().__setstate__(state)
+
 
 @dataclass(eq=False, repr=False, kw_only=True)
 class EdgeAnchor(Anchor):
@@ -438,11 +774,13 @@ class EdgeAnchor(Anchor):
     source: NodeAnchor
     target: NodeAnchor
     is_undirected: bool
+    linked: InitVar[bool] = True
 
-    def __post_init__(self) -> None:
-        """Populate edge to source and target."""
-        self.source.edges.append(self)
-        self.target.edges.append(self)
+    def __post_init__(self, linked: bool) -> None:
+        """Populate edge to source and target unless added to them in bulk."""
+        if linked:
+            self.source.edges.append(self)
+            self.target.edges.append(self)
 
     def detach(self) -> None:
         """Detach edge from nodes."""
@@ -485,10 +823,13 @@ class WalkerAnchor(Anchor):
 
     architype: WalkerArchitype
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
+    # bumped by make_architype so ability tables built before it are dropped
+    generation: ClassVar[int] = 0
+
     def visit_node(self, anchors: Iterable[NodeAnchor | EdgeAnchor]) -> bool:
         """Walker visits node."""
         before_len = len(self.next)
@@ -509,10 +850,10 @@ class WalkerAnchor(Anchor):
         for anchor in anchors:
             if anchor not in self.ignores:
                 if isinstance(anchor, NodeAnchor):
-                    self.ignores.append(anchor)
+                    self.ignores.add(anchor)
                 elif isinstance(anchor, EdgeAnchor):
                     if target := anchor.target:
-                        self.ignores.append(target)
+                        self.ignores.add(target)
                     else:
                         raise ValueError("Edge has no target.")
         return len(self.ignores) > before_len
@@ -521,46 +862,60 @@ class WalkerAnchor(Anchor):
         """Disengage walker from traversal."""
         self.disengaged = True
 
+    @classmethod
+    def get_abilities(
+        cls, walker: type[Architype], node: type[Architype]
+    ) -> list[tuple[DSFunc, bool]]:
+        """Get abilities triggered when walker visits node, cached on the walker."""
+        generation, table = walker.__dict__.get("_jac_abilities_", (-1, None))
+        if table is None or generation != cls.generation:
+            table = WeakKeyDictionary()
+            walker._jac_abilities_ = (cls.generation, table)
+        if (abilities := table.get(node)) is None:
+            abilities = [
+                *(
+                    (i, True)
+                    for i in node._jac_entry_funcs_
+                    if not i.trigger or issubclass(walker, i.trigger)
+                ),
+                *(
+                    (i, False)
+                    for i in walker._jac_entry_funcs_
+                    if not i.trigger or issubclass(node, i.trigger)
+                ),
+                *(
+                    (i, False)
+                    for i in walker._jac_exit_funcs_
+                    if not i.trigger or issubclass(node, i.trigger)
+                ),
+                *(
+                    (i, True)
+                    for i in node._jac_exit_funcs_
+                    if not i.trigger or issubclass(walker, i.trigger)
+                ),
+            ]
+            table[node] = abilities
+        return abilities
+
     def spawn_call(self, node: Anchor) -> WalkerArchitype:
         """Invoke data spatial call."""
         if walker := self.architype:
             self.path = []
-            self.next = [node]
-            while len(self.next):
-                if current_node := self.next.pop(0).architype:
-                    for i in current_node._jac_entry_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_entry_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_exit_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in current_node._jac_exit_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+            self.next = deque([node])
+            while self.next:
+                if current_node := self.next.popleft().architype:
+                    for i, on_node in self.get_abilities(
+                        walker.__class__, current_node.__class__
+                    ):
+                        if not i.func:
+                            raise ValueError(f"No function {i.name} to call.")
+                        if on_node:
+                            i.func(current_node, walker)
+                        else:
+                            i.func(walker, current_node)
                         if self.disengaged:
                             return walker
-            self.ignores = []
+            self.ignores = set()
             return walker
         raise Exception(f"Invalid Reference {self.id}")
 
@@ -570,11 +925,26 @@ class Architype:
 
     _jac_entry_funcs_: ClassVar[list[DSFunc]]
     _jac_exit_funcs_: ClassVar[list[DSFunc]]
+    # node class -> applicable abilities in call order, each flagged True when
+    # it belongs to the node and False when to the walker
+    _jac_abilities_: ClassVar[
+        tuple[int, WeakKeyDictionary[type, list[tuple[DSFunc, bool]]]]
+    ]
 
     def __init__(self) -> None:
         """Create default architype."""
         self.__jac__ = Anchor(architype=self)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """Flag anchor dirty on attribute assignment."""
+        super().__setattr__(name, value)
+        if (
+            name != "__jac__"
+            and (anchor := self.__dict__.get("__jac__"))
+            and not anchor.dirty
+        ):
+            anchor.mark_dirty()
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
@@ -587,7 +957,7 @@ class NodeArchitype(Architype):
 
     def __init__(self) -> None:
         """Create node architype."""
-        self.__jac__ = NodeAnchor(architype=self, edges=[])
+        self.__jac__ = NodeAnchor(architype=self)
 
 
 class EdgeArchitype(Architype):
@@ -600,10 +970,15 @@ class EdgeArchitype(Architype):
         source: NodeAnchor,
         target: NodeAnchor,
         is_undirected: bool,
+        linked: bool = True,
     ) -> None:
         """Attach EdgeAnchor properly."""
         self.__jac__ = EdgeAnchor(
-            architype=self, source=source, target=target, is_undirected=is_undirected
+            architype=self,
+            source=source,
+            target=target,
+            is_undirected=is_undirected,
+            linked=linked,
         )
 
 
@@ -634,7 +1009,7 @@ class Root(NodeArchitype):
 
     def __init__(self) -> None:
         """Create root node."""
-        self.__jac__ = NodeAnchor(architype=self, persistent=True, edges=[])
+        self.__jac__ = NodeAnchor(architype=self, persistent=True)
 
 
 @dataclass(eq=False)
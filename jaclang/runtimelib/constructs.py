@@ -17,7 +17,7 @@ from .architype import (
     WalkerArchitype,
 )
 from .context import ExecutionContext
-from .memory import Memory, ShelfStorage
+from .memory import Memory, ShelfStorage, SqliteStorage
 from .test import JacTestCheck, JacTestResult, JacTextTestRunner
 
 __all__ = [
@@ -34,6 +34,7 @@ __all__ = [
     "DSFunc",
     "Memory",
     "ShelfStorage",
+    "SqliteStorage",
     "ExecutionContext",
     "JacTestResult",
     "JacTextTestRunner",
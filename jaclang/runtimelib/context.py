@@ -7,8 +7,10 @@ from contextvars import ContextVar
 from typing import Any, Callable, Optional, cast
 from uuid import UUID
 
-from .architype import NodeAnchor, Root
-from .memory import Memory, ShelfStorage
+from jaclang.settings import settings
+
+from .architype import AccessLevel, NodeAnchor, Root
+from .memory import Memory, ShelfStorage, SqliteStorage
 
 
 EXECUTION_CONTEXT = ContextVar[Optional["ExecutionContext"]]("ExecutionContext")
@@ -16,7 +18,7 @@ EXECUTION_CONTEXT = ContextVar[Optional["ExecutionContext"]]("ExecutionContext")
 SUPER_ROOT_UUID = UUID("00000000-0000-0000-0000-000000000000")
 SUPER_ROOT_ARCHITYPE = object.__new__(Root)
 SUPER_ROOT_ANCHOR = NodeAnchor(
-    id=SUPER_ROOT_UUID, architype=SUPER_ROOT_ARCHITYPE, persistent=False, edges=[]
+    id=SUPER_ROOT_UUID, architype=SUPER_ROOT_ARCHITYPE, persistent=False
 )
 SUPER_ROOT_ARCHITYPE.__jac__ = SUPER_ROOT_ANCHOR
 
@@ -29,6 +31,7 @@ class ExecutionContext:
     system_root: NodeAnchor
     root: NodeAnchor
     entry_node: NodeAnchor
+    access_cache: dict[tuple[UUID, UUID], AccessLevel]
 
     def init_anchor(
         self,
@@ -63,8 +66,15 @@ class ExecutionContext:
     ) -> ExecutionContext:
         """Create ExecutionContext."""
         ctx = ExecutionContext()
-        ctx.mem = ShelfStorage(session)
+        scheme, _, path = (session or "").rpartition("://")
+        budget = settings.memory_budget or None
+        ctx.mem = (
+            SqliteStorage(path, budget)
+            if scheme == "sqlite"
+            else ShelfStorage(session, budget)
+        )
         ctx.reports = []
+        ctx.access_cache = {}
 
         if not isinstance(
             system_root := ctx.mem.find_by_id(SUPER_ROOT_UUID), NodeAnchor
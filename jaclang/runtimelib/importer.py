@@ -7,16 +7,23 @@ import importlib.util
 import os
 import sys
 import types
+from functools import partial
 from os import getcwd, path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from jaclang.runtimelib.machine import JacMachine
 from jaclang.runtimelib.utils import sys_path_context
+from jaclang.settings import settings
 from jaclang.utils.helpers import dump_traceback
 from jaclang.utils.log import logging
 
 logger = logging.getLogger(__name__)
 
+# attributes of lazy modules that can be read without loading them
+LAZY_MODULE_ATTRS = frozenset(
+    ("__name__", "__file__", "__path__", "__spec__", "__loader__", "__class__")
+)
+
 
 class ImportPathSpec:
     """Import Specification."""
@@ -109,7 +116,9 @@ class ImportReturn:
                         else module.__file__
                     )
 
-                    if jac_file_path and os.path.isfile(jac_file_path):
+                    if jac_file_path and self.importer.jac_machine.has_jac_file(
+                        jac_file_path
+                    ):
                         item = self.load_jac_mod_as_item(
                             module=module,
                             name=name,
@@ -164,6 +173,20 @@ class ImportReturn:
             return None
 
 
+class LazyModule(types.ModuleType):
+    """Module compiled and executed on first attribute access."""
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
+        """Load the module before reading anything but its metadata."""
+        if name not in LAZY_MODULE_ATTRS:
+            load = types.ModuleType.__getattribute__(self, "__dict__").pop(
+                "__jac_load__"
+            )
+            object.__setattr__(self, "__class__", types.ModuleType)
+            load()
+        return types.ModuleType.__getattribute__(self, name)
+
+
 class Importer:
     """Abstract base class for all importers."""
 
@@ -258,6 +281,9 @@ class PythonImporter(Importer):
 class JacImporter(Importer):
     """Importer for Jac modules."""
 
+    # number of Jac modules being executed, imports made by them can be lazy
+    executing = 0
+
     def __init__(self, jac_machine: JacMachine) -> None:
         """Initialize the JacImporter object."""
         self.jac_machine = jac_machine
@@ -311,13 +337,47 @@ class JacImporter(Importer):
         self.jac_machine.load_module(module_name, module)
         return module
 
+    def exec_module(
+        self, module: types.ModuleType, module_name: str, spec: ImportPathSpec
+    ) -> None:
+        """Compile and execute a Jac module into its module object."""
+        codeobj = self.jac_machine.get_bytecode(
+            module_name,
+            spec.full_target,
+            caller_dir=spec.caller_dir,
+            cachable=spec.cachable,
+        )
+        JacImporter.executing += 1
+        try:
+            if not codeobj:
+                raise ImportError(f"No bytecode found for {spec.full_target}")
+            with sys_path_context(spec.caller_dir):
+                exec(codeobj, module.__dict__)
+        except Exception as e:
+            logger.error(dump_traceback(e))
+            raise e
+        finally:
+            JacImporter.executing -= 1
+
+    def exec_lazy_module(
+        self, module: types.ModuleType, module_name: str, spec: ImportPathSpec
+    ) -> None:
+        """Execute a lazily imported module, unloading it if it fails."""
+        try:
+            self.exec_module(module, module_name, spec)
+        except Exception:
+            self.jac_machine.loaded_modules.pop(module_name, None)
+            if sys.modules.get(module_name) is module:
+                del sys.modules[module_name]
+            raise
+
     def run_import(
         self, spec: ImportPathSpec, reload: Optional[bool] = False
     ) -> ImportReturn:
         """Run the import process for Jac modules."""
         unique_loaded_items: list[types.ModuleType] = []
         module = None
-        if os.path.isfile(spec.full_target + ".jac"):
+        if self.jac_machine.has_jac_file(spec.full_target + ".jac"):
             module_name = self.get_sys_mod_name(spec.full_target + ".jac")
             module_name = spec.override_name if spec.override_name else module_name
         else:
@@ -326,7 +386,7 @@ class JacImporter(Importer):
         module = self.jac_machine.loaded_modules.get(module_name)
 
         if not module or module.__name__ == "__main__" or reload:
-            if os.path.isdir(spec.full_target):
+            if self.jac_machine.has_package(spec.full_target):
                 module = self.handle_directory(spec.module_name, spec.full_target)
             else:
                 spec.full_target += ".jac" if spec.language == "jac" else ".py"
@@ -335,20 +395,18 @@ class JacImporter(Importer):
                     spec.package_path,
                     spec.full_target,
                 )
-                codeobj = self.jac_machine.get_bytecode(
-                    module_name,
-                    spec.full_target,
-                    caller_dir=spec.caller_dir,
-                    cachable=spec.cachable,
-                )
-                try:
-                    if not codeobj:
-                        raise ImportError(f"No bytecode found for {spec.full_target}")
-                    with sys_path_context(spec.caller_dir):
-                        exec(codeobj, module.__dict__)
-                except Exception as e:
-                    logger.error(dump_traceback(e))
-                    raise e
+                if (
+                    settings.lazy_import
+                    and JacImporter.executing
+                    and not spec.absorb
+                    and not spec.override_name
+                ):
+                    module.__dict__["__jac_load__"] = partial(
+                        self.exec_lazy_module, module, module_name, spec
+                    )
+                    module.__class__ = LazyModule
+                else:
+                    self.exec_module(module, module_name, spec)
         import_return = ImportReturn(module, unique_loaded_items, self)
         if spec.items:
             import_return.process_items(
@@ -6,14 +6,17 @@ import os
 import sys
 import types
 from contextvars import ContextVar
-from typing import Optional
+from typing import Mapping, Optional, TYPE_CHECKING
 
-from jaclang.compiler.absyntree import Module
-from jaclang.compiler.compile import compile_jac
-from jaclang.compiler.constant import Constants as Con
+from jaclang.compiler.bundle import JacBundle
+from jaclang.compiler.cache import compile_cache
+from jaclang.compiler.semtable import registry_cache
 from jaclang.runtimelib.architype import EdgeArchitype, NodeArchitype, WalkerArchitype
 from jaclang.utils.log import logging
 
+if TYPE_CHECKING:
+    from jaclang.compiler.absyntree import Module
+
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +44,13 @@ class JacMachine:
 
     def attach_program(self, jac_program: "JacProgram") -> None:
         """Attach a JacProgram to the machine."""
+        if self.jac_program and self.jac_program.registries:
+            registry_cache.remove_bundled(self.jac_program.registries)
         self.jac_program = jac_program
+        if jac_program.registries:
+            registry_cache.bundled.append(jac_program.registries)
 
-    def get_mod_bundle(self) -> Optional[Module]:
+    def get_mod_bundle(self) -> Optional["Module"]:
         """Retrieve the mod_bundle from the attached JacProgram."""
         if self.jac_program:
             return self.jac_program.mod_bundle
@@ -63,6 +70,21 @@ class JacMachine:
             )
         return None
 
+    def has_jac_file(self, file_path: str) -> bool:
+        """Check if a Jac module is on disk or in the attached program."""
+        return os.path.isfile(file_path) or bool(
+            self.jac_program and file_path in self.jac_program.bytecode
+        )
+
+    def has_package(self, dir_path: str) -> bool:
+        """Check if a package is on disk or has modules in the attached program."""
+        if os.path.isdir(dir_path):
+            return True
+        if not self.jac_program:
+            return False
+        prefix = os.path.join(os.path.abspath(dir_path), "")
+        return any(i.startswith(prefix) for i in self.jac_program.bytecode)
+
     def load_module(self, module_name: str, module: types.ModuleType) -> None:
         """Load a module into the machine."""
         self.loaded_modules[module_name] = module
@@ -115,6 +137,11 @@ class JacMachine:
     @staticmethod
     def detach() -> None:
         """Detach current jac machine."""
+        jac_machine = JACMACHINE_CONTEXT.get(None)
+        if jac_machine and jac_machine.jac_program:
+            if jac_machine.jac_program.registries:
+                registry_cache.remove_bundled(jac_machine.jac_program.registries)
+            jac_machine.jac_program = None
         JACMACHINE_CONTEXT.set(None)
 
 
@@ -122,11 +149,23 @@ class JacProgram:
     """Class to hold the mod_bundle and bytecode for Jac modules."""
 
     def __init__(
-        self, mod_bundle: Optional[Module], bytecode: Optional[dict[str, bytes]]
+        self,
+        mod_bundle: Optional["Module"],
+        bytecode: Optional[Mapping[str, bytes]],
+        registries: Optional[Mapping[str, bytes]] = None,
     ) -> None:
         """Initialize the JacProgram object."""
         self.mod_bundle = mod_bundle
         self.bytecode = bytecode or {}
+        self.registries = registries
+
+    @staticmethod
+    def from_bundle(file_path: str) -> "JacProgram":
+        """Load a program from a bytecode bundle."""
+        bundle = JacBundle(file_path)
+        return JacProgram(
+            mod_bundle=None, bytecode=bundle.code, registries=bundle.registries
+        )
 
     def get_bytecode(
         self,
@@ -136,14 +175,18 @@ class JacProgram:
         cachable: bool = True,
     ) -> Optional[types.CodeType]:
         """Get the bytecode for a specific module."""
-        if self.mod_bundle and isinstance(self.mod_bundle, Module):
+        if self.mod_bundle:
             codeobj = self.mod_bundle.mod_deps[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
-        gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
-        pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path):
-            with open(pyc_file_path, "rb") as f:
-                return marshal.load(f)
+        if full_target in self.bytecode:
+            code = marshal.loads(self.bytecode[full_target])
+            if code.co_filename != full_target:
+                code = compile_cache.relocate(code, full_target)
+            return code
+        if cachable and (cached := compile_cache.load(full_target)):
+            return cached
+
+        from jaclang.compiler.compile import compile_jac
 
         result = compile_jac(full_target, cache_result=cachable)
         if result.errors_had or not result.ir.gen.py_bytecode:
@@ -2,28 +2,104 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from pickle import dumps
+from pickle import dumps, loads
 from shelve import Shelf, open
-from typing import Callable, Generator, Generic, Iterable, TypeVar
+from sqlite3 import Connection, connect
+from sys import getrefcount
+from typing import Callable, Generator, Generic, Iterable, TypeVar, cast
 from uuid import UUID
+from weakref import WeakValueDictionary, ref
 
-from .architype import Anchor, NodeAnchor, Root, TANCH
+from .architype import Anchor, EdgeAnchor, NodeAnchor, Root, TANCH
 
 ID = TypeVar("ID")
 
 
 @dataclass
 class Memory(Generic[ID, TANCH]):
-    """Generic Memory Handler."""
+    """Generic Memory Handler.
+
+    With a `budget`, clean persistent anchors are kept in least recently used
+    order in `__clean__` and evicted from it beyond the budget. Dirty anchors
+    never become clean again, so they are dropped from `__clean__` when reached
+    and each eviction is amortized O(1). Anchors whose architype is still
+    referenced outside of memory are kept, as it can be changed in place without
+    flagging them, and are only checked again once as many anchors were added.
+    Stubs populated from an evicted anchor are reset so they don't keep its
+    architype alive, and the anchor itself is only weakly held: one still
+    referenced elsewhere is reused, others are reloaded from the datasource when
+    a stub is next populated.
+    """
 
     __mem__: dict[ID, TANCH] = field(default_factory=dict)
     __gc__: set[TANCH] = field(default_factory=set)
+    __clean__: OrderedDict[ID, None] = field(default_factory=OrderedDict)
+    __evicted__: WeakValueDictionary[ID, TANCH] = field(
+        default_factory=WeakValueDictionary
+    )
+    # populated stubs by anchor id, keyed by object id as they are relinked
+    __stubs__: dict[ID, dict[int, ref[TANCH]]] = field(default_factory=dict)
+    __retry__: int = 0  # size of memory to check anchors in use again at
+    budget: int | None = None
 
     def close(self) -> None:
         """Close memory handler."""
         self.__mem__.clear()
         self.__gc__.clear()
+        self.__clean__.clear()
+        self.__evicted__.clear()
+        self.__stubs__.clear()
+        self.__retry__ = 0
+
+    def get(self, id: ID) -> TANCH | None:
+        """Get anchor from memory, marking it as recently used."""
+        if (anchor := self.__mem__.get(id)) is None:
+            if (anchor := self.__evicted__.pop(id, None)) is not None:
+                self.set(id, anchor)
+        elif id in self.__clean__:
+            self.__clean__.move_to_end(id)
+        return anchor
+
+    def evict(self) -> None:
+        """Evict least recently used clean anchors beyond the budget."""
+        if self.budget is None or len(self.__mem__) < self.__retry__:
+            return
+
+        excess = len(self.__mem__) - self.budget
+        in_use: list[ID] = []
+        while excess > 0 and self.__clean__:
+            id, _ = self.__clean__.popitem(last=False)
+            if (
+                (anchor := self.__mem__.get(id)) is None
+                or not anchor.persistent
+                or anchor.is_dirty()
+            ):
+                continue
+
+            stubs = [
+                stub
+                for stub_ref in self.__stubs__.get(id, {}).values()
+                if (stub := stub_ref()) is not None and stub is not anchor
+            ]
+            architype = anchor.architype
+            # held by the anchor, its populated stubs, this frame and the call
+            if getrefcount(architype) > 3 + sum(
+                stub.__dict__.get("architype") is architype for stub in stubs
+            ):
+                in_use.append(id)
+                continue
+
+            self.__evicted__[id] = self.__mem__.pop(id)
+            excess -= 1
+            self.__stubs__.pop(id, None)
+            for stub in stubs:
+                stub.__dict__.clear()
+                stub.__dict__["id"] = id
+        for id in in_use:
+            self.__clean__[id] = None
+        self.__retry__ = len(self.__mem__) + len(in_use)
 
     def find(
         self,
@@ -37,7 +113,7 @@ class Memory(Generic[ID, TANCH]):
         return (
             anchor
             for id in ids
-            if (anchor := self.__mem__.get(id)) and (not filter or filter(anchor))
+            if (anchor := self.get(id)) and (not filter or filter(anchor))
         )
 
     def find_one(
@@ -50,11 +126,40 @@ class Memory(Generic[ID, TANCH]):
 
     def find_by_id(self, id: ID) -> TANCH | None:
         """Find one by id."""
-        return self.__mem__.get(id)
+        return self.get(id)
+
+    def populate(self, stubs: Iterable[TANCH]) -> None:
+        """Populate anchor stubs with a single find."""
+        unloaded: dict[UUID, list[TANCH]] = {}
+        for stub in stubs:
+            unloaded.setdefault(stub.id, []).append(stub)
+
+        for anchor in self.find(cast(list[ID], list(unloaded))):
+            for stub in unloaded[anchor.id]:
+                self.link(stub, anchor)
+
+    def link(self, stub: TANCH, anchor: TANCH) -> None:
+        """Populate stub from the loaded anchor."""
+        stub.__dict__.update(anchor.__dict__)
+        if self.budget is not None:
+            self.__stubs__.setdefault(cast(ID, anchor.id), {})[id(stub)] = ref(stub)
+
+    def load_edge_page(self, node: ID, page: int) -> list[EdgeAnchor]:
+        """Load a stored page of edge stubs of a node."""
+        return []
+
+    def find_edge_page(self, node: ID, edge: ID) -> int | None:
+        """Get the number of the stored page holding an edge of a node."""
+        return None
 
     def set(self, id: ID, data: TANCH) -> None:
         """Save anchor to memory."""
         self.__mem__[id] = data
+        # evicted first so the anchor is not dropped before the caller uses it
+        self.evict()
+        if self.budget is not None and data.persistent and not data.dirty:
+            self.__clean__[id] = None
+            self.__clean__.move_to_end(id)
 
     def remove(self, ids: ID | Iterable[ID]) -> None:
         """Remove anchor/s from memory."""
@@ -62,7 +167,7 @@ class Memory(Generic[ID, TANCH]):
             ids = [ids]
 
         for id in ids:
-            if anchor := self.__mem__.pop(id, None):
+            if anchor := self.__mem__.pop(id, None) or self.__evicted__.pop(id, None):
                 self.__gc__.add(anchor)
 
 
@@ -72,9 +177,9 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
     __shelf__: Shelf[Anchor] | None = None
 
-    def __init__(self, session: str | None = None) -> None:
+    def __init__(self, session: str | None = None, budget: int | None = None) -> None:
         """Initialize memory handler."""
-        super().__init__()
+        super().__init__(budget=budget if session else None)
         self.__shelf__ = open(session) if session else None  # noqa: SIM115
 
     def close(self) -> None:
@@ -87,39 +192,76 @@ class ShelfStorage(Memory[UUID, Anchor]):
             for anchor in self.__gc__:
                 self.__shelf__.pop(str(anchor.id), None)
                 self.__mem__.pop(anchor.id, None)
+                if isinstance(anchor, NodeAnchor):
+                    for page in range(len(anchor.edges.pages)):
+                        self.__shelf__.pop(f"{anchor.id}:{page}", None)
+                    for edge in anchor.edges.removed.union(*anchor.edges.groups()):
+                        self.__shelf__.pop(f"{anchor.id}:{edge}", None)
+
+            self.__mem__.update(self.__evicted__.items())
 
             for d in self.__mem__.values():
-                if d.persistent and d.hash != hash(dumps(d)):
+                if d.persistent and d.is_dirty():
                     _id = str(d.id)
                     if p_d := self.__shelf__.get(_id):
                         if (
                             isinstance(p_d, NodeAnchor)
                             and isinstance(d, NodeAnchor)
-                            and p_d.edges != d.edges
+                            and d.edges.dirty
                             and root.has_connect_access(d)
                         ):
+                            self.write_edges(d)
                             if not d.edges:
                                 self.__shelf__.pop(_id, None)
                                 continue
                             p_d.edges = d.edges
 
                         if root.has_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
-                                p_d.access = d.access
-                            if hash(dumps(d.architype)) != hash(dumps(d.architype)):
-                                p_d.architype = d.architype
+                            p_d.access = d.access
+                            p_d.architype = d.architype
 
+                        p_d.hash = p_d.mutable_hash()
                         self.__shelf__[_id] = p_d
                     elif not (
                         isinstance(d, NodeAnchor)
                         and not isinstance(d.architype, Root)
                         and not d.edges
                     ):
+                        if isinstance(d, NodeAnchor):
+                            self.write_edges(d)
+                        d.hash = d.mutable_hash()
                         self.__shelf__[_id] = d
 
             self.__shelf__.close()
         super().close()
 
+    def write_edges(self, node: NodeAnchor) -> None:
+        """Write changed edge pages of a node."""
+        if isinstance(self.__shelf__, Shelf):
+            pages, deleted, moved, dropped = node.edges.changes()
+            # pages share the shelf with anchors under "<node id>:<page>" keys
+            # and the page of each edge is kept under "<node id>:<edge id>"
+            for page, edges in pages.items():
+                self.__shelf__[f"{node.id}:{page}"] = cast(Anchor, edges)
+            for page in deleted:
+                self.__shelf__.pop(f"{node.id}:{page}", None)
+            for edge, page in moved.items():
+                self.__shelf__[f"{node.id}:{edge}"] = cast(Anchor, page)
+            for edge in dropped:
+                self.__shelf__.pop(f"{node.id}:{edge}", None)
+
+    def load_edge_page(self, node: UUID, page: int) -> list[EdgeAnchor]:
+        """Load a stored page of edge stubs of a node."""
+        if isinstance(self.__shelf__, Shelf):
+            return cast(list[EdgeAnchor], self.__shelf__.get(f"{node}:{page}", []))
+        return []
+
+    def find_edge_page(self, node: UUID, edge: UUID) -> int | None:
+        """Get the number of the stored page holding an edge of a node."""
+        if isinstance(self.__shelf__, Shelf):
+            return cast(int | None, self.__shelf__.get(f"{node}:{edge}"))
+        return None
+
     def find(
         self,
         ids: UUID | Iterable[UUID],
@@ -131,14 +273,14 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
         if isinstance(self.__shelf__, Shelf):
             for id in ids:
-                anchor = self.__mem__.get(id)
+                anchor = self.get(id)
 
                 if (
                     not anchor
                     and id not in self.__gc__
                     and (_anchor := self.__shelf__.get(str(id)))
                 ):
-                    self.__mem__[id] = anchor = _anchor
+                    self.set(id, anchor := _anchor)
                 if anchor and (not filter or filter(anchor)):
                     yield anchor
         else:
@@ -153,6 +295,223 @@ class ShelfStorage(Memory[UUID, Anchor]):
             and isinstance(self.__shelf__, Shelf)
             and (data := self.__shelf__.get(str(id)))
         ):
-            self.__mem__[id] = data
+            self.set(id, data)
+
+        return data
+
+
+@dataclass
+class SqliteStorage(Memory[UUID, Anchor]):
+    """SQLite Handler.
+
+    Anchors are pickled into one table indexed by root and architype type, and
+    node edge stubs into pages of another table. The database runs in WAL mode
+    and every close is written in a single transaction.
+    """
+
+    __conn__: Connection | None = None
+
+    # sqlite caps the number of bound parameters per statement
+    BATCH_SIZE = 500
+
+    def __init__(self, session: str, budget: int | None = None) -> None:
+        """Initialize memory handler."""
+        super().__init__(budget=budget)
+        self.__conn__ = connect(session)
+        self.__conn__.execute("PRAGMA journal_mode=WAL")
+        self.__conn__.execute("PRAGMA synchronous=NORMAL")
+        with self.__conn__:
+            self.__conn__.execute(
+                "CREATE TABLE IF NOT EXISTS anchor ("
+                "id TEXT PRIMARY KEY, root TEXT, type TEXT, data BLOB NOT NULL)"
+            )
+            self.__conn__.execute(
+                "CREATE INDEX IF NOT EXISTS anchor_root ON anchor (root)"
+            )
+            self.__conn__.execute(
+                "CREATE INDEX IF NOT EXISTS anchor_type ON anchor (type)"
+            )
+            self.__conn__.execute(
+                "CREATE TABLE IF NOT EXISTS edge_page (node TEXT, page INTEGER, "
+                "data BLOB NOT NULL, PRIMARY KEY (node, page))"
+            )
+            self.__conn__.execute(
+                "CREATE TABLE IF NOT EXISTS edge_ref (node TEXT, edge TEXT, "
+                "page INTEGER NOT NULL, PRIMARY KEY (node, edge))"
+            )
+
+    def load(self, ids: Iterable[UUID]) -> dict[UUID, Anchor]:
+        """Load anchors from database by ids in batches."""
+        loaded: dict[UUID, Anchor] = {}
+        if isinstance(self.__conn__, Connection):
+            keys = [str(id) for id in ids]
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                batch = keys[i : i + self.BATCH_SIZE]
+                for id, data in self.__conn__.execute(
+                    "SELECT id, data FROM anchor WHERE id IN "
+                    f"({', '.join('?' * len(batch))})",
+                    batch,
+                ):
+                    loaded[UUID(id)] = loads(data)
+        return loaded
+
+    def close(self) -> None:
+        """Close memory handler."""
+        if isinstance(self.__conn__, Connection):
+            from jaclang.plugin.feature import JacFeature as Jac
+
+            root = Jac.get_root().__jac__
+
+            removed = {anchor.id for anchor in self.__gc__}
+            deletes = [(str(id),) for id in removed]
+            writes: list[tuple[str, str | None, str, bytes]] = []
+            edged: list[NodeAnchor] = []
+
+            self.__mem__.update(self.__evicted__.items())
+            changed = [
+                d
+                for d in self.__mem__.values()
+                if d.persistent and d.id not in removed and d.is_dirty()
+            ]
+            stored = self.load(d.id for d in changed)
+
+            for d in changed:
+                if p_d := stored.get(d.id):
+                    if (
+                        isinstance(p_d, NodeAnchor)
+                        and isinstance(d, NodeAnchor)
+                        and d.edges.dirty
+                        and root.has_connect_access(d)
+                    ):
+                        if not d.edges:
+                            deletes.append((str(d.id),))
+                            continue
+                        edged.append(d)
+                        p_d.edges = d.edges
+
+                    if root.has_write_access(d):
+                        p_d.access = d.access
+                        p_d.architype = d.architype
+
+                    writes.append(self.row(p_d))
+                elif not (
+                    isinstance(d, NodeAnchor)
+                    and not isinstance(d.architype, Root)
+                    and not d.edges
+                ):
+                    if isinstance(d, NodeAnchor):
+                        edged.append(d)
+                    writes.append(self.row(d))
+
+            page_writes: list[tuple[str, int, bytes]] = []
+            page_deletes: list[tuple[str, int]] = []
+            ref_writes: list[tuple[str, str, int]] = []
+            ref_deletes: list[tuple[str, str]] = []
+            for node in edged:
+                pages, deleted, moved, dropped = node.edges.changes()
+                id = str(node.id)
+                page_writes += [(id, page, dumps(e)) for page, e in pages.items()]
+                page_deletes += [(id, page) for page in deleted]
+                ref_writes += [(id, str(edge), page) for edge, page in moved.items()]
+                ref_deletes += [(id, str(edge)) for edge in dropped]
+
+            with self.__conn__:
+                self.__conn__.executemany("DELETE FROM anchor WHERE id = ?", deletes)
+                self.__conn__.executemany(
+                    "DELETE FROM edge_page WHERE node = ?", deletes
+                )
+                self.__conn__.executemany(
+                    "DELETE FROM edge_page WHERE node = ? AND page = ?", page_deletes
+                )
+                self.__conn__.executemany(
+                    "DELETE FROM edge_ref WHERE node = ?", deletes
+                )
+                self.__conn__.executemany(
+                    "DELETE FROM edge_ref WHERE node = ? AND edge = ?", ref_deletes
+                )
+                self.__conn__.executemany(
+                    "INSERT OR REPLACE INTO anchor (id, root, type, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    writes,
+                )
+                self.__conn__.executemany(
+                    "INSERT OR REPLACE INTO edge_page (node, page, data) "
+                    "VALUES (?, ?, ?)",
+                    page_writes,
+                )
+                self.__conn__.executemany(
+                    "INSERT OR REPLACE INTO edge_ref (node, edge, page) "
+                    "VALUES (?, ?, ?)",
+                    ref_writes,
+                )
+            self.__conn__.close()
+            self.__conn__ = None
+        super().close()
+
+    def load_edge_page(self, node: UUID, page: int) -> list[EdgeAnchor]:
+        """Load a stored page of edge stubs of a node."""
+        if isinstance(self.__conn__, Connection):
+            for (data,) in self.__conn__.execute(
+                "SELECT data FROM edge_page WHERE node = ? AND page = ?",
+                (str(node), page),
+            ):
+                return loads(data)
+        return []
+
+    def find_edge_page(self, node: UUID, edge: UUID) -> int | None:
+        """Get the number of the stored page holding an edge of a node."""
+        if isinstance(self.__conn__, Connection):
+            for (page,) in self.__conn__.execute(
+                "SELECT page FROM edge_ref WHERE node = ? AND edge = ?",
+                (str(node), str(edge)),
+            ):
+                return page
+        return None
+
+    @staticmethod
+    def row(anchor: Anchor) -> tuple[str, str | None, str, bytes]:
+        """Convert anchor to table row."""
+        cls = anchor.architype.__class__
+        anchor.hash = anchor.mutable_hash()
+        return (
+            str(anchor.id),
+            str(anchor.root) if anchor.root else None,
+            f"{cls.__module__}.{cls.__qualname__}",
+            dumps(anchor),
+        )
+
+    def find(
+        self,
+        ids: UUID | Iterable[UUID],
+        filter: Callable[[Anchor], Anchor] | None = None,
+    ) -> Generator[Anchor, None, None]:
+        """Find anchors from datasource by ids with filter."""
+        if not isinstance(ids, Iterable):
+            ids = [ids]
+
+        if isinstance(self.__conn__, Connection):
+            ids = list(ids)
+            removed = {anchor.id for anchor in self.__gc__}
+            # kept referenced so anchors evicted right away are still found below
+            loaded = self.load(
+                id
+                for id in ids
+                if id not in self.__mem__
+                and id not in self.__evicted__
+                and id not in removed
+            )
+            self.__mem__.update(loaded)
+            if self.budget is not None:
+                self.__clean__.update(dict.fromkeys(loaded))
+            self.evict()
+
+        yield from super().find(ids, filter)
+
+    def find_by_id(self, id: UUID) -> Anchor | None:
+        """Find one by id."""
+        data = super().find_by_id(id)
+
+        if not data and (data := self.load([id]).get(id)):
+            self.set(id, data)
 
         return data
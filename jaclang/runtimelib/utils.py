@@ -5,12 +5,12 @@ from __future__ import annotations
 import ast as ast3
 import sys
 from contextlib import contextmanager
-from typing import Callable, Iterator, TYPE_CHECKING
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
 
-import jaclang.compiler.absyntree as ast
-from jaclang.compiler.semtable import SemScope
+from jaclang.compiler.semtable import SemInfo, SemRegistry, SemScope
 
 if TYPE_CHECKING:
+    import jaclang.compiler.absyntree as ast
     from jaclang.runtimelib.constructs import NodeAnchor, NodeArchitype
 
 
@@ -117,6 +117,8 @@ def traverse_graph(
 
 def get_sem_scope(node: ast.AstNode) -> SemScope:
     """Get scope of the node."""
+    import jaclang.compiler.absyntree as ast
+
     a = (
         node.name
         if isinstance(node, ast.Module)
@@ -146,8 +148,40 @@ def get_sem_scope(node: ast.AstNode) -> SemScope:
     return SemScope("", "", None)
 
 
+def resolve_attr_scope(
+    mod_registry: SemRegistry, attr: str
+) -> tuple[Optional[SemScope], Optional[SemInfo | list[SemInfo]]]:
+    """Resolve the scope and semantic info of a dotted attribute."""
+    attr_scope = None
+    for x in attr.split("."):
+        attr_scope, attr_sem_info = mod_registry.lookup(attr_scope, x)
+        if isinstance(attr_sem_info, SemInfo) and attr_sem_info.type not in [
+            "class",
+            "obj",
+            "node",
+            "edge",
+        ]:
+            attr_scope, attr_sem_info = mod_registry.lookup(None, attr_sem_info.type)
+            if isinstance(attr_sem_info, SemInfo) and isinstance(
+                attr_sem_info.type, str
+            ):
+                attr_scope = SemScope(
+                    attr_sem_info.name, attr_sem_info.type, attr_scope
+                )
+        else:
+            if isinstance(attr_sem_info, SemInfo) and isinstance(
+                attr_sem_info.type, str
+            ):
+                attr_scope = SemScope(
+                    attr_sem_info.name, attr_sem_info.type, attr_scope
+                )
+    return attr_scope, attr_sem_info
+
+
 def extract_type(node: ast.AstNode) -> list[str]:
     """Collect type information in assignment using bfs."""
+    import jaclang.compiler.absyntree as ast
+
     extracted_type = []
     if isinstance(node, (ast.BuiltinType, ast.Token)):
         extracted_type.append(node.value)
@@ -160,6 +194,8 @@ def extract_params(
     body: ast.FuncCall,
 ) -> tuple[dict[str, ast.Expr], list[tuple[str, ast3.AST]], list[tuple[str, ast3.AST]]]:
     """Extract model parameters, include and exclude information."""
+    import jaclang.compiler.absyntree as ast
+
     model_params = {}
     include_info = []
     exclude_info = []
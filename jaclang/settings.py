@@ -20,6 +20,12 @@ class Settings:
     # Compiler configuration
     disable_mtllm: bool = False
     ignore_test_annex: bool = False
+    compile_cache_dir: str = ""  # defaults to ~/.jaclang/cache
+    incremental_type_check: bool = False  # keep mypy build warm between checks
+
+    # Runtime configuration
+    memory_budget: int = 0  # max resident persisted anchors, 0 for unbounded
+    lazy_import: bool = False  # run imported Jac modules on first attribute access
 
     # Formatter configuration
     max_line_length: int = 88
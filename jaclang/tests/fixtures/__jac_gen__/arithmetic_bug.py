@@ -0,0 +1,9 @@
+from __future__ import annotations
+print(4 ** (-2))
+x = 1e-06
+print(x)
+x += 1000
+print(x)
+pp = 78
+print(pp)
+print(12)
\ No newline at end of file
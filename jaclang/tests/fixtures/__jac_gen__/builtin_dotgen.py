@@ -0,0 +1,40 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Node):
+    val: int
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Edge1(_Jac.Edge):
+    val: int = _Jac.has_instance_default(gen_func=lambda: 5)
+end = _Jac.get_root()
+for i in range(0, 4):
+    _Jac.connect(left=end, right=(end := [a(val=i) for i in range(0, 3)]), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+x = [a(val=i) for i in range(0, 3)]
+end = x[1]
+for i in range(0, 8):
+    locals()[chr(ord('b') + i)] = (values := [a(val=j * i + 5.2 * i + 6) for j in range(0, 3)])
+    _Jac.connect(left=end, right=(end := values), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+p = b[1]
+for k in range(0, 10):
+    _Jac.connect(left=p, right=(p := a(val=k)), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=Edge1, conn_assign=(('val',), (6,))))
+d1 = dotgen()
+l1 = len(d1)
+d2 = dotgen(b[1], edge_type=['Edge1'], depth=20, traverse=True, bfs=False, node_limit=19)
+l2 = len(d2)
+d3 = dotgen(b[2], edge_limit=5, depth=5)
+l3 = len(d3)
+d4 = dotgen(b[1], bfs=True, edge_type=['Edge1'], node_limit=100, edge_limit=900, depth=300)
+l4 = len(d4)
+d5 = dotgen(b[1], node_limit=10, edge_limit=90)
+(l5 := len(d5))
+print(d1.count('a(val') == 12, d1.count('#FFFFE0') == 3, 'Root' in d1, d1.count('GenericEdge') == 30)
+print(d2.count('a(val') == 19, d2.count('#F5E5FF') == 2, 'Edge1' not in d2, d2.count('GenericEdge') == 42)
+print(d3.count('a(val') == 6, d3.count('GenericEdge') == 5, d3.count('#F5E5FF') == 1)
+print(d4.count('a(val') == 25, d4.count('GenericEdge') == 66, d4.count('#FFF0F') == 3)
+print(d5.count('Edge1(val=6)') == 2, d5.count('GenericEdge()') == 24)
\ No newline at end of file
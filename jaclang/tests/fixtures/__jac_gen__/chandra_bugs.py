@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+def foo(param: int, **kwargs: dict) -> int:
+    return (param + kwargs['bar'], 'from_foo')
+mydict = {'new_val': 1, 'where': 0}
+mydict['new_val'], mydict['where'] = foo(1, bar=2)
+print(f"<link href='{mydict} rel='stylesheet'")
+print(1 != 2)
\ No newline at end of file
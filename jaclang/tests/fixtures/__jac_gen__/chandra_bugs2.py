@@ -0,0 +1,18 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import re
+else:
+    re, = __jac_import__(target='re', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+a: int = 5
+arguments = {x: None for x in re.findall('\\{([A-Za-z0-9_]+)\\}', 'Apple {apple} pineapple {pineapple}')}
+a: int = 5
+if False:
+    with open(f'Apple{apple}.txt') as f:
+        print(f.read())
+print(arguments)
+print('This is a long\n    line of code.')
+a = {'a': 'apple', 'b': 'ball', 'c': 'cat'}
+y = {**a, 'd': 'dog', 'e': 'elephant'}
+print(y)
\ No newline at end of file
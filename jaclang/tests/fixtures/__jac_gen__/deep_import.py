@@ -0,0 +1,12 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import deep.one_lev as one_lev
+else:
+    one_lev, = __jac_import__(target='deep.one_lev', base_path=__file__, lng='jac', absorb=False, mdl_alias='one_lev', items={})
+if _jac_typ.TYPE_CHECKING:
+    from deep.one_lev import olprint
+else:
+    olprint, = __jac_import__(target='deep.one_lev', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'olprint': None})
+print(olprint())
\ No newline at end of file
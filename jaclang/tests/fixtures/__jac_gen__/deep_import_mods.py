@@ -0,0 +1,18 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import sys
+else:
+    sys, = __jac_import__(target='sys', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+before_mod = list(sys.modules.keys())
+if _jac_typ.TYPE_CHECKING:
+    import deep.one_lev as one_lev
+else:
+    one_lev, = __jac_import__(target='deep.one_lev', base_path=__file__, lng='jac', absorb=False, mdl_alias='one_lev', items={})
+if _jac_typ.TYPE_CHECKING:
+    from deep.one_lev import olprint
+else:
+    olprint, = __jac_import__(target='deep.one_lev', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'olprint': None})
+after_mod = [m for m in sys.modules.keys() if m not in before_mod]
+print(after_mod)
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Typed and targeted edge references served from the adjacency index."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class item(_Jac.Node):
+    val: int
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class light(_Jac.Edge):
+    w: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class heavy(light, _Jac.Edge):
+    pass
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class other(_Jac.Edge):
+    pass
+hub = item(val=0)
+a = item(val=1)
+b = item(val=2)
+c = item(val=3)
+_Jac.connect(left=hub, right=a, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=light, conn_assign=(('w',), (1,))))
+_Jac.connect(left=hub, right=b, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=heavy, conn_assign=(('w',), (5,))))
+_Jac.connect(left=hub, right=c, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=other, conn_assign=None))
+_Jac.connect(left=c, right=hub, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=light, conn_assign=(('w',), (2,))))
+print(hub.__jac__.edges.indexed)
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, light)], edges_only=False, edge_type=light)]))
+print(hub.__jac__.edges.indexed)
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, heavy)], edges_only=False, edge_type=heavy)]))
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, light) if i.w > 2], edges_only=False, edge_type=light)]))
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)]))
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.IN, filter_func=lambda x: [i for i in x if isinstance(i, light)], edges_only=False, edge_type=light)]))
+print(sorted([i.val for i in (lambda x: [i for i in x if i.val < 10])(_Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, other)], edges_only=False, edge_type=other))]))
+print([i.val for i in _Jac.edge_ref(hub, target_obj=b, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, light)], edges_only=False, edge_type=light)])
+print([i.val for i in _Jac.edge_ref(hub, target_obj=c, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)])
+_Jac.disconnect(hub, b, _Jac.EdgeDir.OUT, None)
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, light)], edges_only=False, edge_type=light)]))
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.ANY, filter_func=None, edges_only=False, edge_type=None)]))
+_Jac.connect(left=a, right=hub, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+print(sorted([i.val for i in _Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.IN, filter_func=None, edges_only=False, edge_type=None)]))
\ No newline at end of file
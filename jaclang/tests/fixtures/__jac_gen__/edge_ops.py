@@ -0,0 +1,52 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    import random
+else:
+    random, = __jac_import__(target='random', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class node_a(_Jac.Node):
+    value: int
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('create', _Jac.RootType), _Jac.DSFunc('travel', _Jac.RootType | node_a)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Creator(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/edge_ops.jac')
+    def create(self, _jac_here_: _Jac.RootType) -> None:
+        end = _jac_here_
+        i = 0
+        while i < 5:
+            _Jac.connect(left=end, right=(end := node_a(value=i + 1)), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+            if i == 2:
+                j = 0
+                while j < 3:
+                    _Jac.connect(left=end, right=node_a(value=j + 10), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=MyEdge, conn_assign=(('val', 'val2'), (random.randint(1, 15), random.randint(1, 5)))))
+                    j += 1
+                print([(arch.val, arch.val2) for i in end.__jac__.edges if isinstance((arch := i.architype), MyEdge)])
+            i += 1
+        i = 0
+        while i < 3:
+            _Jac.connect(left=end, right=node_a(value=i + 5), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=MyEdge, conn_assign=(('val',), (random.randint(1, 20),))))
+            i += 1
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/edge_ops.jac')
+    def travel(self, _jac_here_: _Jac.RootType | node_a) -> None:
+        for i in _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, MyEdge) if i.val <= 5], edges_only=False, edge_type=MyEdge):
+            print(i.value)
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyEdge(_Jac.Edge):
+    val: int = _Jac.has_instance_default(gen_func=lambda: 5)
+    val2: int = _Jac.has_instance_default(gen_func=lambda: 10)
+random.seed(1)
+_Jac.spawn_call(_Jac.get_root(), Creator())
\ No newline at end of file
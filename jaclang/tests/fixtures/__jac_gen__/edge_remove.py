@@ -0,0 +1,30 @@
+"""Edge removal keeps insertion order and edge count survives serialization."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    import pickle
+else:
+    pickle, = __jac_import__(target='pickle', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class item(_Jac.Node):
+    val: int
+hub = item(val=0)
+items = [item(val=i) for i in range(1, 101)]
+_Jac.connect(left=hub, right=items, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.connect(left=hub, right=hub, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+print(len(hub.__jac__.edges))
+_Jac.disconnect(hub, [i for i in items if i.val % 2 == 0], _Jac.EdgeDir.OUT, None)
+print(len(hub.__jac__.edges))
+print([i.target.architype.val for i in hub.__jac__.edges][:5])
+copy = pickle.loads(pickle.dumps(hub.__jac__))
+print(len(copy.edges) == len(hub.__jac__.edges))
+_Jac.disconnect(hub, hub, _Jac.EdgeDir.OUT, None)
+print(len(hub.__jac__.edges), len(_Jac.edge_ref(hub, target_obj=None, dir=_Jac.EdgeDir.IN, filter_func=None, edges_only=False, edge_type=None)))
+_Jac.disconnect(hub, items, _Jac.EdgeDir.OUT, None)
+print(len(hub.__jac__.edges), len(items[0].__jac__.edges))
\ No newline at end of file
@@ -0,0 +1,49 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('create', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class creator(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/edges_walk.jac')
+    def create(self, _jac_here_: _Jac.RootType) -> None:
+        i = 0
+        while i < 2:
+            _Jac.connect(left=_jac_here_, right=node_a(val=i + 1), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=Edge_c, conn_assign=(('value2',), (30,))))
+            if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+                pass
+            i += 1
+        _Jac.connect(left=_jac_here_, right=(end := node_a(val=i + 10)), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=Edge_a, conn_assign=(('value',), (10,))))
+        _Jac.connect(left=end, right=(last := node_a(val=i + 20)), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=Edge_b, conn_assign=(('value1',), (20,))))
+        j = 0
+        while j < 2:
+            _Jac.connect(left=last, right=node_a(val=i + 40), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=Edge_c, conn_assign=(('value2',), (40,))))
+            j += 1
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class node_a(_Jac.Node):
+    val: int
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Edge_a(_Jac.Edge):
+    value: int = _Jac.has_instance_default(gen_func=lambda: 10)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Edge_b(_Jac.Edge):
+    value1: int = _Jac.has_instance_default(gen_func=lambda: 20)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Edge_c(_Jac.Edge):
+    value2: int = _Jac.has_instance_default(gen_func=lambda: 30)
+print(_Jac.spawn_call(_Jac.get_root(), creator()))
+print(_Jac.get_root().__jac__.gen_dot())
+print(_Jac.edge_ref(_Jac.get_root(), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_a)], edges_only=False, edge_type=Edge_a))
+print(_Jac.edge_ref(_Jac.get_root(), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_c)], edges_only=False, edge_type=Edge_c))
+print(_Jac.edge_ref(_Jac.edge_ref(_Jac.get_root(), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_a)], edges_only=False, edge_type=Edge_a), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_b)], edges_only=False, edge_type=Edge_b))
+print(_Jac.edge_ref(_Jac.edge_ref(_Jac.edge_ref(_Jac.get_root(), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_a)], edges_only=False, edge_type=Edge_a), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_b)], edges_only=False, edge_type=Edge_b), target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=lambda x: [i for i in x if isinstance(i, Edge_c)], edges_only=False, edge_type=Edge_c))
\ No newline at end of file
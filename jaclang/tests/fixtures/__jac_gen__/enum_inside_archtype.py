@@ -0,0 +1,24 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class outer(_Jac.Obj):
+    o1: int = _Jac.has_instance_default(gen_func=lambda: 9)
+
+    @_Jac.make_obj(on_entry=[], on_exit=[])
+    @__jac_dataclass__(eq=False)
+    class inner(_Jac.Obj):
+        i1: int = _Jac.has_instance_default(gen_func=lambda: 8)
+
+    def foo(self) -> None:
+        return 'foo'
+
+    class color(__jac_Enum__):
+        red = __jac_auto__()
+        green = __jac_auto__()
+        blue = __jac_auto__()
+print(outer.color.green.value)
\ No newline at end of file
@@ -0,0 +1,15 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class HasFault(_Jac.Obj):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/err.impl.jac')
+    def __init__(self) -> None:
+        print(5 / 0)
+
+def speak() -> None:
+    HasFault()
\ No newline at end of file
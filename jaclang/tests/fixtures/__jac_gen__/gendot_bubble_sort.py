@@ -0,0 +1,79 @@
+"""Bubble sort using DS Features of Jac (somparision and swapping happens in inner nodes)."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+list1 = [80, 79, 60, 59, 40, 35, 19, 1]
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class main_node(_Jac.Node):
+    no: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class inner_node(_Jac.Node):
+    main: int = _Jac.has_instance_default(gen_func=lambda: 0)
+    sub: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('create_main_node', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class walker1(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/gendot_bubble_sort.jac')
+    def create_main_node(self, _jac_here_: _Jac.RootType) -> None:
+        end = _jac_here_
+        i = 0
+        while i < len(list1) + 1:
+            _Jac.connect(left=end, right=(end := main_node(no=i + 1)), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+            if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+                pass
+            i += 1
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('skip_root', _Jac.RootType), _Jac.DSFunc('process', main_node)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class walker2(_Jac.Walker):
+
+    def skip_root(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/gendot_bubble_sort.jac')
+    def process(self, _jac_here_: main_node) -> None:
+        global list1
+        for j in range(0, len(list1) - _jac_here_.no):
+            _Jac.connect(left=_jac_here_, right=inner_node(main=_jac_here_.no, sub=j + 1), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('skiproot', _Jac.RootType), _Jac.DSFunc('adjust', main_node)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class walker3(_Jac.Walker):
+
+    def skiproot(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/gendot_bubble_sort.jac')
+    def adjust(self, _jac_here_: main_node) -> None:
+        _Jac.spawn_call(_jac_here_, walker4())
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('skipmain', main_node), _Jac.DSFunc('skipin', inner_node)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class walker4(_Jac.Walker):
+
+    def skipmain(self, _jac_here_: main_node) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    def skipin(self, _jac_here_: inner_node) -> None:
+        global list1
+        j = _jac_here_.sub - 1
+        if list1[j] > list1[j + 1]:
+            x = list1[j]
+            list1[j] = list1[j + 1]
+            list1[j + 1] = x
+_Jac.spawn_call(_Jac.get_root(), walker1())
+_Jac.spawn_call(_Jac.get_root(), walker2())
+_Jac.spawn_call(_Jac.get_root(), walker3())
+print(_Jac.get_root().__jac__.gen_dot())
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""A Number Guessing Game"""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    import random
+else:
+    random, = __jac_import__(target='random', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+guesses = [50, 25, 35, 30]
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('start_game', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class GuessGame(_Jac.Walker):
+    correct_number: int = _Jac.has_instance_default(gen_func=lambda: 30)
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/guess_game.jac')
+    def start_game(self, _jac_here_: _Jac.RootType) -> None:
+        end = _jac_here_
+        i = 0
+        while i < 10:
+            _Jac.connect(left=end, right=(end := turn()), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+            i += 1
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/guess_game.jac')
+    def process_guess(self, guess: int) -> None:
+        if guess > self.correct_number:
+            print('Too high!')
+        elif guess < self.correct_number:
+            print('Too low!')
+        else:
+            print('Congratulations! You guessed correctly.')
+            _Jac.disengage(self)
+            return
+
+@_Jac.make_node(on_entry=[_Jac.DSFunc('check', GuessGame)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class turn(_Jac.Node):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/guess_game.jac')
+    def check(self, _jac_here_: GuessGame) -> None:
+        guess = guesses.pop(0)
+        _jac_here_.process_guess(guess)
+        if _Jac.visit_node(_jac_here_, _Jac.edge_ref(self, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+_Jac.spawn_call(_Jac.get_root(), GuessGame())
\ No newline at end of file
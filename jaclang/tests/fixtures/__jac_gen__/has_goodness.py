@@ -0,0 +1,18 @@
+from __future__ import annotations
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyObj(_Jac.Obj):
+    mylist: list[int] = _Jac.has_instance_default(gen_func=lambda: [1, 2, 3])
+    mydict: dict[int, int] = _Jac.has_instance_default(gen_func=lambda: {'a': 2, 'b': 4})
+    mylist2: _jac_typ.ClassVar[list[int]] = [1, 2, 3]
+
+    def obj_print(self) -> None:
+        print('mylist: ', self.mylist)
+        print('mydict: ', self.mydict)
+myo = MyObj()
+myo.obj_print()
\ No newline at end of file
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class TYPE(_Jac.Obj):
+
+    def __init__(self) -> None:
+        DICT: dict = {}
+        DICT[self] = 1
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class TASK(TYPE, _Jac.Obj):
+
+    def __init__(self) -> None:
+        TYPE.__init__(self)
+TASK()
+print('Test Passed')
\ No newline at end of file
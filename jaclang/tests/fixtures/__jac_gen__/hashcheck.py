@@ -0,0 +1,17 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class SomeObj(_Jac.Obj):
+    a: int = _Jac.has_instance_default(gen_func=lambda: 5)
+ob = SomeObj()
+a = {ob: 'check'}
+print(a[ob])
+ob.a = 10
+ob.b = 20
+print(a[ob])
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""Hello World!"""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+
+def still_there() -> None:
+    print('im still here')
+print('Hello World!')
\ No newline at end of file
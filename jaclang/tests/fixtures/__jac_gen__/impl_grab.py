@@ -0,0 +1,14 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+if _jac_typ.TYPE_CHECKING:
+    import math
+else:
+    math, = __jac_import__(target='math', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/impl_grab.impl.jac')
+def test_grab() -> None:
+    return math.sqrt(2)
+print(test_grab())
\ No newline at end of file
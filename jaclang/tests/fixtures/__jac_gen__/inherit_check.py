@@ -0,0 +1,37 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class b(_Jac.Node):
+    pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('gb', b)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class ww(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/inherit_check.jac')
+    def gb(self, _jac_here_: b) -> None:
+        print('I am in b')
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('ggb', b)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class www(ww, _Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/inherit_check.jac')
+    def ggb(self, _jac_here_: b) -> None:
+        print('www is also in b')
+
+@_Jac.make_node(on_entry=[_Jac.DSFunc('go_to_b', ww | www)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Node):
+
+    def go_to_b(self, _jac_here_: ww | www) -> None:
+        print('I am trying to go to b')
+        if _Jac.visit_node(_jac_here_, (lambda x: [i for i in x if isinstance(i, b)])(_Jac.edge_ref(self, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None))):
+            pass
+nb = b()
+_Jac.spawn_call(nb, ww())
+_Jac.spawn_call(nb, www())
\ No newline at end of file
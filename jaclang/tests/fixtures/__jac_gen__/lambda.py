@@ -0,0 +1,5 @@
+from __future__ import annotations
+x = lambda a: int, b: int: b + a
+print(x(5, 4))
+y = lambda: 567
+print(y())
\ No newline at end of file
@@ -0,0 +1,7 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    from math import sqrt
+else:
+    sqrt, = __jac_import__(target='math', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'sqrt': None})
\ No newline at end of file
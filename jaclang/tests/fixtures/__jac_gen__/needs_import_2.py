@@ -0,0 +1,9 @@
+"""Test of jac importing python."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import pyfunc_2
+else:
+    pyfunc_2, = __jac_import__(target='pyfunc_2', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+print('pyfunc_2 imported')
\ No newline at end of file
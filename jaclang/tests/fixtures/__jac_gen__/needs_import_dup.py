@@ -0,0 +1,31 @@
+"""Test of jac importing python."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import os
+else:
+    os, = __jac_import__(target='os', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+if _jac_typ.TYPE_CHECKING:
+    import pyfunc
+else:
+    pyfunc, = __jac_import__(target='pyfunc', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+if _jac_typ.TYPE_CHECKING:
+    import random
+else:
+    random, = __jac_import__(target='random', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+if _jac_typ.TYPE_CHECKING:
+    from pyfunc import my_print
+else:
+    my_print, = __jac_import__(target='pyfunc', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'my_print': None})
+my_print(pyfunc)
+print(random.random())
+if _jac_typ.TYPE_CHECKING:
+    import circle_pysolo
+else:
+    circle_pysolo, = __jac_import__(target='circle_pysolo', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+if _jac_typ.TYPE_CHECKING:
+    from circle_pysolo import calculate_area
+else:
+    calculate_area, = __jac_import__(target='circle_pysolo', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'calculate_area': None})
+print(f'are {calculate_area(2.0)}')
\ No newline at end of file
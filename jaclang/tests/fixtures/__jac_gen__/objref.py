@@ -0,0 +1,15 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyNode(_Jac.Node):
+    value: int = _Jac.has_instance_default(gen_func=lambda: 0)
+_Jac.connect(left=_Jac.get_root(), right=(x := MyNode()), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+obj_id = jid(x)
+myobj = _Jac.get_object(id=obj_id)
+print(obj_id)
+print(myobj)
+print('valid:', myobj == x)
\ No newline at end of file
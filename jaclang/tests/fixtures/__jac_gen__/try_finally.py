@@ -0,0 +1,13 @@
+from __future__ import annotations
+try:
+    print('try block')
+finally:
+    print('finally block')
+try:
+    print('try block')
+except exception:
+    print('except block')
+else:
+    print('else block')
+finally:
+    print('finally block')
\ No newline at end of file
@@ -0,0 +1,4 @@
+from __future__ import annotations
+x, *y = [1, 2, 3, 4]
+print(x)
+print(y)
\ No newline at end of file
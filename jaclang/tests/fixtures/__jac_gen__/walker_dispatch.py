@@ -0,0 +1,42 @@
+"""Walker abilities dispatched from the table cached on the walker."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[_Jac.DSFunc('greet', None)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Node):
+
+    def greet(self, _jac_here_) -> None:
+        print('a greets')
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class b(_Jac.Node):
+    val: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('start', _Jac.RootType), _Jac.DSFunc('on_a_or_b', a | b)], on_exit=[_Jac.DSFunc('leave', b)])
+@__jac_dataclass__(eq=False)
+class visitor(_Jac.Walker):
+
+    def start(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    def on_a_or_b(self, _jac_here_: a | b) -> None:
+        print('visit', _jac_here_.__class__.__name__)
+        _Jac.ignore(self, (lambda x: [i for i in x if i.val == 2])((lambda x: [i for i in x if isinstance(i, b)])(_Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None))))
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False, edge_type=None)):
+            pass
+
+    def leave(self, _jac_here_: b) -> None:
+        print('leave b')
+x = a()
+y = b()
+_Jac.connect(left=_Jac.get_root(), right=x, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.connect(left=x, right=y, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.connect(left=x, right=b(val=2), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.connect(left=y, right=a(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.spawn_call(_Jac.get_root(), visitor())
+print(len(visitor._jac_abilities_[1]))
\ No newline at end of file
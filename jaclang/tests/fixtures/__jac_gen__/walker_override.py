@@ -0,0 +1,28 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+import typing as _jac_typ
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('foo', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Walker):
+
+    def foo(self, _jac_here_: _Jac.RootType) -> None:
+        print('foo')
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('bar', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class b(a, _Jac.Walker):
+
+    def bar(self, _jac_here_: _Jac.RootType) -> None:
+        print('bar')
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('foo', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class c(b, _Jac.Walker):
+
+    @_jac_typ.override
+    def foo(self, _jac_here_: _Jac.RootType) -> None:
+        print('baz')
+_Jac.spawn_call(_Jac.get_root(), c())
\ No newline at end of file
@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+def code() -> str:
+    return 'Hello World!'
\ No newline at end of file